@@ -12,20 +12,35 @@ Configuration (config.toml):
 
 import logging
 import json
+import random
+import time
+import threading
+import datetime
+import concurrent.futures
 import pwnagotchi
 from pwnagotchi.plugins import Plugin
 
 try:
-    import urllib.request
-    import urllib.error
+    import urllib3
 
-    URLLIB_AVAILABLE = True
+    # One keep-alive pool for the plugin's lifetime: repeat notifications reuse
+    # the TCP/TLS connection to discord.com instead of re-handshaking each time.
+    _POOL = urllib3.PoolManager(maxsize=2, retries=False)
+    URLLIB3_AVAILABLE = True
 except ImportError:
-    URLLIB_AVAILABLE = False
+    _POOL = None
+    URLLIB3_AVAILABLE = False
     logging.warning(
-        "[bt-tether-discord] urllib not available, Discord notifications disabled"
+        "[bt-tether-discord] urllib3 not available, Discord notifications disabled"
     )
 
+# Static request headers and embed footer, shared by every notification
+_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "Pwnagotchi-BT-Tether/1.0",
+}
+_FOOTER = {"text": "pwnagotchi \u00b7 bt-tether-discord"}
+
 
 class BTTetherDiscord(Plugin):
     __author__ = "wsvdmeer"
@@ -33,9 +48,56 @@ class BTTetherDiscord(Plugin):
     __license__ = "GPL3"
     __description__ = "Sends Discord notifications when bt-tether connects"
 
+    # Webhook delivery: transient failures (network errors, 429, 5xx) are
+    # retried with capped exponential backoff and full jitter, so a brief
+    # network blip doesn't drop the notification and several pwnagotchis
+    # sharing a webhook don't retry in lockstep.
+    WEBHOOK_TIMEOUT = 10
+    WEBHOOK_MAX_ATTEMPTS = 3
+    WEBHOOK_BACKOFF_BASE = 1.0
+    WEBHOOK_BACKOFF_CAP = 30.0
+
+    # Embeds queued within this many seconds are sent together in one POST
+    # (Discord accepts up to 10 embeds per webhook message), so a flapping
+    # connection doesn't burn one request - and one rate-limit slot - per event.
+    WEBHOOK_FLUSH_DELAY = 3
+    WEBHOOK_MAX_EMBEDS = 10
+
+    # Identical connect events (same ip + device) within this window are
+    # dropped - a reconnect loop would otherwise post the same embed repeatedly.
+    DUPLICATE_EVENT_TTL = 60
+
     def on_loaded(self):
         self.discord_webhook_url = self.options.get("discord_webhook_url", "")
 
+        # The hostname and the fixed parts of the embed never change at
+        # runtime; build them once so each event only fills in ip/device.
+        self._name = pwnagotchi.name()
+        self._connected_embed = {
+            "title": "🔷 Bluetooth Tethering Connected",
+            "description": f"**{self._name}** is now connected via Bluetooth",
+            "color": 3447003,  # Blue
+            "footer": _FOOTER,
+        }
+
+        # Webhook POSTs run here so event handlers return immediately instead
+        # of blocking the agent loop for up to the HTTP timeout.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="bt-discord"
+        )
+
+        # Discord rate-limit bucket state from the last webhook response
+        self._rl_remaining = None
+        self._rl_reset_at = 0.0
+
+        # Embeds waiting for the next batched flush
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+
+        # (ip, device) -> monotonic time of the last notification
+        self._recent = {}
+
         if self.discord_webhook_url:
             logging.info("[bt-tether-discord] Loaded with Discord webhook configured")
         else:
@@ -43,73 +105,205 @@ class BTTetherDiscord(Plugin):
                 "[bt-tether-discord] Loaded but no discord_webhook_url configured"
             )
 
+    def on_unload(self, ui):
+        with self._pending_lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        executor = getattr(self, "_executor", None)
+        if executor:
+            executor.shutdown(wait=False)
+        # Close the idle keep-alive sockets held by the shared pool
+        if _POOL is not None:
+            _POOL.clear()
+
     def on_bt_tether_connected(self, agent, event_data):
         ip = event_data.get("ip", "unknown")
         device = event_data.get("device", "unknown")
-        pwnagotchi_name = pwnagotchi.name()
 
-        logging.info(
-            f"[bt-tether-discord] Connected: {pwnagotchi_name} - {ip} via {device}"
-        )
+        logging.info(f"[bt-tether-discord] Connected: {self._name} - {ip} via {device}")
+
+        now = time.monotonic()
+        self._recent = {
+            k: t for k, t in self._recent.items() if now - t < self.DUPLICATE_EVENT_TTL
+        }
+        key = (ip, device)
+        if key in self._recent:
+            logging.info(
+                "[bt-tether-discord] Duplicate connect event, skipping notification"
+            )
+            return
+        self._recent[key] = now
+
         self._notify(
-            title="🔷 Bluetooth Tethering Connected",
-            description=f"**{pwnagotchi_name}** is now connected via Bluetooth",
-            color=3447003,  # Blue
-            fields=[
-                {"name": "Pwnagotchi", "value": pwnagotchi_name, "inline": True},
-                {"name": "Device", "value": device, "inline": True},
-                {"name": "IP Address", "value": f"`{ip}`", "inline": True},
-                {
-                    "name": "Web Interface",
-                    "value": f"http://{ip}:8080/",
-                    "inline": False,
-                },
-            ],
+            {
+                **self._connected_embed,
+                "fields": [
+                    {"name": "Pwnagotchi", "value": self._name, "inline": True},
+                    {"name": "Device", "value": device, "inline": True},
+                    {"name": "IP Address", "value": f"`{ip}`", "inline": True},
+                    {
+                        "name": "Web Interface",
+                        "value": f"http://{ip}:8080/",
+                        "inline": False,
+                    },
+                ],
+            }
         )
 
-    def _notify(self, title, description, color=3447003, fields=None):
-        """Send a Discord embed via webhook"""
-        if not URLLIB_AVAILABLE or not self.discord_webhook_url:
+    def _notify(self, embed):
+        """Timestamp an embed and queue it for the next batched webhook POST"""
+        if not URLLIB3_AVAILABLE or not self.discord_webhook_url:
             return
 
-        import time
+        # Real millisecond precision (the old strftime pattern hard-coded .000)
+        embed["timestamp"] = datetime.datetime.now(datetime.timezone.utc).isoformat(
+            timespec="milliseconds"
+        )
 
-        embed = {
-            "title": title,
-            "description": description,
-            "color": color,
-            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
-            "footer": {"text": "pwnagotchi \u00b7 bt-tether-discord"},
-        }
-        if fields:
-            embed["fields"] = fields
+        with self._pending_lock:
+            self._pending.append(embed)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.WEBHOOK_FLUSH_DELAY, self._flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
-        payload = json.dumps({"embeds": [embed]}).encode("utf-8")
+    def _flush(self):
+        """Hand up to WEBHOOK_MAX_EMBEDS queued embeds to the executor"""
+        with self._pending_lock:
+            batch = self._pending[: self.WEBHOOK_MAX_EMBEDS]
+            del self._pending[: self.WEBHOOK_MAX_EMBEDS]
+            self._flush_timer = None
+            if self._pending:
+                # More than one message worth queued - send the rest next round
+                self._flush_timer = threading.Timer(
+                    self.WEBHOOK_FLUSH_DELAY, self._flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
+        if not batch:
+            return
         try:
-            req = urllib.request.Request(
-                self.discord_webhook_url,
-                data=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "User-Agent": "Pwnagotchi-BT-Tether/1.0",
-                },
+            self._executor.submit(self._do_notify, batch)
+        except RuntimeError:
+            # Executor already shut down (plugin unloading)
+            logging.debug(
+                "[bt-tether-discord] Executor shut down, dropping notification"
             )
-            with urllib.request.urlopen(req, timeout=10) as resp:
+
+    def _do_notify(self, embeds):
+        """Send a batch of Discord embeds via webhook"""
+        # Compact separators and raw UTF-8 (instead of \uXXXX escapes for the
+        # emoji/middle dot) keep the request body small
+        payload = json.dumps(
+            {"embeds": embeds}, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+        for attempt in range(self.WEBHOOK_MAX_ATTEMPTS):
+            self._wait_for_rate_limit()
+            retry_after = None
+            try:
+                resp = _POOL.request(
+                    "POST",
+                    self.discord_webhook_url,
+                    body=payload,
+                    headers=_HEADERS,
+                    timeout=self.WEBHOOK_TIMEOUT,
+                )
+            except (urllib3.exceptions.HTTPError, OSError) as e:
+                logging.warning(
+                    f"[bt-tether-discord] Webhook network error "
+                    f"(attempt {attempt + 1}/{self.WEBHOOK_MAX_ATTEMPTS}): {e}"
+                )
+            except Exception as e:
+                logging.error(f"[bt-tether-discord] Webhook error: {e}")
+                return
+            else:
+                self._update_rate_limit(resp)
                 if resp.status == 204:
                     logging.info(
                         "[bt-tether-discord] ✓ Discord notification sent successfully"
                     )
-                else:
+                    return
+                error_body = resp.data.decode("utf-8", errors="replace")
+                if resp.status < 400:
                     logging.warning(
                         f"[bt-tether-discord] Webhook returned status {resp.status}"
                     )
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8") if e.fp else ""
-            logging.error(
-                f"[bt-tether-discord] Webhook HTTP error {e.code}: {e.reason} {error_body}"
+                    return
+                if resp.status != 429 and resp.status < 500:
+                    # Other 4xx (bad URL, deleted webhook, bad payload) won't
+                    # succeed on retry
+                    logging.error(
+                        f"[bt-tether-discord] Webhook HTTP error {resp.status}: {resp.reason} {error_body}"
+                    )
+                    return
+                logging.warning(
+                    f"[bt-tether-discord] Webhook HTTP error {resp.status} "
+                    f"(attempt {attempt + 1}/{self.WEBHOOK_MAX_ATTEMPTS}): {error_body}"
+                )
+                if resp.status == 429:
+                    retry_after = self._parse_429_retry_after(resp)
+                elif resp.status == 503:
+                    retry_after = self._parse_retry_after(resp)
+
+            if attempt + 1 >= self.WEBHOOK_MAX_ATTEMPTS:
+                break
+
+            if retry_after is not None:
+                delay = min(self.WEBHOOK_BACKOFF_CAP, retry_after)
+            else:
+                delay = random.uniform(
+                    0,
+                    min(
+                        self.WEBHOOK_BACKOFF_CAP,
+                        self.WEBHOOK_BACKOFF_BASE * (2**attempt),
+                    ),
+                )
+            time.sleep(delay)
+
+        logging.error(
+            f"[bt-tether-discord] Giving up on Discord notification after "
+            f"{self.WEBHOOK_MAX_ATTEMPTS} attempts"
+        )
+
+    def _wait_for_rate_limit(self):
+        """Sleep until the bucket resets if the last response exhausted it"""
+        if self._rl_remaining != 0:
+            return
+        wait = self._rl_reset_at - time.monotonic()
+        if wait > 0:
+            wait = min(wait, self.WEBHOOK_BACKOFF_CAP)
+            logging.info(
+                f"[bt-tether-discord] Rate limit exhausted, waiting {wait:.1f}s"
             )
-        except urllib.error.URLError as e:
-            logging.error(f"[bt-tether-discord] Webhook network error: {e.reason}")
-        except Exception as e:
-            logging.error(f"[bt-tether-discord] Webhook error: {e}")
+            time.sleep(wait)
+
+    def _update_rate_limit(self, resp):
+        """Record X-RateLimit-Remaining / X-RateLimit-Reset-After from a response"""
+        try:
+            remaining = resp.headers.get("X-RateLimit-Remaining")
+            reset_after = resp.headers.get("X-RateLimit-Reset-After")
+            if remaining is not None:
+                self._rl_remaining = int(remaining)
+            if reset_after is not None:
+                self._rl_reset_at = time.monotonic() + float(reset_after)
+        except (TypeError, ValueError):
+            pass
+
+    def _parse_429_retry_after(self, resp):
+        """Return retry_after from a Discord 429 JSON body, else the header"""
+        try:
+            return max(0.0, float(json.loads(resp.data)["retry_after"]))
+        except (ValueError, KeyError, TypeError):
+            return self._parse_retry_after(resp)
+
+    def _parse_retry_after(self, resp):
+        """Return the Retry-After header in seconds, or None if absent/invalid"""
+        try:
+            return max(0.0, float(resp.headers.get("Retry-After")))
+        except (TypeError, ValueError):
+            return None
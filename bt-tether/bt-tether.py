@@ -41,9 +41,22 @@ import os
 import re
 import traceback
 import json
-import datetime
+import concurrent.futures
+import queue
+import fcntl
+import select
+import signal
+import socket
+import struct
+import tempfile
+import shutil
+import gzip
+import hashlib
+import contextlib
+import calendar
+from types import MappingProxyType
 from pwnagotchi.plugins import Plugin
-from flask import render_template_string, request, jsonify
+from flask import Response, current_app, jsonify
 import pwnagotchi.ui.fonts as fonts
 from pwnagotchi.ui.components import LabeledValue
 from pwnagotchi.ui.view import BLACK
@@ -59,6 +72,14 @@ except ImportError:
     DBUS_AVAILABLE = False
     logging.warning("[bt-tether] dbus/GLib not available, BLE advertising disabled")
 
+try:
+    from dbus.mainloop.glib import DBusGMainLoop
+    from gi.repository import GLib
+
+    DBUS_SIGNALS_AVAILABLE = DBUS_AVAILABLE
+except ImportError:
+    DBUS_SIGNALS_AVAILABLE = False
+
 
 HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
@@ -66,48 +87,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
     <title>Bluetooth Tether</title>
     <meta name="viewport" content="width=device-width, initial-scale=1" />
     <link rel="icon" type="image/svg+xml" href="data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'%3E%3Cpath fill='%2358a6ff' d='M50 10 L70 25 L70 45 L50 60 L50 90 L30 75 L30 55 L50 40 L50 10 M50 40 L50 60'/%3E%3C/svg%3E" />
-    <style>
-      body { font-family: sans-serif; padding: 20px; max-width: 600px; margin: 0 auto; background: #0d1117; color: #d4d4d4; }
-      .card { background: #161b22; padding: 20px; border-radius: 8px; margin-bottom: 16px; box-shadow: 0 2px 4px rgba(0,0,0,0.3); border: 1px solid #30363d; }
-      h2 { margin: 0 0 20px 0; color: #58a6ff; }
-      h3 { color: #d4d4d4; }
-      h4 { color: #8b949e; }
-      input { padding: 10px; font-size: 14px; border: 1px solid #30363d; border-radius: 4px; text-transform: uppercase; background: #0d1117; color: #d4d4d4; }
-      input:focus { outline: none; border-color: #58a6ff; background: #161b22; }
-      button { padding: 10px 20px; background: transparent; color: #3fb950; border: 1px solid #3fb950; cursor: pointer; font-size: 14px; border-radius: 4px; margin-right: 8px; min-height: 42px; display: inline-flex; align-items: center; justify-content: center; }
-      button:hover { background: rgba(63, 185, 80, 0.1); border-color: #3fb950; }
-      button.danger { color: #f85149; border-color: #f85149; background: transparent; }
-      button.danger:hover { background: rgba(248, 81, 73, 0.1); border-color: #f85149; }
-      button.success { color: #3fb950; border-color: #3fb950; background: transparent; }
-      button.success:hover { background: rgba(63, 185, 80, 0.1); border-color: #3fb950; }
-      button:disabled { background: transparent; color: #8b949e; cursor: not-allowed; border-color: #30363d; }
-      .status-item { padding: 8px; margin: 4px 0; border-radius: 4px; background: #161b22; border: 1px solid #30363d; color: #d4d4d4; }
-      .status-good { background: rgba(46, 160, 67, 0.15); color: #3fb950; border-color: #3fb950; }
-      .status-bad { background: rgba(248, 81, 73, 0.15); color: #f85149; border-color: #f85149; }
-      .device-item { padding: 12px; margin: 8px 0; border: 1px solid #30363d; border-radius: 4px; cursor: pointer; display: flex; justify-content: space-between; align-items: center; background: #0d1117; color: #d4d4d4; }
-      .device-item:hover { background: #161b22; border-color: #58a6ff; }
-      .message-box { padding: 12px; border-radius: 4px; margin: 12px 0; border-left: 4px solid; }
-      .message-info { background: rgba(88, 166, 255, 0.1); color: #79c0ff; border-color: #79c0ff; }
-      .message-success { background: rgba(63, 185, 80, 0.1); color: #3fb950; border-color: #3fb950; }
-      .message-warning { background: rgba(214, 159, 0, 0.1); color: #d29922; border-color: #d29922; }
-      .message-error { background: rgba(248, 81, 73, 0.1); color: #f85149; border-color: #f85149; }
-      .spinner { display: inline-block; width: 14px; height: 14px; border: 2px solid #30363d; 
-                 border-top: 2px solid #58a6ff; border-radius: 50%; animation: spin 1s linear infinite; margin-right: 8px; vertical-align: middle; }
-      @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
-      .mac-editor { display: flex; gap: 8px; align-items: center; flex-wrap: wrap; }
-      .mac-editor input { flex: 1; min-width: 200px; }
-      .mac-editor button { white-space: nowrap; }
-      .header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px; }
-      .header h2 { margin: 0; flex: 1; }
-      .header button { margin-left: 12px; }
-      button.outline { color: #ffffff; border-color: #ffffff; }
-      button.outline:hover { background: rgba(255, 255, 255, 0.1); border-color: #ffffff; }
-      @media (max-width: 600px) {
-        .mac-editor { flex-direction: column; align-items: stretch; }
-        .mac-editor input { width: 100%; }
-        .mac-editor button { width: 100%; margin: 0 !important; }
-      }
-    </style>
+    <link rel="stylesheet" href="/plugins/bt-tether/static/{{ css_name }}" />
   </head>
   <body>
     <div class="header">
@@ -139,16 +119,18 @@ HTML_TEMPLATE = """<!DOCTYPE html>
       <!-- Status in output style -->
       <div style="background: #0d1117; color: #d4d4d4; padding: 12px; border-radius: 4px; margin-bottom: 12px; font-family: 'Courier New', monospace; font-size: 12px; line-height: 1.5;">
         <div style="color: #888; margin-bottom: 8px;">Connection Status:</div>
-        <div id="statusActiveConnection" style="display: none; margin: 4px 0; padding: 8px; background: rgba(78, 201, 176, 0.1); border-left: 3px solid #4ec9b0; margin-bottom: 8px;"></div>
+        <div id="statusActiveConnection" style="display: none; margin: 4px 0; padding: 8px; background: rgba(78, 201, 176, 0.1); border-left: 3px solid #4ec9b0; margin-bottom: 8px;"><span class="conn-emoji"></span> <span class="conn-type" style="color: #4ec9b0; font-weight: bold;"></span> <span class="conn-iface" style="color: #888;"></span><div class="conn-details" style="color: #ce9178; margin-top: 4px; font-size: 11px;" hidden></div></div>
         <div id="statusPaired" style="margin: 4px 0;">📱 Paired: <span>Checking...</span></div>
         <div id="statusTrusted" style="margin: 4px 0;">🔐 Trusted: <span>Checking...</span></div>
         <div id="statusConnected" style="margin: 4px 0;">🔵 Connected: <span>Checking...</span></div>
-        <div id="statusInternet" style="margin: 4px 0;">🌐 Internet: <span>Checking...</span></div>
-        <div id="statusIP" style="display: none; margin: 4px 0;">🔢 IP Address: <span></span></div>
+        <div id="statusInternet" style="margin: 4px 0;">🌐 Internet: <span>Checking...</span> <span class="iface" style="color: #888;"></span></div>
+        <div id="statusIP" style="display: none; margin: 4px 0;">🔢 IP Address: <span style="color: #4ec9b0;"></span></div>
       </div>
       
-      <!-- Hidden input for JavaScript to access MAC value -->
-      <input type="hidden" id="macInput" value="{{ mac }}" />
+      <!-- Hidden input for JavaScript to access MAC value. Left empty in the
+           (static, cacheable) page; the first status poll fills in the
+           plugin's current MAC. -->
+      <input type="hidden" id="macInput" value="" />
       
       <!-- Output Section (shown above connect button) -->
       <div style="margin-bottom: 12px;">
@@ -162,26 +144,10 @@ HTML_TEMPLATE = """<!DOCTYPE html>
           </div>
         </div>
         <div id="logViewer">
-          <div style="background: #0d1117; color: #d4d4d4; padding: 12px; padding-right: 16px; border-radius: 4px; font-family: 'Courier New', monospace; font-size: 12px; max-height: 300px; overflow-y: auto; line-height: 1.5;" id="logContent">
+          <div style="background: #0d1117; color: #d4d4d4; padding: 12px; padding-right: 16px; border-radius: 4px; font-family: 'Courier New', monospace; font-size: 12px; max-height: 300px; overflow-y: auto; line-height: 1.5;" id="logContent" data-maxlen="{{ log_maxlen }}">
             <div style="color: #888;">Fetching logs...</div>
           </div>
         </div>
-        <style>
-          #logContent::-webkit-scrollbar {
-            width: 5px;
-          }
-          #logContent::-webkit-scrollbar-track {
-            background: #0d1117;
-            border-radius: 4px;
-          }
-          #logContent::-webkit-scrollbar-thumb {
-            background: #30363d;
-            border-radius: 4px;
-          }
-          #logContent::-webkit-scrollbar-thumb:hover {
-            background: #484f58;
-          }
-        </style>
       </div>
       
       <!-- Connect/Disconnect Actions -->
@@ -234,35 +200,133 @@ HTML_TEMPLATE = """<!DOCTYPE html>
       </div>
     </div>
     
-    <script>
+    <script src="/plugins/bt-tether/static/{{ js_name }}" defer></script>
+  </body>
+</html>
+"""
+
+
+# Stylesheet and script for the web UI. Served from /plugins/bt-tether/static/
+# under content-hashed names so browsers can cache them indefinitely and only
+# the small HTML page is fetched on each visit.
+STATIC_CSS = """
+      body { font-family: sans-serif; padding: 20px; max-width: 600px; margin: 0 auto; background: #0d1117; color: #d4d4d4; }
+      .card { background: #161b22; padding: 20px; border-radius: 8px; margin-bottom: 16px; box-shadow: 0 2px 4px rgba(0,0,0,0.3); border: 1px solid #30363d; }
+      h2 { margin: 0 0 20px 0; color: #58a6ff; }
+      h3 { color: #d4d4d4; }
+      h4 { color: #8b949e; }
+      input { padding: 10px; font-size: 14px; border: 1px solid #30363d; border-radius: 4px; text-transform: uppercase; background: #0d1117; color: #d4d4d4; }
+      input:focus { outline: none; border-color: #58a6ff; background: #161b22; }
+      button { padding: 10px 20px; background: transparent; color: #3fb950; border: 1px solid #3fb950; cursor: pointer; font-size: 14px; border-radius: 4px; margin-right: 8px; min-height: 42px; display: inline-flex; align-items: center; justify-content: center; }
+      button:hover { background: rgba(63, 185, 80, 0.1); border-color: #3fb950; }
+      button.danger { color: #f85149; border-color: #f85149; background: transparent; }
+      button.danger:hover { background: rgba(248, 81, 73, 0.1); border-color: #f85149; }
+      button.success { color: #3fb950; border-color: #3fb950; background: transparent; }
+      button.success:hover { background: rgba(63, 185, 80, 0.1); border-color: #3fb950; }
+      button:disabled { background: transparent; color: #8b949e; cursor: not-allowed; border-color: #30363d; }
+      .status-item { padding: 8px; margin: 4px 0; border-radius: 4px; background: #161b22; border: 1px solid #30363d; color: #d4d4d4; }
+      .status-good { background: rgba(46, 160, 67, 0.15); color: #3fb950; border-color: #3fb950; }
+      .status-bad { background: rgba(248, 81, 73, 0.15); color: #f85149; border-color: #f85149; }
+      .device-item { padding: 12px; margin: 8px 0; border: 1px solid #30363d; border-radius: 4px; cursor: pointer; display: flex; justify-content: space-between; align-items: center; background: #0d1117; color: #d4d4d4; }
+      .device-item:hover { background: #161b22; border-color: #58a6ff; }
+      .message-box { padding: 12px; border-radius: 4px; margin: 12px 0; border-left: 4px solid; }
+      .message-info { background: rgba(88, 166, 255, 0.1); color: #79c0ff; border-color: #79c0ff; }
+      .message-success { background: rgba(63, 185, 80, 0.1); color: #3fb950; border-color: #3fb950; }
+      .message-warning { background: rgba(214, 159, 0, 0.1); color: #d29922; border-color: #d29922; }
+      .message-error { background: rgba(248, 81, 73, 0.1); color: #f85149; border-color: #f85149; }
+      .spinner { display: inline-block; width: 14px; height: 14px; border: 2px solid #30363d; 
+                 border-top: 2px solid #58a6ff; border-radius: 50%; animation: spin 1s linear infinite; margin-right: 8px; vertical-align: middle; }
+      @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
+      .mac-editor { display: flex; gap: 8px; align-items: center; flex-wrap: wrap; }
+      .mac-editor input { flex: 1; min-width: 200px; }
+      .mac-editor button { white-space: nowrap; }
+      .header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px; }
+      .header h2 { margin: 0; flex: 1; }
+      .header button { margin-left: 12px; }
+      button.outline { color: #ffffff; border-color: #ffffff; }
+      button.outline:hover { background: rgba(255, 255, 255, 0.1); border-color: #ffffff; }
+      @media (max-width: 600px) {
+        .mac-editor { flex-direction: column; align-items: stretch; }
+        .mac-editor input { width: 100%; }
+        .mac-editor button { width: 100%; margin: 0 !important; }
+      }
+      #logContent::-webkit-scrollbar {
+        width: 5px;
+      }
+      #logContent::-webkit-scrollbar-track {
+        background: #0d1117;
+        border-radius: 4px;
+      }
+      #logContent::-webkit-scrollbar-thumb {
+        background: #30363d;
+        border-radius: 4px;
+      }
+      #logContent::-webkit-scrollbar-thumb:hover {
+        background: #484f58;
+      }
+"""
+
+STATIC_JS = """
       const macInput = document.getElementById("macInput");
-      let statusInterval = null;
-      let logInterval = null;
+      // Client-side cap on rendered log rows, matching the server's log buffer
+      const LOG_MAXLEN = parseInt(document.getElementById("logContent").dataset.maxlen, 10) || 100;
+      let statusTimer = null;
+      let statusGen = 0;
+      let statusDelay = 2000;
+      let logTimer = null;
+      let logGen = 0;
+      let logPolling = false;
+      let eventSource = null;
+      let eventRefreshTimer = null;
+      let lastLogId = 0;
+      let lastStatusSig = null;
+      const MAC_RE = /^([0-9A-F]{2}:){5}[0-9A-F]{2}$/i;
+
+      function isMac(value) {
+        return MAC_RE.test(value);
+      }
+      let lastStatusChange = Date.now();
+
+      // Wrap a polling callback so each tick waits for the browser to be idle
+      // (at most 2s), keeping polls from competing with rendering/input.
+      function idleTick(fn) {
+        if (!window.requestIdleCallback) return fn;
+        return () => requestIdleCallback(() => fn(), { timeout: 2000 });
+      }
 
       // Load trusted devices on page load
       loadTrustedDevicesSummary();
       
       // Show initializing state first
       setInitializingStatus();
-      // Then check actual connection status
-      setTimeout(checkConnectionStatus, 1000);
+      // Then check actual connection status, and keep polling from there
+      startStatusPolling(1000);
       
-      // Start log polling immediately
+      // Start log polling immediately; the event stream takes over once open
       refreshLogs();
       startLogPolling();
+      startEventStream();
+
+      // Update a status row in place: only its value span's text/colour change,
+      // so polling never re-parses HTML or rebuilds the rows.
+      function setStatusRow(id, text, color) {
+        const span = document.getElementById(id).firstElementChild;
+        if (span.textContent !== text) span.textContent = text;
+        span.style.color = color;
+      }
+
+      function setInternetInterface(iface) {
+        const text = iface ? `(${iface})` : '';
+        const span = document.querySelector('#statusInternet .iface');
+        if (span.textContent !== text) span.textContent = text;
+      }
 
       function setInitializingStatus() {
-        document.getElementById("statusPaired").innerHTML = 
-          `📱 Paired: <span style="color: #8b949e;">🔄 Initializing...</span>`;
-        
-        document.getElementById("statusTrusted").innerHTML = 
-          `🔐 Trusted: <span style="color: #8b949e;">🔄 Initializing...</span>`;
-        
-        document.getElementById("statusConnected").innerHTML = 
-          `🔵 Connected: <span style="color: #8b949e;">🔄 Initializing...</span>`;
-        
-        document.getElementById("statusInternet").innerHTML = 
-          `🌐 Internet: <span style="color: #8b949e;">🔄 Initializing...</span>`;
+        setStatusRow("statusPaired", '🔄 Initializing...', '#8b949e');
+        setStatusRow("statusTrusted", '🔄 Initializing...', '#8b949e');
+        setStatusRow("statusConnected", '🔄 Initializing...', '#8b949e');
+        setStatusRow("statusInternet", '🔄 Initializing...', '#8b949e');
+        setInternetInterface(null);
         
         document.getElementById('statusIP').style.display = 'none';
         document.getElementById('statusActiveConnection').style.display = 'none';
@@ -274,65 +338,42 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
       async function checkConnectionStatus() {
         const mac = macInput.value.trim();
-        if (!/^([0-9A-F]{2}:){5}[0-9A-F]{2}$/i.test(mac)) {
-          // No valid MAC in input - try to get from backend status
-          try {
-            const statusResponse = await fetch(`/plugins/bt-tether/status`);
-            const statusData = await statusResponse.json();
-            
-            // If backend has a current MAC, use it
-            if (statusData.mac && /^([0-9A-F]{2}:){5}[0-9A-F]{2}$/i.test(statusData.mac)) {
-              // We have a MAC from backend, check its status
-              const response = await fetch(`/plugins/bt-tether/connection-status?mac=${encodeURIComponent(statusData.mac)}`);
-              const data = await response.json();
-              
-              // Update UI with backend MAC
-              macInput.value = statusData.mac;
-              updateStatusDisplay(statusData, data);
+        try {
+          // Plugin state and device/link state in a single request
+          const response = await fetch(`/plugins/bt-tether/full-status?mac=${encodeURIComponent(mac)}`);
+          const data = await response.json();
+
+          if (!isMac(mac)) {
+            // No valid MAC in input - the backend checked its current MAC, if any
+            if (data.mac && isMac(data.mac)) {
+              macInput.value = data.mac;
+              updateStatusDisplay(data, data);
               return;
             }
-          } catch (err) {
-            console.error('Failed to get backend status:', err);
+          } else {
+            updateStatusDisplay(data, data);
+            return;
           }
-          
-          // No valid MAC - hide connect button and show disconnected state
-          const connectBtn = document.getElementById('quickConnectBtn');
-          const disconnectSection = document.getElementById('disconnectSection');
-          connectBtn.style.display = 'none';
-          disconnectSection.style.display = 'none';
-          
-          // Update status to show disconnected/no device state
-          document.getElementById("statusPaired").innerHTML = 
-            `📱 Paired: <span style="color: #f48771;">✗ No</span>`;
-          
-          document.getElementById("statusTrusted").innerHTML = 
-            `🔐 Trusted: <span style="color: #f48771;">✗ No</span>`;
-          
-          document.getElementById("statusConnected").innerHTML = 
-            `🔵 Connected: <span style="color: #f48771;">✗ No</span>`;
-          
-          document.getElementById("statusInternet").innerHTML = 
-            `🌐 Internet: <span style="color: #f48771;">✗ Not Active</span>`;
-          
-          document.getElementById('statusIP').style.display = 'none';
-          document.getElementById('statusActiveConnection').style.display = 'none';
-          
-          return;
-        }
-        
-        try {
-          // First check the plugin's internal status
-          const statusResponse = await fetch(`/plugins/bt-tether/status`);
-          const statusData = await statusResponse.json();
-          
-          const response = await fetch(`/plugins/bt-tether/connection-status?mac=${encodeURIComponent(mac)}`);
-          const data = await response.json();
-          
-          updateStatusDisplay(statusData, data);
-          
         } catch (error) {
           console.error('Status check failed:', error);
+          if (isMac(mac)) return;
         }
+
+        // No valid MAC - hide connect button and show disconnected state
+        const connectBtn = document.getElementById('quickConnectBtn');
+        const disconnectSection = document.getElementById('disconnectSection');
+        connectBtn.style.display = 'none';
+        disconnectSection.style.display = 'none';
+
+        // Update status to show disconnected/no device state
+        setStatusRow("statusPaired", '✗ No', '#f48771');
+        setStatusRow("statusTrusted", '✗ No', '#f48771');
+        setStatusRow("statusConnected", '✗ No', '#f48771');
+        setStatusRow("statusInternet", '✗ Not Active', '#f48771');
+        setInternetInterface(null);
+        
+        document.getElementById('statusIP').style.display = 'none';
+        document.getElementById('statusActiveConnection').style.display = 'none';
       }
       
       function setHero(icon, title, sub, color) {
@@ -430,20 +471,22 @@ HTML_TEMPLATE = """<!DOCTYPE html>
           screenStatus = 'P';  // Paired but not connected
         }
 
+        // Track when anything last changed so steady-state polling can back off
+        const sig = JSON.stringify([statusData.status, statusData.message, data.paired, data.trusted,
+          data.connected, data.pan_active, data.ip_address, data.default_route_interface]);
+        if (sig !== lastStatusSig) {
+          lastStatusSig = sig;
+          lastStatusChange = Date.now();
+        }
+
         // --- Status hero: one-glance state ---
         updateStatusHero(statusData, data);
 
-        document.getElementById("statusPaired").innerHTML = 
-          `📱 Paired: <span style="color: ${data.paired ? '#4ec9b0' : '#f48771'};">${data.paired ? '✓ Yes' : '✗ No'}</span>`;
-        
-        document.getElementById("statusTrusted").innerHTML = 
-          `🔐 Trusted: <span style="color: ${data.trusted ? '#4ec9b0' : '#f48771'};">${data.trusted ? '✓ Yes' : '✗ No'}</span>`;
-        
-        document.getElementById("statusConnected").innerHTML = 
-          `🔵 Connected: <span style="color: ${data.connected ? '#4ec9b0' : '#f48771'};">${data.connected ? '✓ Yes' : '✗ No'}</span>`;
-        
-        document.getElementById("statusInternet").innerHTML = 
-          `🌐 Internet: <span style="color: ${data.pan_active ? '#4ec9b0' : '#f48771'};">${data.pan_active ? '✓ Active' : '✗ Not Active'}</span>${data.interface ? ` <span style="color: #888;">(${data.interface})</span>` : ''}`;
+        setStatusRow("statusPaired", data.paired ? '✓ Yes' : '✗ No', data.paired ? '#4ec9b0' : '#f48771');
+        setStatusRow("statusTrusted", data.trusted ? '✓ Yes' : '✗ No', data.trusted ? '#4ec9b0' : '#f48771');
+        setStatusRow("statusConnected", data.connected ? '✓ Yes' : '✗ No', data.connected ? '#4ec9b0' : '#f48771');
+        setStatusRow("statusInternet", data.pan_active ? '✓ Active' : '✗ Not Active', data.pan_active ? '#4ec9b0' : '#f48771');
+        setInternetInterface(data.interface);
         
         // Show/hide test internet card based on connection status
         const testInternetCard = document.getElementById('testInternetCard');
@@ -457,7 +500,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         const statusIPElement = document.getElementById('statusIP');
         if (data.ip_address && data.pan_active) {
           statusIPElement.style.display = 'block';
-          statusIPElement.innerHTML = `🔢 IP Address: <span style="color: #4ec9b0;">${data.ip_address}</span>`;
+          statusIPElement.firstElementChild.textContent = data.ip_address;
         } else {
           statusIPElement.style.display = 'none';
         }
@@ -477,7 +520,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             connType = 'USB Tethering';
             connEmoji = '🔌';
             if (data.pan_active && !isUsingBluetooth) {
-              connDetails = '<div style="color: #ce9178; margin-top: 4px; font-size: 11px;">💡 Bluetooth is on standby • USB has priority due to higher speed</div>';
+              connDetails = '💡 Bluetooth is on standby • USB has priority due to higher speed';
             }
           } else if (data.default_route_interface.startsWith('bnep')) {
             connType = 'Bluetooth Tethering';
@@ -486,47 +529,41 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             connType = 'Ethernet';
             connEmoji = '🌐';
             if (data.pan_active) {
-              connDetails = '<div style="color: #ce9178; margin-top: 4px; font-size: 11px;">💡 Bluetooth is on standby • Ethernet is active</div>';
+              connDetails = '💡 Bluetooth is on standby • Ethernet is active';
             }
           } else if (data.default_route_interface.startsWith('wlan')) {
             connType = 'Wi-Fi';
             connEmoji = '📶';
             if (data.pan_active) {
-              connDetails = '<div style="color: #ce9178; margin-top: 4px; font-size: 11px;">💡 Bluetooth is on standby • Wi-Fi is active</div>';
+              connDetails = '💡 Bluetooth is on standby • Wi-Fi is active';
             }
           }
           
           statusActiveConnection.style.display = 'block';
-          statusActiveConnection.innerHTML = `${connEmoji} <span style="color: #4ec9b0; font-weight: bold;">${connType}</span> <span style="color: #888;">(${data.default_route_interface})</span>${connDetails}`;
+          statusActiveConnection.querySelector('.conn-emoji').textContent = connEmoji;
+          statusActiveConnection.querySelector('.conn-type').textContent = connType;
+          statusActiveConnection.querySelector('.conn-iface').textContent = `(${data.default_route_interface})`;
+          const detailsEl = statusActiveConnection.querySelector('.conn-details');
+          detailsEl.textContent = connDetails;
+          detailsEl.hidden = !connDetails;
         } else {
           statusActiveConnection.style.display = 'none';
         }
         
-        // Manage polling based on connection state
-        if (statusData.status === 'PAIRING' || statusData.status === 'TRUSTING' || statusData.status === 'CONNECTING' || statusData.status === 'RECONNECTING' || statusData.connection_in_progress) {
+        // Pick the delay before the next status poll from the state just seen
+        if (eventSource && eventSource.readyState === EventSource.OPEN) {
+          // Changes are pushed over the event stream - keep only a slow safety-net poll
+          statusDelay = 30000;
+        } else if (statusData.status === 'PAIRING' || statusData.status === 'TRUSTING' || statusData.status === 'CONNECTING' || statusData.status === 'RECONNECTING' || statusData.connection_in_progress) {
           // Actively connecting - poll faster (every 2 seconds)
-          if (!statusInterval || statusInterval._interval !== 2000) {
-            console.log('Connection in progress - fast polling (2s)');
-            stopStatusPolling();
-            statusInterval = setInterval(checkConnectionStatus, 2000);
-            statusInterval._interval = 2000;
-          }
+          statusDelay = 2000;
         } else if (data.connected || data.paired) {
-          // Connected or paired - poll slower (every 10 seconds) to keep status updated
-          if (!statusInterval || statusInterval._interval !== 10000) {
-            console.log('Connected/paired - slow polling (10s)');
-            stopStatusPolling();
-            statusInterval = setInterval(checkConnectionStatus, 10000);
-            statusInterval._interval = 10000;
-          }
+          // Connected or paired - poll slower (every 10 seconds) to keep status updated,
+          // backing off to 30 seconds once nothing has changed for a minute
+          statusDelay = Date.now() - lastStatusChange > 60000 ? 30000 : 10000;
         } else {
           // Disconnected and not paired - poll very slowly (every 30 seconds) to catch new devices
-          if (!statusInterval || statusInterval._interval !== 30000) {
-            console.log('Disconnected - slow polling (30s)');
-            stopStatusPolling();
-            statusInterval = setInterval(checkConnectionStatus, 30000);
-            statusInterval._interval = 30000;
-          }
+          statusDelay = 30000;
         }
         
         // Update button states
@@ -587,22 +624,33 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         }
       }
 
-      function startStatusPolling() {
-        if (statusInterval) clearInterval(statusInterval);
-        // Poll every 2 seconds during connection - passkey is shown in logs
-        statusInterval = setInterval(checkConnectionStatus, 2000);
+      // A single self-rescheduling status poll: each run waits statusDelay
+      // (chosen by updateStatusDisplay) before the next, so the rate adapts
+      // without tearing timers down. Restarting bumps statusGen, which retires
+      // any run still in flight from the previous chain.
+      function startStatusPolling(delay = 2000) {
+        stopStatusPolling();
+        const gen = statusGen;
+        const run = async () => {
+          await checkConnectionStatus();
+          if (gen !== statusGen || document.hidden) return;
+          statusTimer = setTimeout(idleTick(run), statusDelay);
+        };
+        // First poll after `delay` (2s default during connection - passkey is shown in logs)
+        statusTimer = setTimeout(idleTick(run), delay);
       }
 
       function stopStatusPolling() {
-        if (statusInterval) {
-          clearInterval(statusInterval);
-          statusInterval = null;
+        statusGen++;
+        if (statusTimer) {
+          clearTimeout(statusTimer);
+          statusTimer = null;
         }
       }
 
       async function quickConnect() {
         const mac = macInput.value.trim();
-        if (!mac || !/^([0-9A-F]{2}:){5}[0-9A-F]{2}$/i.test(mac)) {
+        if (!mac || !isMac(mac)) {
           showFeedback("Please enter your phone's MAC address first!", "warning");
           return;
         }
@@ -652,64 +700,121 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         try {
           const response = await fetch('/plugins/bt-tether/scan', { method: 'GET' });
           await response.json();
-
-          // Poll /scan-progress every 2 seconds to show devices as they appear
-          let pollCount = 0;
-          const maxPolls = 16;
-          let lastDeviceCount = 0;
-          let scanProgressInterval = setInterval(async () => {
-            pollCount++;
-
-            try {
-              const progressResponse = await fetch('/plugins/bt-tether/scan-progress');
-              const progressData = await progressResponse.json();
-
-              if (progressData.devices && progressData.devices.length > lastDeviceCount) {
-                lastDeviceCount = progressData.devices.length;
-                deviceList.innerHTML = '';
-                progressData.devices.forEach(device => {
-                  const div = document.createElement('div');
-                  div.className = 'device-item';
-                  div.innerHTML = `
-                    <div style="flex: 1; font-family: 'Courier New', monospace; font-size: 12px;">
-                      <b>${device.name}</b><br>
-                      <small style="color: #888;">${device.mac}</small>
-                    </div>
-                    <button onclick="pairAndConnectDevice('${device.mac}', '${device.name.replace(/'/g, "\\'")}'); return false;" class="success" style="margin: 0; padding: 6px 12px; font-size: 12px;">Pair</button>
-                  `;
-                  deviceList.appendChild(div);
-                });
-                scanStatus.innerHTML = `<span class="spinner"></span> Found ${progressData.devices.length} device(s)... still scanning`;
-              }
-
-              if (!progressData.scanning) {
-                clearInterval(scanProgressInterval);
-                if (progressData.devices && progressData.devices.length > 0) {
-                  scanStatus.textContent = `Scan complete - Found ${progressData.devices.length} device(s):`;
-                  showFeedback(`Found ${progressData.devices.length} device(s). Click Pair to connect!`, "success");
-                } else {
-                  scanStatus.textContent = 'Scan complete - No devices found';
-                  deviceList.innerHTML = '';
-                  showFeedback("No devices found. Make sure phone Bluetooth is ON and visible.", "warning");
-                }
-                scanBtn.disabled = false;
-                scanBtn.innerHTML = '🔍 Scan';
-              } else if (pollCount >= maxPolls) {
-                clearInterval(scanProgressInterval);
-                scanStatus.textContent = 'Scan complete';
-                scanBtn.disabled = false;
-                scanBtn.innerHTML = '🔍 Scan';
-              }
-            } catch (e) {
-              console.log('Scan progress poll error:', e);
-            }
-          }, 2000);
         } catch (error) {
           scanStatus.textContent = 'Scan failed';
           showFeedback("Scan failed: " + error.message, "error");
           scanBtn.disabled = false;
           scanBtn.innerHTML = '🔍 Scan';
+          return;
+        }
+
+        if (!window.EventSource) {
+          pollScanProgress();
+          return;
+        }
+
+        // Devices are pushed one by one as the scan finds them; each row is
+        // appended on arrival instead of rebuilding the whole list
+        const seen = new Set();
+        const es = new EventSource('/plugins/bt-tether/scan-events');
+        // Safety net in case the final "done" event never arrives
+        const giveUp = setTimeout(() => {
+          es.close();
+          finishScan(seen.size);
+        }, 35000);
+        es.onmessage = (e) => {
+          const device = JSON.parse(e.data);
+          if (seen.has(device.mac)) return;
+          seen.add(device.mac);
+          deviceList.appendChild(buildDeviceRow(device));
+          scanStatus.innerHTML = `<span class="spinner"></span> Found ${seen.size} device(s)... still scanning`;
+        };
+        es.addEventListener('done', () => {
+          es.close();
+          clearTimeout(giveUp);
+          finishScan(seen.size);
+        });
+        es.onerror = () => {
+          // Stream unavailable or dropped - fall back to polling for the rest
+          es.close();
+          clearTimeout(giveUp);
+          pollScanProgress();
+        };
+      }
+
+      function finishScan(count) {
+        const scanBtn = document.getElementById('scanBtn');
+        const scanStatus = document.getElementById('scanStatus');
+        if (count > 0) {
+          scanStatus.textContent = `Scan complete - Found ${count} device(s):`;
+          showFeedback(`Found ${count} device(s). Click Pair to connect!`, "success");
+        } else {
+          scanStatus.textContent = 'Scan complete - No devices found';
+          document.getElementById('deviceList').innerHTML = '';
+          showFeedback("No devices found. Make sure phone Bluetooth is ON and visible.", "warning");
         }
+        scanBtn.disabled = false;
+        scanBtn.innerHTML = '🔍 Scan';
+      }
+
+      function pollScanProgress() {
+        const scanBtn = document.getElementById('scanBtn');
+        const scanStatus = document.getElementById('scanStatus');
+        const deviceList = document.getElementById('deviceList');
+
+        // Poll /scan-progress every 2 seconds to show devices as they appear
+        let pollCount = 0;
+        const maxPolls = 16;
+        let lastDeviceCount = 0;
+        let scanProgressInterval = setInterval(async () => {
+          pollCount++;
+
+          try {
+            const progressResponse = await fetch('/plugins/bt-tether/scan-progress');
+            const progressData = await progressResponse.json();
+
+            if (progressData.devices && progressData.devices.length > lastDeviceCount) {
+              lastDeviceCount = progressData.devices.length;
+              // Build all rows off-document, then swap them in with one DOM write
+              const frag = document.createDocumentFragment();
+              progressData.devices.forEach(device => frag.appendChild(buildDeviceRow(device)));
+              deviceList.replaceChildren(frag);
+              scanStatus.innerHTML = `<span class="spinner"></span> Found ${progressData.devices.length} device(s)... still scanning`;
+            }
+
+            if (!progressData.scanning) {
+              clearInterval(scanProgressInterval);
+              finishScan(progressData.devices ? progressData.devices.length : 0);
+            } else if (pollCount >= maxPolls) {
+              clearInterval(scanProgressInterval);
+              scanStatus.textContent = 'Scan complete';
+              scanBtn.disabled = false;
+              scanBtn.innerHTML = '🔍 Scan';
+            }
+          } catch (e) {
+            console.log('Scan progress poll error:', e);
+          }
+        }, 2000);
+      }
+
+      function buildDeviceRow(device) {
+        const div = document.createElement('div');
+        div.className = 'device-item';
+        const info = document.createElement('div');
+        info.style.cssText = "flex: 1; font-family: 'Courier New', monospace; font-size: 12px;";
+        const name = document.createElement('b');
+        name.textContent = device.name;
+        const mac = document.createElement('small');
+        mac.style.color = '#888';
+        mac.textContent = device.mac;
+        info.append(name, document.createElement('br'), mac);
+        const btn = document.createElement('button');
+        btn.className = 'success';
+        btn.style.cssText = 'margin: 0; padding: 6px 12px; font-size: 12px;';
+        btn.textContent = 'Pair';
+        btn.onclick = () => { pairAndConnectDevice(device.mac, device.name); return false; };
+        div.append(info, btn);
+        return div;
       }
 
       async function loadTrustedDevicesSummary() {
@@ -969,6 +1074,11 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             resultHtml += '<span style="color: #dc3545;">None</span>';
           }
           resultHtml += `</div>`;
+
+          // Results come from the background refresh when it is recent enough
+          if (data.age > 0) {
+            resultHtml += `<div style="margin-top: 4px; font-size: 11px; color: #666;">Checked ${data.age}s ago</div>`;
+          }
           
           resultHtml += '</div>';
           
@@ -994,7 +1104,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
       async function disconnectDevice() {
         const mac = macInput.value.trim();
-        if (!/^([0-9A-F]{2}:){5}[0-9A-F]{2}$/i.test(mac)) {
+        if (!isMac(mac)) {
           showFeedback("Enter a valid MAC address first", "warning");
           return;
         }
@@ -1050,65 +1160,147 @@ HTML_TEMPLATE = """<!DOCTYPE html>
           b.style.background = active ? '#30363d' : 'transparent';
           b.style.color = active ? '#e6edf3' : '#8b949e';
         });
+        // Filter changed - re-render the whole buffer
+        lastLogId = 0;
         refreshLogs();
       }
 
       async function refreshLogs() {
+        const since = lastLogId;
         try {
-          const response = await fetch('/plugins/bt-tether/logs');
+          // Only fetch entries newer than the last one already shown
+          const response = await fetch(`/plugins/bt-tether/logs?since=${since}`);
           const data = await response.json();
-          const logContent = document.getElementById('logContent');
-
-          // Remember if user is at the bottom before updating
-          const isAtBottom = logContent.scrollHeight - logContent.scrollTop <= logContent.clientHeight + 1;
-
-          // Apply the active level filter. WARNING also includes ERROR; INFO
-          // includes everything except DEBUG noise.
-          const filter = window._logFilter || 'ALL';
-          let logs = data.logs || [];
-          if (filter !== 'ALL') {
-            const rank = { DEBUG: 0, INFO: 1, WARNING: 2, ERROR: 3 };
-            const min = rank[filter];
-            logs = logs.filter(l => (rank[(l.level || 'INFO').toUpperCase()] ?? 1) >= min);
+          // Drop responses overtaken by a filter change or another refresh
+          if (since !== lastLogId) return;
+          if (data.last < since) {
+            // Plugin was reloaded and its log ids restarted - start over
+            lastLogId = 0;
+            return refreshLogs();
           }
+          lastLogId = data.last;
+          renderLogs(data.logs || [], since === 0);
+        } catch (error) {
+          console.error('Failed to fetch logs:', error);
+        }
+      }
 
-          if (logs.length > 0) {
-            logContent.innerHTML = logs.map(log => {
-              const timestamp = log.timestamp || '';
-              const level = (log.level || 'INFO').toUpperCase();
-              const message = log.message || '';
-              
-              let color = '#d4d4d4';
-              if (level === 'ERROR') color = '#f48771';
-              else if (level === 'WARNING') color = '#dcdcaa';
-              else if (level === 'INFO') color = '#4fc1ff';
-              else if (level === 'DEBUG') color = '#888';
-              
-              return `<div><span style=\"color: #888;\">${timestamp}</span> <span style=\"color: ${color}; font-weight: bold;\">[${level}]</span> ${message}</div>`;
-            }).join('');
-            
-            // Only auto-scroll if user was at the bottom, otherwise preserve their scroll position
-            if (isAtBottom) {
-              logContent.scrollTop = logContent.scrollHeight;
-            }
+      // Append log entries to the view, or replace it when `replace` is set
+      function renderLogs(logs, replace) {
+        const logContent = document.getElementById('logContent');
+
+        // Remember if user is at the bottom before updating
+        const isAtBottom = logContent.scrollHeight - logContent.scrollTop <= logContent.clientHeight + 1;
+
+        // Apply the active level filter. WARNING also includes ERROR; INFO
+        // includes everything except DEBUG noise.
+        const filter = window._logFilter || 'ALL';
+        if (filter !== 'ALL') {
+          const rank = { DEBUG: 0, INFO: 1, WARNING: 2, ERROR: 3 };
+          const min = rank[filter];
+          logs = logs.filter(l => (rank[(l.level || 'INFO').toUpperCase()] ?? 1) >= min);
+        }
+
+        // Build only the new rows, off-document, with one DOM insert
+        const frag = document.createDocumentFragment();
+        logs.forEach(log => frag.appendChild(buildLogRow(log)));
+
+        if (replace) {
+          if (logs.length) {
+            logContent.replaceChildren(frag);
           } else {
-            logContent.innerHTML = '<div style=\"color: #888;\">No logs available</div>';
+            const empty = document.createElement('div');
+            empty.className = 'log-empty';
+            empty.style.color = '#888';
+            empty.textContent = 'No logs available';
+            logContent.replaceChildren(empty);
+          }
+        } else if (logs.length) {
+          const empty = logContent.querySelector('.log-empty');
+          if (empty) empty.remove();
+          logContent.appendChild(frag);
+          // Keep the view bounded like the server-side buffer
+          while (logContent.childElementCount > LOG_MAXLEN) {
+            logContent.firstElementChild.remove();
           }
-        } catch (error) {
-          console.error('Failed to fetch logs:', error);
         }
+
+        // Only auto-scroll if user was at the bottom, otherwise preserve their scroll position
+        if (logs.length && isAtBottom) {
+          logContent.scrollTop = logContent.scrollHeight;
+        }
+      }
+      
+      const LOG_COLORS = { ERROR: '#f48771', WARNING: '#dcdcaa', INFO: '#4fc1ff', DEBUG: '#888' };
+
+      // One log line as DOM nodes. textContent keeps device names and other
+      // message text from being parsed as HTML.
+      function buildLogRow(log) {
+        const level = (log.level || 'INFO').toUpperCase();
+        const div = document.createElement('div');
+        const time = document.createElement('span');
+        time.style.color = '#888';
+        time.textContent = log.timestamp || '';
+        const tag = document.createElement('span');
+        tag.style.color = LOG_COLORS[level] || '#d4d4d4';
+        tag.style.fontWeight = 'bold';
+        tag.textContent = `[${level}]`;
+        div.append(time, ' ', tag, ' ' + (log.message || ''));
+        return div;
       }
       
       function startLogPolling() {
-        if (logInterval) clearInterval(logInterval);
+        stopLogPolling();
+        logPolling = true;
+        const gen = logGen;
+        const run = async () => {
+          await refreshLogs();
+          if (gen !== logGen) return;
+          logTimer = setTimeout(idleTick(run), 5000);
+        };
         // Poll logs every 5 seconds (less aggressive than before)
-        logInterval = setInterval(refreshLogs, 5000);
+        logTimer = setTimeout(idleTick(run), 5000);
       }
       
       function stopLogPolling() {
-        if (logInterval) {
-          clearInterval(logInterval);
-          logInterval = null;
+        logPolling = false;
+        logGen++;
+        if (logTimer) {
+          clearTimeout(logTimer);
+          logTimer = null;
+        }
+      }
+
+      // Server-Sent Events: the plugin signals every state/log change, so the
+      // page refreshes right away instead of polling. Bursts are coalesced into
+      // one refresh; polling resumes while the stream is down or unsupported.
+      function startEventStream() {
+        if (!window.EventSource || eventSource) return;
+        // New log lines arrive on the stream itself, after the ones already shown
+        eventSource = new EventSource(`/plugins/bt-tether/events?since=${lastLogId}`);
+        eventSource.onopen = () => stopLogPolling();
+        eventSource.addEventListener('log', (e) => {
+          const entry = JSON.parse(e.data);
+          if (entry.id <= lastLogId) return;
+          lastLogId = entry.id;
+          renderLogs([entry], false);
+        });
+        eventSource.onmessage = () => {
+          if (eventRefreshTimer) return;
+          eventRefreshTimer = setTimeout(() => {
+            eventRefreshTimer = null;
+            checkConnectionStatus();
+          }, 250);
+        };
+        eventSource.onerror = () => {
+          if (!logPolling) startLogPolling();
+        };
+      }
+
+      function stopEventStream() {
+        if (eventSource) {
+          eventSource.close();
+          eventSource = null;
         }
       }
       
@@ -1118,23 +1310,27 @@ HTML_TEMPLATE = """<!DOCTYPE html>
           console.log('Page hidden - stopping all polling');
           stopStatusPolling();
           stopLogPolling();
+          stopEventStream();
+          if (eventRefreshTimer) {
+            clearTimeout(eventRefreshTimer);
+            eventRefreshTimer = null;
+          }
         } else {
           console.log('Page visible - resuming polling');
-          checkConnectionStatus();
+          startStatusPolling(0);
           refreshLogs();
           startLogPolling();
+          startEventStream();
         }
       });
       
-      // Clean up intervals when page is unloaded
+      // Clean up timers when page is unloaded
       window.addEventListener('beforeunload', function() {
         console.log('Page unloading - cleaning up');
         stopStatusPolling();
         stopLogPolling();
+        stopEventStream();
       });
-    </script>
-  </body>
-</html>
 """
 
 
@@ -1160,6 +1356,17 @@ class BTTetherHelper(Plugin):
 
     # Bluetooth UUID constants
     NAP_UUID = "00001116-0000-1000-8000-00805f9b34fb"
+    # Device/link status with nothing paired or connected; copy before changing
+    DISCONNECTED_STATUS = MappingProxyType(
+        {
+            "paired": False,
+            "trusted": False,
+            "connected": False,
+            "pan_active": False,
+            "interface": None,
+            "ip_address": None,
+        }
+    )
 
     # Timing constants
     BLUETOOTH_SERVICE_STARTUP_DELAY = 3
@@ -1172,7 +1379,6 @@ class BTTetherHelper(Plugin):
     SCAN_DURATION = 30
     DEVICE_OPERATION_DELAY = 1
     DEVICE_OPERATION_LONGER_DELAY = 2
-    SCAN_STOP_DELAY = 0.5
     # Pairing configuration constants
     PAIRING_SCAN_WAIT_TIMEOUT = (
         15  # Max seconds to wait for device to appear in BlueZ cache during pairing
@@ -1186,16 +1392,78 @@ class BTTetherHelper(Plugin):
         r"([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})"
     )
     SCAN_ANSI_PATTERN = re.compile(r"(\x1b\[[0-9;]*m|\x08)")
-    PROCESS_CLEANUP_DELAY = 0.2
+    # Full-string MAC check for web request parameters (callers upper-case first)
+    MAC_PATTERN = re.compile(r"^([0-9A-F]{2}:){5}[0-9A-F]{2}$")
+    # Agent/pair output parsing, run on every bluetoothctl line while pairing
+    PASSKEY_PATTERN = re.compile(r"passkey\s+(\d{6})", re.IGNORECASE)
+    PASSKEY_DIGITS_PATTERN = re.compile(r"(\d{6})")
+    STRIP_ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*[mGKHF]|\x01|\x02")
+    # `bluetoothctl devices` line: MAC and (optional) name
+    BTCTL_DEVICE_LINE_PATTERN = re.compile(
+        r"^Device ([0-9A-Fa-f:]{17})(?:[ \t]+([^\n]*))?$", re.MULTILINE
+    )
+    # Whole bluetoothctl status line ([CHG] / [DEL] / [NEW]) plus its newline
+    BTCTL_STATUS_LINE_PATTERN = re.compile(
+        r"^[ \t\r]*\[(?:CHG|DEL|NEW)\][^\n]*\n?", re.MULTILINE
+    )
+    # `nameserver <addr>` lines in /etc/resolv.conf
+    NAMESERVER_PATTERN = re.compile(r"^[ \t]*nameserver[ \t]+(\S+)", re.MULTILINE)
+    # Lease length in `dhcpcd -U` output
+    DHCPCD_LEASE_TIME_PATTERN = re.compile(r"^dhcp_lease_time='?(\d+)", re.M)
+    # bluetoothctl subcommands that only read state (see _cmd_lock)
+    BTCTL_QUERY_COMMANDS = frozenset({"show", "info", "devices", "list"})
+    # Lowercased fragments of bluetoothctl's replies to the one-shot commands
+    # _send_btctl runs through the agent: subcommand -> (success, failure).
+    # {arg} is the command's (lowercased) argument, so a reply is only taken
+    # when it names the MAC or setting the command was about.
+    BTCTL_REPLIES = MappingProxyType(
+        {
+            "trust": (("{arg} trust succeeded",), ("failed to set {arg} trust",)),
+            "untrust": (("{arg} untrust succeeded",), ("failed to set {arg} untrust",)),
+            "block": (("{arg} block succeeded",), ("failed to set {arg} block",)),
+            "unblock": (("{arg} unblock succeeded",), ("failed to set {arg} unblock",)),
+            "remove": (("device has been removed",), ("failed to remove device",)),
+            "disconnect": (("successful disconnected",), ("failed to disconnect",)),
+            "power": (("power {arg} succeeded",), ("failed to set power {arg}",)),
+            "pairable": (("pairable {arg} succeeded",), ("failed to set pairable",)),
+            "discoverable": (
+                ("discoverable {arg} succeeded",),
+                ("failed to set discoverable",),
+            ),
+        }
+    )
+    # Failure replies any of those commands can get
+    BTCTL_COMMON_FAILURES = ("device {arg} not available", "no default controller")
+    SIOCGIFADDR = 0x8915  # ioctl: get an interface's IPv4 address
     DBUS_OPERATION_RETRY_DELAY = 0.1
     AGENT_LOG_MONITOR_TIMEOUT = 90  # Seconds to monitor agent log for passkey
+    AGENT_LOG_MONITOR_POLL = 1  # Seconds between checks of the monitor's stop event
+    # Endings of bluetoothctl prompts, which are printed without a newline
+    # ("[agent] Confirm passkey 123456 (yes/no): ", "[bluetooth]# ")
+    AGENT_PROMPT_ENDINGS = (b": ", b"# ")
     # Seconds to wait for on_ready() before initializing anyway. on_ready often
     # arrives late (or after a slow boot), so a long wait just prolongs the
     # "Initializing" state. Init is idempotent and does its own adapter-readiness
     # poll, so starting early via fallback is safe.
     FALLBACK_INIT_TIMEOUT = 5
+    # Web endpoints that drive bluetoothctl/BlueZ wait up to this many seconds
+    # for the background Bluetooth initialization before giving up with a 503.
+    SERVICES_READY_TIMEOUT = 15
+    WEB_BLUETOOTH_ROUTES = frozenset(
+        ("connect", "pair-device", "disconnect", "unpair", "scan")
+    )
+    # Startup localhost route check: /var/run is a tmpfs, so the stamp is gone
+    # after every reboot and the check always runs once per boot
+    LOCALHOST_CHECK_STAMP = "/var/run/bt-tether-localhost.stamp"
+    LOCALHOST_CHECK_TTL = 86400  # Re-check at most once a day across plugin reloads
     PAN_INTERFACE_WAIT = 2  # Seconds to wait for PAN interface after connection
     INTERNET_VERIFY_WAIT = 2  # Seconds to wait before verifying internet connectivity
+    # Background /test-internet refresh while a PAN interface is up; a cached
+    # result older than twice the interval is re-run on request instead
+    INTERNET_TEST_INTERVAL = 30
+    # Background refreshes stop once /test-internet hasn't been requested for
+    # this long, so nobody's metered link is pinged for a page no one has open
+    INTERNET_TEST_IDLE = 120
     # Max seconds a single NAP ConnectProfile call may block before we abandon it.
     # When the phone is off/out of range BlueZ can sit on the request until its own
     # ~30s D-Bus timeout, freezing whatever thread called us. We bound it ourselves
@@ -1213,6 +1481,20 @@ class BTTetherHelper(Plugin):
     STUCK_REBOOT_MIN_INTERVAL = 1800  # 30 minutes
     DHCP_KILL_WAIT = 0.5  # Wait after killing dhclient
     DHCP_RELEASE_WAIT = 1  # Wait after releasing DHCP lease
+    # Reachability ping: stop at the first reply, re-sending every 0.2s for up
+    # to 3s so a lost echo doesn't fail the check (vs -c 2's fixed 1s+ minimum)
+    PING_PROBE_ARGS = ("-c", "1", "-i", "0.2", "-w", "3")
+    # dhclient lease databases, per-interface first ({iface} is substituted)
+    DHCLIENT_LEASE_FILES = (
+        "/var/lib/dhcp/dhclient.{iface}.leases",
+        "/var/lib/dhcp/dhclient.leases",
+    )
+    # One `lease { ... }` block in a dhclient lease database
+    DHCLIENT_LEASE_PATTERN = re.compile(r"lease \{(.*?)\}", re.DOTALL)
+    # Lease end: "expire 3 2026/10/17 12:00:00;" (UTC) or "expire epoch N;"
+    DHCLIENT_EXPIRE_PATTERN = re.compile(
+        r"expire (?:epoch (\d+)|\d (\d+/\d+/\d+ \d+:\d+:\d+));"
+    )
 
     # Reconnect configuration constants
     DEFAULT_RECONNECT_INTERVAL = 60  # Default seconds between reconnect checks
@@ -1234,9 +1516,20 @@ class BTTetherHelper(Plugin):
     SUBPROCESS_TIMEOUT_STANDARD = 5  # For main bluetoothctl operations
     SUBPROCESS_TIMEOUT_LONG = 10  # For long-running operations (device removal)
 
-    # Coalesce rapid web status polls (and multiple browser tabs) into at most
-    # one live read per this many seconds.
-    WEB_STATUS_CACHE_TTL = 2
+    # Coalesce rapid web status polls (and multiple browser tabs) and the
+    # monitor loop into at most one live read per this many seconds.
+    STATUS_CACHE_TTL = 2
+    # Worker threads for overlapping the independent ip/BlueZ probes behind the
+    # web endpoints, so a poll costs the slowest probe rather than their sum.
+    WEB_PROBE_WORKERS = 3
+    # gzip level for the web UI page; it's compressed once per MAC change, so
+    # spend the CPU for the smallest transfer over the tether link.
+    HTML_GZIP_LEVEL = 9
+    # /events (Server-Sent Events) stream: keep-alive comment interval, and max
+    # stream lifetime so a vanished browser can't hold a server thread for
+    # long (EventSource reconnects on its own).
+    WEB_EVENTS_HEARTBEAT = 15
+    WEB_EVENTS_MAX_AGE = 300
 
     # UI polling intervals (milliseconds)
     UI_STATUS_POLL_INTERVAL = 2000  # Connection status check interval
@@ -1245,14 +1538,16 @@ class BTTetherHelper(Plugin):
     # Operation delay constants
     OPERATION_SHORT_DELAY = 0.5  # General short delay between operations
     OPERATION_MEDIUM_DELAY = 3  # Medium delay for settlement/hardware stabilization
+    # rtnetlink multicast group for link add/change/remove (RTMGRP_LINK)
+    RTNL_LINK_GROUP = 1
+    # ...and for IPv4/IPv6 address add/remove (RTMGRP_IPV4_IFADDR | _IPV6_IFADDR)
+    RTNL_IFADDR_GROUPS = 0x10 | 0x100
 
     # Internal plugin flag - not a user-configurable option
     csrf_exempt = True
 
     def on_loaded(self):
         """Initialize plugin configuration and data structures only - no heavy operations"""
-        from collections import deque
-
         self.phone_mac = ""
         self._status = self.STATE_IDLE
         self._message = "Ready"
@@ -1265,10 +1560,25 @@ class BTTetherHelper(Plugin):
         self.agent_process = None
         self.agent_log_fd = None
         self.agent_log_path = None
+        # One queue per running passkey monitor; _pump_agent_output feeds each
+        # of them every line the pairing agent prints
+        self._agent_line_queues = set()
+        self._agent_line_lock = threading.Lock()
+        # True while the agent waits for an answer to a question it printed
+        # ("... (yes/no): "); a command written then would be taken as the answer
+        self._agent_prompt_pending = False
         self.current_passkey = None
 
-        self._ui_logs = deque(maxlen=self.UI_LOG_MAXLEN)
+        # Fixed ring of UI log entries; entry N lives in slot N % UI_LOG_MAXLEN.
+        # Writers serialize on _ui_log_lock, readers don't lock at all.
+        self._ui_logs = [None] * self.UI_LOG_MAXLEN
         self._ui_log_lock = threading.Lock()
+        # Id of the newest UI log entry; lets the web UI fetch only new lines
+        self._ui_log_seq = 0
+
+        # Bumped on every state/log change; /events streams wait on it
+        self._web_event_seq = 0
+        self._web_event_cond = threading.Condition()
 
         self.show_on_screen = self.options.get("show_on_screen", True)
         self.show_mini_status = self.options.get("show_mini_status", True)
@@ -1292,6 +1602,13 @@ class BTTetherHelper(Plugin):
         # Speed up DHCP on the point-to-point PAN link (skip dhcpcd ARP probe /
         # shorten dhclient backoff). Disable on exotic network setups.
         self.fast_dhcp = self.options.get("fast_dhcp", True)
+        # (has_dhcpcd, has_dhclient), looked up on the first DHCP request
+        self._dhcp_clients = None
+        # (phone MAC, iface) -> wall-clock expiry of the lease we last obtained
+        # on iface while tethered to that phone
+        self._lease_expiry = {}
+        # ((mtime_ns, size), nameservers) of the last /etc/resolv.conf read
+        self._resolv_cache = None
 
         # True when the last NAP failure was "tethering not available on phone"
         # (br-connection-profile-unavailable) - surfaced to the UI so the user
@@ -1327,6 +1644,36 @@ class BTTetherHelper(Plugin):
         self._nap_attempt_abandoned = False
 
         self._bluetoothctl_lock = threading.Lock()
+        # Environment for every bluetoothctl we spawn, built once: NO_COLOR and a
+        # dumb TERM keep ANSI color codes out of output we parse and log
+        self._btctl_env = dict(os.environ, NO_COLOR="1", TERM="dumb")
+        # Command prefix for privileged calls: pwnagotchi normally runs as root,
+        # where going through sudo only adds its startup and PAM cost
+        self._sudo = [] if os.geteuid() == 0 else ["sudo"]
+        # Read-only bluetoothctl queries queue on their own lock, so a status read
+        # doesn't wait behind a slow pair/remove (see _cmd_lock)
+        self._bluetoothctl_query_lock = threading.Lock()
+
+        # Long-lived BlueZ ObjectManager proxy, reused across status polls
+        # instead of being rebuilt (and re-introspected) on every call.
+        self._bluez_manager = None
+        self._bluez_manager_lock = threading.Lock()
+        # Object path of the first BlueZ adapter (e.g. /org/bluez/hci0), looked
+        # up on first use; adapter paths survive bluetoothd restarts
+        self._bluez_adapter_path = None
+        # {object path: Device1 properties}, kept current by BlueZ signals (see
+        # _start_bluez_watch). None while the watch isn't running, in which case
+        # readers fall back to GetManagedObjects.
+        self._bluez_devices = None
+        self._bluez_devices_lock = threading.Lock()
+        # Bumped and notified on every device change the watch applies, so
+        # _wait_for_device can sleep until BlueZ reports something new
+        self._bluez_device_seq = 0
+        self._bluez_device_cond = threading.Condition(self._bluez_devices_lock)
+        self._bluez_watch_bus = None
+        self._bluez_watch_loop = None
+        # Queue of Device1 props found while a D-Bus scan runs (see _scan_via_dbus)
+        self._bluez_scan_queue = None
 
         self._connection_in_progress = False
         self._connection_start_time = None
@@ -1340,7 +1687,17 @@ class BTTetherHelper(Plugin):
 
         self._monitor_thread = None
         self._monitor_stop = threading.Event()
+        # Cuts the monitor's current wait short (see _wake_monitor)
+        self._monitor_wake = threading.Event()
         self._monitor_paused = threading.Event()
+        # Background connectivity test (see _internet_test_loop)
+        self._internet_test_thread = None
+        self._internet_test_stop = threading.Event()
+        self._internet_test_lock = threading.Lock()
+        # (result, checked_at) of the last _test_internet_connectivity() run
+        self._internet_test_cache = (None, 0)
+        # time.time() of the last /test-internet request
+        self._internet_test_requested_at = 0
         self._last_known_connected = False
         self._reconnect_failure_count = 0
         self._max_reconnect_failures = self.MAX_RECONNECT_FAILURES
@@ -1354,23 +1711,65 @@ class BTTetherHelper(Plugin):
 
         # Cached UI status - updated by background threads, read by on_ui_update
         # This prevents blocking subprocess calls during UI updates
-        self._cached_ui_status = {
-            "paired": False,
-            "trusted": False,
-            "connected": False,
-            "pan_active": False,
-            "interface": None,
-            "ip_address": None,
-        }
+        self._cached_ui_status = dict(self.DISCONNECTED_STATUS)
         self._cached_ui_status_lock = threading.Lock()
         self._ui_reference = None
 
-        # Short-TTL cache for the web /connection-status endpoint so frequent
-        # polling doesn't hit BlueZ/ip on every request.
-        self._web_status_cache = None
-        self._web_status_cache_time = 0
+        # Short-TTL cache of _get_full_connection_status shared by the web
+        # endpoints and the monitor loop, so they don't each hit BlueZ/ip.
+        # (mac, status, monotonic time the read started) - one tuple so it can be
+        # read lock-free
+        self._status_cache = None
+        # Serializes cache refreshes so concurrent polls (several tabs) share
+        # one live read instead of each running their own
+        self._status_cache_lock = threading.Lock()
+        # Bumped by _seed_status_cache/_invalidate_status_cache, so a refresh
+        # that started before them doesn't store its pre-change result.
+        # _status_cache_write_lock guards the check-and-store; it is never held
+        # across a live read
+        self._status_cache_gen = 0
+        self._status_cache_write_lock = threading.Lock()
+        # HTML_TEMPLATE compiled once on first page load (needs the Flask app's
+        # Jinja environment, so it can't be built at import time)
+        self._html_template = None
+        # (etag, html, gzipped html) of the rendered web UI page
+        self._html_page_cache = None
+        # {name: (mimetype, body, gzipped body)} for STATIC_CSS / STATIC_JS
+        self._static_assets = None
+        self._static_names = {}
+        # on_webhook dispatch table: path -> handler(request)
+        self._web_routes = {
+            "": self._route_index,
+            "trusted-devices": self._route_trusted_devices,
+            "connect": self._route_connect,
+            "pair-device": self._route_pair_device,
+            "status": self._route_status,
+            "disconnect": self._route_disconnect,
+            "unpair": self._route_unpair,
+            "pair-status": self._route_pair_status,
+            "scan": self._route_scan,
+            "scan-events": self._route_scan_events,
+            "scan-progress": self._route_scan_progress,
+            "connection-status": self._route_connection_status,
+            "full-status": self._route_full_status,
+            "events": self._route_events,
+            "test-internet": self._route_test_internet,
+            "logs": self._route_logs,
+        }
+        # Small pool for running independent web-status probes concurrently
+        self._web_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.WEB_PROBE_WORKERS, thread_name_prefix="bt-tether-web"
+        )
+
+        # Runs connect/reconnect attempts one at a time, in submission order, so
+        # the web UI, the monitor and auto-connect can never overlap attempts
+        self._connect_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bt-tether-connect"
+        )
 
         self._initialization_done = threading.Event()
+        # Set once _initialize_bluetooth_services has finished (or failed)
+        self._services_ready = threading.Event()
         self._fallback_thread = None
         self._last_known_pan_active = False
 
@@ -1397,7 +1796,11 @@ class BTTetherHelper(Plugin):
         self._log("INFO", "on_ready() called, initializing Bluetooth services...")
         if not self._initialization_done.is_set():
             self._initialization_done.set()
-            self._initialize_bluetooth_services()
+            # The bluetooth restart and readiness poll take several seconds; run
+            # them in the background so the main loop isn't held up.
+            threading.Thread(
+                target=self._initialize_bluetooth_services, daemon=True
+            ).start()
 
     def _wait_for_bluetooth_ready(self, timeout=10):
         """Poll until bluetooth is genuinely ready instead of sleeping blindly.
@@ -1453,40 +1856,81 @@ class BTTetherHelper(Plugin):
         return False
 
     def _wait_for_pan_interface(self, timeout=6):
-        """Poll until a PAN interface is active, returning its name (or None).
+        """Wait until a PAN interface is active, returning its name (or None).
 
         Replaces a fixed post-NAP sleep: the bnepX interface usually appears in
         well under a second, so we proceed as soon as it does instead of waiting
-        out a worst-case guess.
+        out a worst-case guess. The wait wakes on rtnetlink link events rather
+        than a poll tick; without a netlink socket it re-checks every 0.25s.
         """
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            if self._pan_active():
-                return self._get_pan_interface()
-            if self._cancel_connect.is_set() or self._monitor_stop.is_set():
-                return None
-            time.sleep(0.25)
-        return self._get_pan_interface() if self._pan_active() else None
+        nl = self._open_rtnl_watch(self.RTNL_LINK_GROUP)
+        try:
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                iface = self._get_pan_interface()
+                if iface:
+                    return iface
+                if self._cancel_connect.is_set() or self._monitor_stop.is_set():
+                    return None
+                self._wait_rtnl_event(nl, deadline, 0.25)
+        finally:
+            if nl is not None:
+                nl.close()
+        return self._get_pan_interface()
 
     def _wait_for_interface_ip(self, iface, timeout=8):
-        """Poll until the interface has an IPv4 OR global IPv6 address.
+        """Wait until the interface has an IPv4 OR global IPv6 address.
 
         Returns the address (or None). Replaces fixed post-DHCP sleeps so
         verification starts the moment an address lands. Accepting IPv6 means an
         IPv6-only PAN link (SLAAC, no IPv4 lease) returns promptly instead of
-        dead-waiting the full timeout for an IPv4 that never arrives.
+        dead-waiting the full timeout for an IPv4 that never arrives. Wakes on
+        rtnetlink address events; without netlink it re-checks every 0.3s.
         """
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            ip = self._get_interface_ip(iface) or self._get_global_ipv6(iface)
-            if ip:
-                return ip
-            if self._cancel_connect.is_set() or self._monitor_stop.is_set():
-                return None
-            time.sleep(0.3)
-        return self._get_interface_ip(iface) or self._get_global_ipv6(iface)
-
-    def _initialize_bluetooth_services(self):
+        nl = self._open_rtnl_watch(self.RTNL_IFADDR_GROUPS)
+        try:
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                ip = self._get_interface_ip(iface) or self._get_global_ipv6(iface)
+                if ip:
+                    return ip
+                if self._cancel_connect.is_set() or self._monitor_stop.is_set():
+                    return None
+                self._wait_rtnl_event(nl, deadline, 0.3)
+        finally:
+            if nl is not None:
+                nl.close()
+        return self._get_interface_ip(iface) or self._get_global_ipv6(iface)
+
+    def _open_rtnl_watch(self, groups):
+        """Open an rtnetlink socket subscribed to groups, or None if unavailable"""
+        try:
+            nl = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        except (OSError, AttributeError) as e:
+            logging.debug(f"[bt-tether] No netlink watch, polling: {e}")
+            return None
+        try:
+            nl.bind((0, groups))
+        except OSError as e:
+            logging.debug(f"[bt-tether] Netlink bind failed, polling: {e}")
+            nl.close()
+            return None
+        return nl
+
+    def _wait_rtnl_event(self, nl, deadline, poll_interval):
+        """Block until nl reports a change or deadline (monotonic) passes.
+
+        The message itself isn't parsed - callers re-read the state they wait
+        for. The wait is capped at a second so cancels are still noticed; with
+        no socket (nl is None) this is a plain poll_interval sleep.
+        """
+        remaining = max(0, deadline - time.monotonic())
+        if nl is None:
+            time.sleep(min(poll_interval, remaining))
+        elif select.select([nl], [], [], min(remaining, 1.0))[0]:
+            nl.recv(65536)
+
+    def _initialize_bluetooth_services(self):
         """Initialize Bluetooth services - called by either on_ready() or fallback"""
         with self.lock:
             self._initializing = True
@@ -1494,11 +1938,7 @@ class BTTetherHelper(Plugin):
 
         try:
             try:
-                subprocess.run(
-                    ["pkill", "-9", "bluetoothctl"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+                self._kill_bluetoothctl()
                 self._log("INFO", "Cleaned up lingering bluetoothctl processes")
             except Exception as e:
                 self._log("DEBUG", f"Process cleanup: {e}")
@@ -1529,9 +1969,20 @@ class BTTetherHelper(Plugin):
                 timeout=self.SUBPROCESS_TIMEOUT_LONG
             )
 
-            # Verify localhost routing is intact (critical for bettercap API)
+            self._start_bluez_watch()
+
+            # Verify localhost routing is intact (critical for bettercap API).
+            # Skipped on plugin reloads within the same boot once it has passed.
             try:
-                self._verify_localhost_route()
+                if self._localhost_check_due():
+                    if self._verify_localhost_route():
+                        with open(self.LOCALHOST_CHECK_STAMP, "a"):
+                            pass
+                        os.utime(self.LOCALHOST_CHECK_STAMP, None)
+                else:
+                    logging.debug(
+                        "[bt-tether] Localhost route verified recently, skipping"
+                    )
             except Exception as e:
                 self._log("WARNING", f"Initial localhost check failed: {e}")
 
@@ -1540,6 +1991,11 @@ class BTTetherHelper(Plugin):
             if self.auto_reconnect:
                 self._start_monitoring_thread()
 
+            self._internet_test_thread = threading.Thread(
+                target=self._internet_test_loop, daemon=True
+            )
+            self._internet_test_thread.start()
+
             self._set_device_name()
 
             self._log("INFO", "Bluetooth services initialized")
@@ -1569,24 +2025,13 @@ class BTTetherHelper(Plugin):
                     )
 
                     self._monitor_paused.clear()
-                    threading.Thread(
-                        target=self._connect_thread, args=(best_device,), daemon=True
-                    ).start()
+                    self._submit_connect(self._connect_thread, best_device)
                 else:
                     self._log(
                         "INFO", "No trusted devices found. Pair a device via web UI."
                     )
                     # Update cached UI status to show no device
-                    self._update_cached_ui_status(
-                        status={
-                            "paired": False,
-                            "trusted": False,
-                            "connected": False,
-                            "pan_active": False,
-                            "interface": None,
-                            "ip_address": None,
-                        }
-                    )
+                    self._update_cached_ui_status(status=self.DISCONNECTED_STATUS)
                     # No device to connect, end initialization AFTER cache update
                     with self.lock:
                         self._initializing = False
@@ -1646,6 +2091,8 @@ class BTTetherHelper(Plugin):
                     logging.debug(
                         f"[bt-tether] Error forcing UI update after init error: {update_error}"
                     )
+        finally:
+            self._services_ready.set()
 
     def on_unload(self, ui):
         """Cleanup when plugin is unloaded"""
@@ -1656,6 +2103,8 @@ class BTTetherHelper(Plugin):
             # waits) plus the monitor loop to stop promptly so unload is quick.
             self._cancel_connect.set()
             self._monitor_stop.set()
+            self._wake_monitor()
+            self._internet_test_stop.set()
 
             if self._monitor_thread and self._monitor_thread.is_alive():
                 self._monitor_thread.join(timeout=self.SUBPROCESS_TIMEOUT_STANDARD)
@@ -1702,15 +2151,14 @@ class BTTetherHelper(Plugin):
 
             # Reap any lingering bluetoothctl children (scan/monitor) we own.
             try:
-                subprocess.run(
-                    ["pkill", "-9", "bluetoothctl"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=self.SUBPROCESS_TIMEOUT_MEDIUM,
-                )
+                self._kill_bluetoothctl()
             except Exception as e:
                 logging.debug(f"[bt-tether] bluetoothctl cleanup on unload failed: {e}")
 
+            self._web_executor.shutdown(wait=False)
+            self._connect_executor.shutdown(wait=False)
+            self._stop_bluez_watch()
+
             self._log("INFO", "Plugin unloaded successfully")
         except Exception as e:
             logging.error(f"[bt-tether] Error during unload: {e}")
@@ -1728,14 +2176,111 @@ class BTTetherHelper(Plugin):
         else:
             logging.info(full_message)
 
+        # time.strftime formats straight from a struct_time, no datetime object
+        timestamp = time.strftime("%H:%M:%S")
         with self._ui_log_lock:
-            self._ui_logs.append(
-                {
-                    "timestamp": datetime.datetime.now().strftime("%H:%M:%S"),
-                    "level": level_upper,
-                    "message": message,
-                }
-            )
+            seq = self._ui_log_seq + 1
+            self._ui_logs[seq % self.UI_LOG_MAXLEN] = {
+                "id": seq,
+                "timestamp": timestamp,
+                "level": level_upper,
+                "message": message,
+            }
+            # Publish the new id only after its slot is filled
+            self._ui_log_seq = seq
+        self._notify_web_clients()
+
+    def _get_ui_logs_since(self, since):
+        """Return (entries newer than id `since` oldest first, newest id).
+
+        Lock-free: the newest id is published only after its slot is written,
+        and a slot a concurrent writer has already reused is spotted by its id
+        and skipped.
+        """
+        last = self._ui_log_seq
+        logs = []
+        for log_id in range(max(since, last - self.UI_LOG_MAXLEN) + 1, last + 1):
+            entry = self._ui_logs[log_id % self.UI_LOG_MAXLEN]
+            if entry is not None and entry["id"] == log_id:
+                logs.append(entry)
+        return logs, last
+
+    def _notify_web_clients(self):
+        """Wake any open /events streams so web UIs refresh right away"""
+        with self._web_event_cond:
+            self._web_event_seq += 1
+            self._web_event_cond.notify_all()
+
+    def _web_event_stream(self, since=0):
+        """Yield a Server-Sent Event each time plugin state or logs change.
+
+        UI log entries newer than id `since` go out as "log" events carrying the
+        entry itself, with its id as the event id so a reconnecting EventSource
+        resumes via Last-Event-ID. Any change is also announced with a plain
+        message that tells the page to refresh its status.
+
+        Idle streams only send a keep-alive comment every WEB_EVENTS_HEARTBEAT
+        seconds, and end after WEB_EVENTS_MAX_AGE so a vanished client only ties
+        up a server thread for a bounded time.
+        """
+        deadline = time.monotonic() + self.WEB_EVENTS_MAX_AGE
+        with self._web_event_cond:
+            seen = self._web_event_seq
+        if since > self._ui_log_seq:
+            since = 0  # Plugin was reloaded and its log ids restarted
+        yield "retry: 3000\n\n"
+        while True:
+            logs, last = self._get_ui_logs_since(since)
+            for entry in logs:
+                yield f"id: {entry['id']}\nevent: log\ndata: {json.dumps(entry)}\n\n"
+            since = max(since, last)
+            if time.monotonic() >= deadline or self._monitor_stop.is_set():
+                return
+            with self._web_event_cond:
+                self._web_event_cond.wait_for(
+                    lambda: self._web_event_seq != seen,
+                    timeout=self.WEB_EVENTS_HEARTBEAT,
+                )
+                seq = self._web_event_seq
+            if seq != seen:
+                seen = seq
+                yield f"data: {seq}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+
+    def _scan_event_stream(self):
+        """Yield each device found by the current scan as a Server-Sent Event.
+
+        Devices already known when the stream opens are sent first, then new ones
+        as they are discovered. A final "done" event carries the device count once
+        the scan finishes.
+        """
+        deadline = time.monotonic() + self.WEB_EVENTS_MAX_AGE
+        sent = set()
+        yield "retry: 3000\n\n"
+        while time.monotonic() < deadline and not self._monitor_stop.is_set():
+            with self._web_event_cond:
+                seen = self._web_event_seq
+            with self.lock:
+                devices = [
+                    device
+                    for mac, device in self._discovered_devices.items()
+                    if mac not in sent
+                ]
+                scanning = self._scanning
+            for device in devices:
+                sent.add(device["mac"])
+                yield f"data: {json.dumps(device)}\n\n"
+            if not scanning:
+                yield f"event: done\ndata: {len(sent)}\n\n"
+                return
+            with self._web_event_cond:
+                changed = self._web_event_cond.wait_for(
+                    lambda: self._web_event_seq != seen,
+                    timeout=self.WEB_EVENTS_HEARTBEAT,
+                )
+            if not changed:
+                yield ": keep-alive\n\n"
 
     @property
     def status(self):
@@ -1744,6 +2289,7 @@ class BTTetherHelper(Plugin):
     @status.setter
     def status(self, value):
         self._status = value
+        self._notify_web_clients()
 
     @property
     def message(self):
@@ -1752,6 +2298,7 @@ class BTTetherHelper(Plugin):
     @message.setter
     def message(self, value):
         self._message = value
+        self._notify_web_clients()
 
     def _set_state(self, status, message, **kwargs):
         """Update plugin state atomically under lock and trigger screen refresh.
@@ -1841,11 +2388,13 @@ class BTTetherHelper(Plugin):
 
             if initializing:
                 logging.debug(
-                    f"[bt-tether] on_ui_update() - initializing flag is TRUE, screen_needs_refresh={screen_needs_refresh}"
+                    "[bt-tether] on_ui_update() - initializing flag is TRUE, screen_needs_refresh=%s",
+                    screen_needs_refresh,
                 )
             else:
                 logging.debug(
-                    f"[bt-tether] on_ui_update() - initializing flag is FALSE, will show status: {status_str}"
+                    "[bt-tether] on_ui_update() - initializing flag is FALSE, will show status: %s",
+                    status_str,
                 )
 
             with self._cached_ui_status_lock:
@@ -2071,21 +2620,20 @@ class BTTetherHelper(Plugin):
                 if target_mac:
                     status = self._get_current_status(target_mac)
                 else:
-                    status = {
-                        "paired": False,
-                        "trusted": False,
-                        "connected": False,
-                        "pan_active": False,
-                        "interface": None,
-                        "ip_address": None,
-                    }
+                    status = self.DISCONNECTED_STATUS
 
             with self._cached_ui_status_lock:
+                changed = self._cached_ui_status != status
                 self._cached_ui_status = status.copy()
 
             with self.lock:
                 self._screen_needs_refresh = True
 
+            if changed:
+                # Drop the status cache so the next poll sees the change
+                self._invalidate_status_cache()
+                self._notify_web_clients()
+
         except Exception as e:
             logging.debug(f"[bt-tether] Failed to update cached UI status: {e}")
 
@@ -2103,12 +2651,6 @@ agent KeyboardDisplay
 default-agent
 """
 
-            env = dict(os.environ)
-            env["NO_COLOR"] = "1"
-            env["TERM"] = "dumb"
-
-            import tempfile
-
             self.agent_log_fd, self.agent_log_path = tempfile.mkstemp(
                 prefix="bt-agent-", suffix=".log"
             )
@@ -2119,11 +2661,16 @@ default-agent
             self.agent_process = subprocess.Popen(
                 ["bluetoothctl"],
                 stdin=subprocess.PIPE,
-                stdout=self.agent_log_fd,
-                stderr=self.agent_log_fd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=False,
-                env=env,
+                env=self._btctl_env,
             )
+            threading.Thread(
+                target=self._pump_agent_output,
+                args=(self.agent_process,),
+                daemon=True,
+            ).start()
 
             try:
                 self.agent_process.stdin.write(agent_commands.encode())
@@ -2156,6 +2703,40 @@ default-agent
                     pass
                 self.agent_log_path = None
 
+    def _pump_agent_output(self, process):
+        """Copy agent output to the agent log and hand each line to passkey monitors.
+
+        Blocks reading the agent's pipe, so it costs nothing while the agent is
+        quiet, and ends when the agent exits. Reads raw chunks rather than
+        lines: prompts such as "Confirm passkey ... (yes/no): " carry no
+        newline, so a pending tail that ends like a prompt is handed on as is.
+        """
+        fd = process.stdout.fileno()
+        pending = b""
+        try:
+            while True:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    break
+                try:
+                    os.write(self.agent_log_fd, chunk)
+                except (OSError, TypeError):
+                    pass  # Log file already closed by on_unload
+                *complete, pending = (pending + chunk).split(b"\n")
+                if pending.endswith(self.AGENT_PROMPT_ENDINGS):
+                    # A question (": ") stays outstanding until it is answered
+                    # or the shell prompt ("# ") comes back
+                    self._agent_prompt_pending = pending.endswith(b": ")
+                    complete.append(pending)
+                    pending = b""
+                if complete:
+                    with self._agent_line_lock:
+                        for lines in self._agent_line_queues:
+                            for line in complete:
+                                lines.put(line)
+        except Exception as e:
+            logging.debug(f"[bt-tether] Agent output reader stopped: {e}")
+
     def _start_monitoring_thread(self):
         """Start background thread to monitor connection and auto-reconnect if dropped"""
         try:
@@ -2205,7 +2786,17 @@ default-agent
                 if self._disconnected_cycles <= self.RECONNECT_FAST_CYCLES
                 else self.reconnect_interval
             )
-        self._monitor_stop.wait(interval)
+        self._monitor_wake.wait(interval)
+        self._monitor_wake.clear()
+
+    def _wake_monitor(self):
+        """Run the next monitor cycle now instead of after its current wait.
+
+        Used on shutdown and when a connect attempt finishes, so the monitor
+        picks up the new link state right away rather than up to
+        reconnect_interval later.
+        """
+        self._monitor_wake.set()
 
     def _connection_monitor_loop(self):
         """Background loop to monitor connection status and reconnect if needed"""
@@ -2246,7 +2837,7 @@ default-agent
                         f"[bt-tether] Monitor resumed - found device: {device_name}"
                     )
 
-                status = self._get_full_connection_status(current_mac)
+                status = self._get_status_cached(current_mac)
                 self._update_cached_ui_status(status=status, mac=current_mac)
 
                 if not status["connected"]:
@@ -2269,7 +2860,7 @@ default-agent
                     # Guard against a single transient bad read (e.g. a momentary
                     # bluetoothctl timeout) flapping the link. Re-check once before
                     # declaring a real drop and emitting a disconnect event.
-                    confirm = self._get_full_connection_status(current_mac)
+                    confirm = self._get_status_cached(current_mac, max_age=0)
                     if confirm.get("connected"):
                         self._log(
                             "DEBUG",
@@ -2324,7 +2915,7 @@ default-agent
                         self._screen_needs_refresh = True
 
                     # Attempt to reconnect to this device
-                    success = self._reconnect_device()
+                    success = self._reconnect_on_worker()
 
                     if success:
                         # Update phone_mac to the device we successfully connected to
@@ -2404,7 +2995,7 @@ default-agent
                     # This ensures the UI shows the transition through the connecting state
                     self._update_cached_ui_status(status=status, mac=current_mac)
 
-                    success = self._reconnect_device()
+                    success = self._reconnect_on_worker()
 
                     if success:
                         # Reset failure counter on successful connection
@@ -2462,7 +3053,9 @@ default-agent
                     self._reconnect_failure_count = 0
                     self._first_failure_time = None
                     logging.debug(
-                        f"[bt-tether] Device not ready for auto-reconnect (paired={status['paired']}, trusted={status['trusted']})"
+                        "[bt-tether] Device not ready for auto-reconnect (paired=%s, trusted=%s)",
+                        status["paired"],
+                        status["trusted"],
                     )
 
             except Exception as e:
@@ -2510,21 +3103,22 @@ default-agent
 
             self._log("INFO", f"Reconnecting to {mac}...")
 
-            # Check if device is blocked
-            devices_output = self._run_cmd(
-                ["bluetoothctl", "devices", "Blocked"],
-                capture=True,
-                timeout=self.SUBPROCESS_TIMEOUT_STANDARD,
-            )
-            if devices_output and devices_output != "Timeout" and mac in devices_output:
-                self._log("INFO", f"Unblocking device {mac}...")
-                self._run_cmd(["bluetoothctl", "unblock", mac], capture=True)
-                time.sleep(self.DEVICE_OPERATION_DELAY)
+            # Unblock and trust straight through BlueZ's Device1 properties.
+            # Writing a property that already has the value is a no-op, so there
+            # is no need to list blocked devices first.
+            self._log("INFO", "Ensuring device is unblocked and trusted...")
+            if (
+                self._dbus_set_device_property(mac, "Blocked", False) is None
+                or self._dbus_set_device_property(mac, "Trusted", True) is None
+            ):
+                # Unblocking a device that isn't blocked is a no-op too, so skip
+                # listing the blocked devices first. _send_btctl waits for the
+                # reply, so no settle delay is needed.
+                self._send_btctl(f"unblock {mac}")
 
-            # Trust the device
-            self._log("INFO", f"Ensuring device is trusted...")
-            self._run_cmd(["bluetoothctl", "trust", mac], capture=True)
-            time.sleep(self.DEVICE_OPERATION_DELAY)
+                # Trust the device
+                self._send_btctl(f"trust {mac}")
+                time.sleep(self.DEVICE_OPERATION_DELAY)
 
             # Try NAP connection (this will also establish Bluetooth connection if needed)
             self._log("INFO", f"Attempting NAP connection...")
@@ -2541,7 +3135,7 @@ default-agent
                     self._log("INFO", f"✓ PAN interface active: {iface}")
 
                     # Setup network with DHCP
-                    if self._setup_network_dhcp(iface):
+                    if self._setup_network_dhcp(iface, mac):
                         self._log("INFO", f"✓ Network setup successful")
 
                     # Wait (poll) for the DHCP lease, then verify internet
@@ -2657,411 +3251,590 @@ default-agent
                     self._connection_in_progress = False
 
     def _monitor_agent_log_for_passkey(self, passkey_found_event):
-        """Monitor agent log file for passkey display in real-time and auto-confirm"""
-        try:
-            import time
+        """Watch agent output for a passkey display in real-time and auto-confirm.
 
+        Stops once passkey_found_event is set - by this monitor when it sees the
+        passkey, or by the pairing attempt when it ends.
+        """
+        lines = queue.Queue()
+        with self._agent_line_lock:
+            self._agent_line_queues.add(lines)
+        try:
             logging.info("[bt-tether] Monitoring agent log for passkey...")
 
-            # Tail the agent log file
-            with open(self.agent_log_path, "r") as f:
-                # Seek to end of file
-                f.seek(0, 2)
-
-                # Monitor for configured timeout
-                start_time = time.time()
-                last_prompt = None
-                while time.time() - start_time < self.AGENT_LOG_MONITOR_TIMEOUT:
-                    # Exit early if passkey found
-                    if passkey_found_event.is_set():
-                        logging.info("[bt-tether] Passkey found, stopping log monitor")
-                        break
+            # Monitor for configured timeout
+            deadline = time.monotonic() + self.AGENT_LOG_MONITOR_TIMEOUT
+            last_prompt = None
+            found = False
+            while not passkey_found_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._log(
+                        "INFO",
+                        f"Agent log monitoring timeout ({self.AGENT_LOG_MONITOR_TIMEOUT}s)",
+                    )
+                    break
+                # Block until the agent prints a line, waking now and then to
+                # notice the pairing attempt has ended
+                try:
+                    line = lines.get(
+                        timeout=min(remaining, self.AGENT_LOG_MONITOR_POLL)
+                    )
+                except queue.Empty:
+                    continue
+                clean_line = self._strip_ansi_codes(
+                    line.decode(errors="replace").strip()
+                )
+                if clean_line:
+                    # Look for passkey or confirmation request
+                    if (
+                        "passkey" in clean_line.lower()
+                        or "confirm passkey" in clean_line.lower()
+                    ):
+                        # Extract passkey number (usually 6 digits)
 
-                    line = f.readline()
-                    if line:
-                        clean_line = self._strip_ansi_codes(line.strip())
-                        if clean_line:
-                            # Look for passkey or confirmation request
-                            if (
-                                "passkey" in clean_line.lower()
-                                or "confirm passkey" in clean_line.lower()
-                            ):
-                                # Extract passkey number (usually 6 digits)
+                        passkey_match = self.PASSKEY_PATTERN.search(clean_line)
+                        if passkey_match:
+                            self.current_passkey = passkey_match.group(1)
+                            self._log(
+                                "WARNING",
+                                f"🔑 PASSKEY: {self.current_passkey} - Confirm on phone!",
+                            )
+                            logging.info(
+                                f"[bt-tether] 🔑 PASSKEY: {self.current_passkey} captured from agent log"
+                            )
 
-                                passkey_match = re.search(
-                                    r"passkey\s+(\d{6})", clean_line, re.IGNORECASE
-                                )
-                                if passkey_match:
-                                    self.current_passkey = passkey_match.group(1)
+                            # Update status message so it shows prominently in web UI
+                            with self.lock:
+                                self.status = self.STATE_PAIRING
+                                self.message = f"🔑 PASSKEY: {self.current_passkey}\n\nVerify this matches on your phone, then tap PAIR!"
+
+                            # Auto-confirm passkey on Pwnagotchi side
+                            if self.agent_process and self.agent_process.poll() is None:
+                                try:
                                     self._log(
-                                        "WARNING",
-                                        f"🔑 PASSKEY: {self.current_passkey} - Confirm on phone!",
-                                    )
-                                    logging.info(
-                                        f"[bt-tether] 🔑 PASSKEY: {self.current_passkey} captured from agent log"
+                                        "INFO",
+                                        "✅ Auto-confirming on Pwnagotchi & waiting for phone...",
                                     )
-
-                                    # Update status message so it shows prominently in web UI
-                                    with self.lock:
-                                        self.status = self.STATE_PAIRING
-                                        self.message = f"🔑 PASSKEY: {self.current_passkey}\n\nVerify this matches on your phone, then tap PAIR!"
-
-                                    # Auto-confirm passkey on Pwnagotchi side
                                     if (
-                                        self.agent_process
-                                        and self.agent_process.poll() is None
+                                        self.agent_process.stdin
+                                        and not self.agent_process.stdin.closed
                                     ):
-                                        try:
-                                            self._log(
-                                                "INFO",
-                                                "✅ Auto-confirming on Pwnagotchi & waiting for phone...",
-                                            )
-                                            if (
-                                                self.agent_process.stdin
-                                                and not self.agent_process.stdin.closed
-                                            ):
-                                                self.agent_process.stdin.write(b"yes\n")
-                                                self.agent_process.stdin.flush()
-                                        except Exception as confirm_err:
-                                            logging.error(
-                                                f"[bt-tether] Failed to auto-confirm: {confirm_err}"
-                                            )
-
-                                passkey_found_event.set()
-                            elif "request confirmation" in clean_line.lower():
-                                self._log("INFO", f"📱 {clean_line}")
-                            elif clean_line.endswith("#"):
-                                # Only log prompt changes to reduce spam
-                                if clean_line != last_prompt:
-                                    last_prompt = clean_line
-                                    logging.debug(f"[bt-tether] Prompt: {clean_line}")
-                            elif not clean_line.startswith("[CHG]"):
-                                # Log other important output at debug level
-                                logging.debug(f"[bt-tether] Agent: {clean_line}")
-                    else:
-                        # No new data, sleep briefly
-                        time.sleep(self.DBUS_OPERATION_RETRY_DELAY)
+                                        self.agent_process.stdin.write(b"yes\n")
+                                        self.agent_process.stdin.flush()
+                                        self._agent_prompt_pending = False
+                                except Exception as confirm_err:
+                                    logging.error(
+                                        f"[bt-tether] Failed to auto-confirm: {confirm_err}"
+                                    )
 
-            self._log(
-                "INFO",
-                f"Agent log monitoring timeout ({self.AGENT_LOG_MONITOR_TIMEOUT}s)",
-            )
+                        found = True
+                        passkey_found_event.set()
+                    elif "request confirmation" in clean_line.lower():
+                        self._log("INFO", f"📱 {clean_line}")
+                    elif clean_line.endswith("#"):
+                        # Only log prompt changes to reduce spam
+                        if clean_line != last_prompt:
+                            last_prompt = clean_line
+                            logging.debug("[bt-tether] Prompt: %s", clean_line)
+                    elif not clean_line.startswith("[CHG]"):
+                        # Log other important output at debug level
+                        logging.debug("[bt-tether] Agent: %s", clean_line)
+
+            if found:
+                logging.info("[bt-tether] Passkey found, stopping log monitor")
         except Exception as e:
             self._log("ERROR", f"Error monitoring agent log: {e}")
+        finally:
+            with self._agent_line_lock:
+                self._agent_line_queues.discard(lines)
 
     def on_webhook(self, path, request):
         try:
             # Normalize path by stripping leading slash
             clean_path = path.lstrip("/") if path else ""
 
-            if not clean_path:
-                with self.lock:
-                    return render_template_string(
-                        HTML_TEMPLATE,
-                        mac=self.phone_mac,
-                        status=self.status,
-                        message=self.message,
-                        version=self.__version__,
-                    )
+            # Don't race the background bluetooth restart / agent startup
+            if clean_path in self.WEB_BLUETOOTH_ROUTES and not (
+                self._services_ready.wait(timeout=self.SERVICES_READY_TIMEOUT)
+            ):
+                return (
+                    jsonify(
+                        {
+                            "success": False,
+                            "message": "Bluetooth is still initializing, try again shortly",
+                        }
+                    ),
+                    503,
+                )
 
-            if clean_path == "trusted-devices":
-                devices = self._get_trusted_devices()
-                return jsonify({"devices": devices})
+            handler = self._web_routes.get(clean_path)
+            if handler is not None:
+                return handler(request)
+            if clean_path.startswith("static/"):
+                return self._route_static(request, clean_path[len("static/") :])
 
-            if clean_path == "connect":
-                mac = request.args.get("mac", "").strip().upper()
+            return "Not Found", 404
+        except Exception as e:
+            logging.error(f"[bt-tether] Webhook error: {e}")
+            return "Error", 500
 
-                # If MAC provided, use it; otherwise find best device automatically
-                if mac and self._validate_mac(mac):
-                    with self.lock:
-                        self.phone_mac = mac
-                        self.options["mac"] = self.phone_mac
-                    self.start_connection()
-                    # Force immediate screen update to show connecting state
-                    if self._ui_reference:
-                        try:
-                            self.on_ui_update(self._ui_reference)
-                        except Exception as e:
-                            logging.debug(
-                                f"[bt-tether] Error forcing UI update on connect: {e}"
-                            )
-                    return jsonify(
-                        {"success": True, "message": f"Connection started to {mac}"}
+    def _route_index(self, request):
+        """Serve the web UI page (gzipped, revalidated via ETag)"""
+        etag, html, html_gz = self._get_index_page()
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        elif "gzip" in request.accept_encodings:
+            response = Response(html_gz, mimetype="text/html")
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = Response(html, mimetype="text/html")
+        # Revalidate every load (cheap 304) so a plugin update is never
+        # hidden behind a stale cached page.
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    def _route_static(self, request, name):
+        """Serve a content-hashed STATIC_CSS / STATIC_JS asset"""
+        asset = self._get_static_assets().get(name)
+        if asset is None:
+            return "Not Found", 404
+        mimetype, body, body_gz = asset
+        if "gzip" in request.accept_encodings:
+            response = Response(body_gz, mimetype=mimetype)
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = Response(body, mimetype=mimetype)
+        # Content-hashed names: safe to cache for good
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    def _route_trusted_devices(self, request):
+        """List paired and trusted devices"""
+        devices = self._get_trusted_devices()
+        return jsonify({"devices": devices})
+
+    def _route_connect(self, request):
+        """Connect to ?mac=, or to the best trusted device when none is given"""
+        mac = request.args.get("mac", "").strip().upper()
+
+        # If MAC provided, use it; otherwise find best device automatically
+        if mac and self._validate_mac(mac):
+            with self.lock:
+                self.phone_mac = mac
+                self.options["mac"] = self.phone_mac
+            if not self.start_connection():
+                return jsonify({"success": False, "message": self.message})
+            # Force immediate screen update to show connecting state
+            if self._ui_reference:
+                try:
+                    self.on_ui_update(self._ui_reference)
+                except Exception as e:
+                    logging.debug(
+                        f"[bt-tether] Error forcing UI update on connect: {e}"
                     )
-                else:
-                    # No MAC or invalid MAC - use smart device selection
-                    best_device = self._find_best_device_to_connect()
-                    if best_device:
-                        with self.lock:
-                            self.phone_mac = best_device["mac"]
-                            self.options["mac"] = self.phone_mac
-                        self.start_connection()
-                        # Force immediate screen update to show connecting state
-                        if self._ui_reference:
-                            try:
-                                self.on_ui_update(self._ui_reference)
-                            except Exception as e:
-                                logging.debug(
-                                    f"[bt-tether] Error forcing UI update on connect: {e}"
-                                )
-                        return jsonify(
-                            {
-                                "success": True,
-                                "message": f"Connection started to {best_device['name']} ({best_device['mac']})",
-                            }
-                        )
-                    else:
-                        return jsonify(
-                            {
-                                "success": False,
-                                "message": "No suitable devices found - pair a device first or set MAC address",
-                            }
+            return jsonify({"success": True, "message": f"Connection started to {mac}"})
+        else:
+            # No MAC or invalid MAC - use smart device selection
+            best_device = self._find_best_device_to_connect()
+            if best_device:
+                with self.lock:
+                    self.phone_mac = best_device["mac"]
+                    self.options["mac"] = self.phone_mac
+                if not self.start_connection():
+                    return jsonify({"success": False, "message": self.message})
+                # Force immediate screen update to show connecting state
+                if self._ui_reference:
+                    try:
+                        self.on_ui_update(self._ui_reference)
+                    except Exception as e:
+                        logging.debug(
+                            f"[bt-tether] Error forcing UI update on connect: {e}"
                         )
-
-            if clean_path == "pair-device":
-                mac = request.args.get("mac", "").strip().upper()
-                if mac and self._validate_mac(mac):
-                    with self.lock:
-                        self.phone_mac = mac
-                        self.options["mac"] = self.phone_mac
-
-                        # Check if connection is already in progress
-                        if self._connection_in_progress:
-                            return jsonify(
-                                {
-                                    "success": False,
-                                    "message": "Connection already in progress",
-                                }
-                            )
-
-                        # Stop any ongoing background scan and set connection in progress
-                        self._stop_scan = True
-                        self._scanning = False
-                        self._connection_in_progress = True
-                        self._connection_start_time = time.time()
-                        self._user_requested_disconnect = False
-                        self._screen_needs_refresh = True
-
-                    # Reset failure counter
-                    self._reconnect_failure_count = 0
-
-                    # Unpause monitor
-                    self._monitor_paused.clear()
-
-                    # Create device info for unpaired device (will be paired during connection)
-                    device_info = {
-                        "mac": mac,
-                        "name": request.args.get("name", "Unknown Device"),
-                        "paired": False,
-                        "trusted": False,
-                        "connected": False,
-                        "has_nap": True,  # Assume it has NAP, will be verified during connection
+                return jsonify(
+                    {
+                        "success": True,
+                        "message": f"Connection started to {best_device['name']} ({best_device['mac']})",
                     }
+                )
+            else:
+                return jsonify(
+                    {
+                        "success": False,
+                        "message": "No suitable devices found - pair a device first or set MAC address",
+                    }
+                )
 
-                    # Start connection thread directly with device info
-                    threading.Thread(
-                        target=self._connect_thread, args=(device_info,), daemon=True
-                    ).start()
-
-                    # Force immediate screen update to show pairing state
-                    if self._ui_reference:
-                        self.on_ui_update(self._ui_reference)
-
-                    return jsonify(
-                        {"success": True, "message": f"Pairing started with {mac}"}
-                    )
-                else:
-                    return jsonify({"success": False, "message": "Invalid MAC address"})
+    def _route_pair_device(self, request):
+        """Pair, trust and connect to a not yet paired ?mac="""
+        mac = request.args.get("mac", "").strip().upper()
+        if mac and self._validate_mac(mac):
+            with self.lock:
+                self.phone_mac = mac
+                self.options["mac"] = self.phone_mac
 
-            if clean_path == "status":
-                # Surface auto-reconnect cooldown so the UI can show a countdown
-                paused = (
-                    self._reconnect_failure_count >= self._max_reconnect_failures
-                )
-                cooldown_remaining = 0
-                if paused and self._first_failure_time:
-                    elapsed = time.time() - self._first_failure_time
-                    cooldown_remaining = max(
-                        0, int(self._reconnect_failure_cooldown - elapsed)
-                    )
-                with self.lock:
+                # Check if connection is already in progress
+                if self._connection_in_progress:
                     return jsonify(
                         {
-                            "status": self.status,
-                            "message": self.message,
-                            "mac": self.phone_mac,
-                            "disconnecting": self._disconnecting,
-                            "untrusting": self._untrusting,
-                            "initializing": self._initializing,
-                            "connection_in_progress": self._connection_in_progress,
-                            "reconnect_paused": paused,
-                            "cooldown_remaining": cooldown_remaining,
-                            "failure_count": self._reconnect_failure_count,
-                            "phone_tethering_off": self._phone_tethering_off,
-                            "bt_stuck": self._bt_stuck,
+                            "success": False,
+                            "message": "Connection already in progress",
                         }
                     )
 
-            if clean_path == "disconnect":
-                mac = request.args.get("mac", "").strip().upper()
-                if mac and self._validate_mac(mac):
-                    # Set flags immediately so UI shows disconnecting state
-                    with self.lock:
-                        self._user_requested_disconnect = True
-                        self._disconnecting = True
-                        self._disconnect_start_time = (
-                            time.time()
-                        )  # Track when disconnect started
-                        self._screen_needs_refresh = True
+                # Stop any ongoing background scan and set connection in progress
+                self._stop_scan = True
+                self._scanning = False
+                self._connection_in_progress = True
+                self._connection_start_time = time.time()
+                self._user_requested_disconnect = False
+                self._screen_needs_refresh = True
 
-                    # Run disconnect in background thread so UI can update
-                    def do_disconnect():
-                        try:
-                            # Return value intentionally ignored - state is communicated via flags
-                            self._disconnect_device(mac)
-                        except Exception as e:
-                            logging.error(
-                                f"[bt-tether] Background disconnect error: {e}"
-                            )
-                            # Ensure flags are cleared even on error
-                            with self.lock:
-                                self._disconnecting = False
-                                self._connection_in_progress = False
+            # Reset failure counter
+            self._reconnect_failure_count = 0
 
-                    thread = threading.Thread(target=do_disconnect, daemon=True)
-                    thread.start()
+            # Unpause monitor
+            self._monitor_paused.clear()
 
-                    # Force immediate screen update by calling on_ui_update if UI reference available
-                    if self._ui_reference:
-                        try:
-                            self.on_ui_update(self._ui_reference)
-                        except Exception as e:
-                            logging.debug(
-                                f"[bt-tether] Error forcing UI update on disconnect: {e}"
-                            )
+            # Create device info for unpaired device (will be paired during connection)
+            device_info = {
+                "mac": mac,
+                "name": request.args.get("name", "Unknown Device"),
+                "paired": False,
+                "trusted": False,
+                "connected": False,
+                "has_nap": True,  # Assume it has NAP, will be verified during connection
+            }
 
-                    # Return immediately so pwnagotchi UI can refresh
-                    return jsonify({"success": True, "message": "Disconnect started"})
-                else:
-                    return jsonify({"success": False, "message": "Invalid MAC"})
+            # Queue the connection attempt directly with device info
+            self._submit_connect(self._connect_thread, device_info)
 
-            if clean_path == "unpair":
-                mac = request.args.get("mac", "").strip().upper()
-                if mac and self._validate_mac(mac):
-                    result = self._unpair_device(mac)
-                    return jsonify(result)
-                else:
-                    return jsonify({"success": False, "message": "Invalid MAC"})
+            # Force immediate screen update to show pairing state
+            if self._ui_reference:
+                self.on_ui_update(self._ui_reference)
 
-            if clean_path == "pair-status":
-                mac = request.args.get("mac", "").strip().upper()
-                if mac and self._validate_mac(mac):
-                    status = self._check_pair_status(mac)
-                    return jsonify(status)
-                else:
-                    return jsonify({"paired": False, "connected": False})
+            return jsonify({"success": True, "message": f"Pairing started with {mac}"})
+        else:
+            return jsonify({"success": False, "message": "Invalid MAC address"})
 
-            if clean_path == "scan":
-                with self.lock:
-                    # If already scanning, return current real-time results
-                    if self._scanning:
-                        devices_to_return = list(self._discovered_devices.values())
-                        return jsonify({"devices": devices_to_return, "scanning": True})
-
-                    # Clear state for a fresh scan
-                    self._last_scan_devices = []
-                    self._discovered_devices = {}
-                    self._scan_complete_time = 0
-                    self._scanning = True
-                    self._screen_needs_refresh = True
+    def _route_status(self, request):
+        """Plugin status for the web UI"""
+        return jsonify(self._get_web_status())
 
-                # Run scan in background thread
-                def run_scan_bg():
-                    try:
-                        devices = self._scan_devices()
-                        with self.lock:
-                            self._last_scan_devices = devices
-                            # Rebuild _discovered_devices from final list
-                            self._discovered_devices = {
-                                device["mac"]: device for device in devices
-                            }
-                            self._scan_complete_time = time.time()
-                            self._scanning = False  # Mark scan as complete
-                        logging.info(
-                            f"[bt-tether] Scan complete, found {len(devices)} devices"
-                        )
-                    except Exception as e:
-                        logging.error(f"[bt-tether] Background scan error: {e}")
-                        with self.lock:
-                            self._scanning = False  # Clear flag even on error
+    def _route_disconnect(self, request):
+        """Disconnect ?mac= in the background"""
+        mac = request.args.get("mac", "").strip().upper()
+        if mac and self._validate_mac(mac):
+            # Set flags immediately so UI shows disconnecting state
+            with self.lock:
+                self._user_requested_disconnect = True
+                self._disconnecting = True
+                self._disconnect_start_time = (
+                    time.time()
+                )  # Track when disconnect started
+                self._screen_needs_refresh = True
 
-                thread = threading.Thread(target=run_scan_bg, daemon=True)
-                thread.start()
+            # Run disconnect in background thread so UI can update
+            def do_disconnect():
+                try:
+                    # Return value intentionally ignored - state is communicated via flags
+                    self._disconnect_device(mac)
+                except Exception as e:
+                    logging.error(f"[bt-tether] Background disconnect error: {e}")
+                    # Ensure flags are cleared even on error
+                    with self.lock:
+                        self._disconnecting = False
+                        self._connection_in_progress = False
 
-                if self._ui_reference:
-                    try:
-                        self.on_ui_update(self._ui_reference)
-                    except Exception as e:
-                        logging.debug(f"[bt-tether] Error forcing UI update: {e}")
+            thread = threading.Thread(target=do_disconnect, daemon=True)
+            thread.start()
+
+            # Force immediate screen update by calling on_ui_update if UI reference available
+            if self._ui_reference:
+                try:
+                    self.on_ui_update(self._ui_reference)
+                except Exception as e:
+                    logging.debug(
+                        f"[bt-tether] Error forcing UI update on disconnect: {e}"
+                    )
 
-                return jsonify({"devices": [], "scanning": True})
+            # Return immediately so pwnagotchi UI can refresh
+            return jsonify({"success": True, "message": "Disconnect started"})
+        else:
+            return jsonify({"success": False, "message": "Invalid MAC"})
+
+    def _route_unpair(self, request):
+        """Remove the pairing for ?mac="""
+        mac = request.args.get("mac", "").strip().upper()
+        if mac and self._validate_mac(mac):
+            result = self._unpair_device(mac)
+            return jsonify(result)
+        else:
+            return jsonify({"success": False, "message": "Invalid MAC"})
+
+    def _route_pair_status(self, request):
+        """Paired / connected state of ?mac="""
+        mac = request.args.get("mac", "").strip().upper()
+        if mac and self._validate_mac(mac):
+            status = self._check_pair_status(mac)
+            return jsonify(status)
+        else:
+            return jsonify({"paired": False, "connected": False})
+
+    def _route_scan(self, request):
+        """Start a background scan, or return the devices found so far"""
+        with self.lock:
+            # If already scanning, return current real-time results
+            if self._scanning:
+                devices_to_return = list(self._discovered_devices.values())
+                return jsonify({"devices": devices_to_return, "scanning": True})
+
+            # Clear state for a fresh scan
+            self._last_scan_devices = []
+            self._discovered_devices = {}
+            self._scan_complete_time = 0
+            self._scanning = True
+            self._screen_needs_refresh = True
 
-            if clean_path == "scan-progress":
+        # Run scan in background thread
+        def run_scan_bg():
+            try:
+                devices = self._scan_devices()
                 with self.lock:
-                    devices = list(self._discovered_devices.values())
-                    scanning = self._scanning
-                return jsonify(
-                    {"scanning": scanning, "devices": devices, "count": len(devices)}
-                )
+                    self._last_scan_devices = devices
+                    # Rebuild _discovered_devices from final list
+                    self._discovered_devices = {
+                        device["mac"]: device for device in devices
+                    }
+                    self._scan_complete_time = time.time()
+                    self._scanning = False  # Mark scan as complete
+                self._notify_web_clients()
+                logging.info(f"[bt-tether] Scan complete, found {len(devices)} devices")
+            except Exception as e:
+                logging.error(f"[bt-tether] Background scan error: {e}")
+                with self.lock:
+                    self._scanning = False  # Clear flag even on error
+                self._notify_web_clients()
 
-            if clean_path == "connection-status":
-                mac = request.args.get("mac", "").strip().upper()
-                if mac and self._validate_mac(mac):
-                    # Serve a very recent read from cache to coalesce rapid polls
-                    now = time.time()
-                    cached = self._web_status_cache
-                    if (
-                        cached
-                        and cached.get("mac") == mac
-                        and now - self._web_status_cache_time
-                        < self.WEB_STATUS_CACHE_TTL
-                    ):
-                        return jsonify(cached["status"])
-                    status = self._get_full_connection_status(mac)
-                    self._web_status_cache = {"mac": mac, "status": status}
-                    self._web_status_cache_time = now
-                    return jsonify(status)
-                else:
-                    return jsonify(
-                        {
-                            "paired": False,
-                            "trusted": False,
-                            "connected": False,
-                            "pan_active": False,
-                            "interface": None,
-                            "ip_address": None,
-                            "default_route_interface": None,
-                        }
-                    )
+        thread = threading.Thread(target=run_scan_bg, daemon=True)
+        thread.start()
 
-            if clean_path == "test-internet":
-                result = self._test_internet_connectivity()
-                return jsonify(result)
+        if self._ui_reference:
+            try:
+                self.on_ui_update(self._ui_reference)
+            except Exception as e:
+                logging.debug(f"[bt-tether] Error forcing UI update: {e}")
 
-            if clean_path == "logs":
-                with self._ui_log_lock:
-                    logs = list(self._ui_logs)
-                return jsonify({"logs": logs})
+        return jsonify({"devices": [], "scanning": True})
 
-            return "Not Found", 404
-        except Exception as e:
-            logging.error(f"[bt-tether] Webhook error: {e}")
-            return "Error", 500
+    def _route_scan_events(self, request):
+        """Stream scan progress as server-sent events"""
+        return Response(
+            self._scan_event_stream(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    def _route_scan_progress(self, request):
+        """Devices discovered by the running scan"""
+        with self.lock:
+            devices = list(self._discovered_devices.values())
+            scanning = self._scanning
+        return jsonify(
+            {"scanning": scanning, "devices": devices, "count": len(devices)}
+        )
+
+    def _route_connection_status(self, request):
+        """Connection details for ?mac="""
+        mac = request.args.get("mac", "").strip().upper()
+        return self._etag_json_response(request, self._get_web_connection_status(mac))
+
+    def _route_full_status(self, request):
+        """/status and /connection-status in one round trip"""
+        # /status and /connection-status in one round trip. Without a
+        # valid ?mac= the plugin's current MAC is used, if any.
+        status = self._get_web_status()
+        mac = request.args.get("mac", "").strip().upper()
+        if not (mac and self._validate_mac(mac)):
+            mac = status["mac"] or ""
+        status.update(self._get_web_connection_status(mac))
+        return self._etag_json_response(request, status)
+
+    def _route_events(self, request):
+        """Stream status changes and new log entries as server-sent events"""
+        # A reconnecting EventSource reports the last log id it got
+        since = request.headers.get("Last-Event-ID", type=int)
+        if since is None:
+            since = request.args.get("since", 0, type=int)
+        return Response(
+            self._web_event_stream(since),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    def _route_test_internet(self, request):
+        """Connectivity test over the PAN interface (cached, ?force=1 re-runs it)"""
+        result, checked_at = self._get_internet_test(
+            force=request.args.get("force") == "1"
+        )
+        return jsonify(dict(result, age=int(time.time() - checked_at)))
+
+    def _route_logs(self, request):
+        """Recent UI log entries"""
+        # ?since=<id> returns only entries newer than that id
+        since = request.args.get("since", 0, type=int)
+        logs, last = self._get_ui_logs_since(since)
+        return jsonify({"logs": logs, "last": last})
+
+    def _get_web_status(self):
+        """Plugin state for the web UI (/status)"""
+        # Surface auto-reconnect cooldown so the UI can show a countdown
+        paused = self._reconnect_failure_count >= self._max_reconnect_failures
+        cooldown_remaining = 0
+        if paused and self._first_failure_time:
+            elapsed = time.time() - self._first_failure_time
+            cooldown_remaining = max(0, int(self._reconnect_failure_cooldown - elapsed))
+        with self.lock:
+            return {
+                "status": self.status,
+                "message": self.message,
+                "mac": self.phone_mac,
+                "disconnecting": self._disconnecting,
+                "untrusting": self._untrusting,
+                "initializing": self._initializing,
+                "connection_in_progress": self._connection_in_progress,
+                "reconnect_paused": paused,
+                "cooldown_remaining": cooldown_remaining,
+                "failure_count": self._reconnect_failure_count,
+                "phone_tethering_off": self._phone_tethering_off,
+                "bt_stuck": self._bt_stuck,
+            }
+
+    def _get_web_connection_status(self, mac):
+        """Device/link state for the web UI (/connection-status)"""
+        if not (mac and self._validate_mac(mac)):
+            return dict(self.DISCONNECTED_STATUS, default_route_interface=None)
+        return self._get_status_cached(mac)
+
+    def _get_status_cached(self, mac, max_age=None):
+        """_get_full_connection_status(mac), reusing a read newer than max_age.
+
+        max_age defaults to STATUS_CACHE_TTL; 0 forces a live read that still
+        refreshes the cache. A fresh entry is returned without taking the lock.
+        On a miss the lock is held across the refresh and the entry re-checked,
+        so concurrent callers share one live read instead of each running their
+        own.
+        """
+        if max_age is None:
+            max_age = self.STATUS_CACHE_TTL
+        cached = self._status_cache
+        if cached and cached[0] == mac and time.monotonic() - cached[2] < max_age:
+            return cached[1]
+        requested = time.monotonic()
+        with self._status_cache_lock:
+            # Someone else may have refreshed it while we waited for the lock
+            cached = self._status_cache
+            if cached and cached[0] == mac and cached[2] >= requested - max_age:
+                return cached[1]
+            gen = self._status_cache_gen
+            started = time.monotonic()
+            status = self._get_full_connection_status(mac)
+            with self._status_cache_write_lock:
+                # Seeded or invalidated meanwhile - our read may predate that
+                if self._status_cache_gen == gen:
+                    self._status_cache = (mac, status, started)
+            return status
+
+    def _seed_status_cache(self, mac, status):
+        """Replace the status cache with a state we already know for mac.
+
+        After a teardown the outcome is certain, so polls right after it get the
+        new state in one atomic swap instead of each forcing a live read. The
+        default route is carried over unless it went through the PAN interface.
+        """
+        with self._status_cache_write_lock:
+            cached = self._status_cache
+            route = cached[1].get("default_route_interface") if cached else None
+            if route and route.startswith(("bnep", "bt-pan")):
+                route = None
+            self._status_cache_gen += 1
+            self._status_cache = (
+                mac,
+                dict(status, default_route_interface=route),
+                time.monotonic(),
+            )
+
+    def _invalidate_status_cache(self):
+        """Make the next _get_status_cached call do a live read"""
+        with self._status_cache_write_lock:
+            self._status_cache_gen += 1
+            self._status_cache = None
+
+    def _etag_json_response(self, request, payload):
+        """JSON response with an ETag; answers 304 when the client already has it"""
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        etag = hashlib.blake2b(body.encode("utf-8"), digest_size=8).hexdigest()
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype="application/json")
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    def _get_index_page(self):
+        """Return (etag, html, gzipped html) for the web UI page.
+
+        Nothing in the page is per-request (the MAC and all live state are
+        fetched by the page's JS), so it is rendered and compressed once and
+        every later load is served from memory - or as a 304.
+        """
+        if self._html_page_cache is None:
+            if self._html_template is None:
+                self._html_template = current_app.jinja_env.from_string(HTML_TEMPLATE)
+            self._get_static_assets()
+            html = self._html_template.render(
+                version=self.__version__,
+                log_maxlen=self.UI_LOG_MAXLEN,
+                css_name=self._static_names["css"],
+                js_name=self._static_names["js"],
+            ).encode("utf-8")
+            etag = hashlib.blake2b(html, digest_size=8).hexdigest()
+            self._html_page_cache = (
+                etag,
+                html,
+                gzip.compress(html, self.HTML_GZIP_LEVEL),
+            )
+        return self._html_page_cache
+
+    def _get_static_assets(self):
+        """Return {name: (mimetype, body, gzipped body)} for the web UI assets.
+
+        Names carry a hash of the content, so a plugin update changes the URL
+        and the assets can be cached by the browser as immutable.
+        """
+        if self._static_assets is None:
+            assets = {}
+            for kind, mimetype, text in (
+                ("css", "text/css", STATIC_CSS),
+                ("js", "application/javascript", STATIC_JS),
+            ):
+                body = text.encode("utf-8")
+                digest = hashlib.blake2b(body, digest_size=6).hexdigest()
+                name = f"bt-tether.{digest}.{kind}"
+                gz = gzip.compress(body, self.HTML_GZIP_LEVEL)
+                assets[name] = (mimetype, body, gz)
+                self._static_names[kind] = name
+            self._static_assets = assets
+        return self._static_assets
 
     def _validate_mac(self, mac):
         """Validate MAC address format"""
 
-        return bool(re.match(r"^([0-9A-F]{2}:){5}[0-9A-F]{2}$", mac))
+        return bool(self.MAC_PATTERN.match(mac))
 
     def _disconnect_device(self, mac):
         """Disconnect from a Bluetooth device and remove trust to prevent auto-reconnect"""
@@ -3095,103 +3868,35 @@ default-agent
                 mac=mac,
             )
 
-            # Wait briefly for any ongoing reconnect to complete
-            time.sleep(self.OPERATION_SHORT_DELAY)
-
+            # No need to wait for an in-flight reconnect: _cancel_connect (set
+            # above) makes its bounded NAP/DHCP waits bail out on their own.
             self._log("INFO", f"Disconnecting from device {mac}...")
 
-            # FIRST: Disconnect NAP profile via DBus if connected
-            try:
-                import dbus
-
-                bus = dbus.SystemBus()
-                manager = dbus.Interface(
-                    bus.get_object("org.bluez", "/"),
-                    "org.freedesktop.DBus.ObjectManager",
-                )
-                objects = manager.GetManagedObjects()
-                device_path = None
-                for path, interfaces in objects.items():
-                    if "org.bluez.Device1" in interfaces:
-                        props = interfaces["org.bluez.Device1"]
-                        if props.get("Address") == mac:
-                            device_path = path
-                            break
-
-                if device_path:
-                    device = dbus.Interface(
-                        bus.get_object("org.bluez", device_path), "org.bluez.Device1"
-                    )
-                    try:
-                        self._log("INFO", "Disconnecting NAP profile...")
-                        device.DisconnectProfile(self.NAP_UUID)
-                        time.sleep(self.DEVICE_OPERATION_DELAY)
-                        self._log("INFO", "NAP profile disconnected")
-                    except Exception as e:
-                        logging.debug(f"[bt-tether] NAP disconnect: {e}")
-            except Exception as e:
-                logging.debug(f"[bt-tether] DBus operation: {e}")
-
-            # Disconnect the Bluetooth connection
-            self._log("INFO", "Disconnecting Bluetooth...")
-            result = self._run_cmd(["bluetoothctl", "disconnect", mac], capture=True)
-            self._log("INFO", f"Disconnect result: {result}")
-            time.sleep(self.DEVICE_OPERATION_LONGER_DELAY)
-
-            # Remove trust to prevent automatic reconnection
-            self._log("INFO", "Removing trust to prevent auto-reconnect...")
-            # Keep showing "Disconnecting" state throughout the entire cleanup process
-            # No need to switch to "Untrusting" state - it's all part of disconnect
-
-            # Update cached UI to show untrusting state
-            self._update_cached_ui_status(
-                status={
-                    "paired": True,
-                    "trusted": False,
-                    "connected": False,
-                    "pan_active": False,
-                    "interface": None,
-                    "ip_address": None,
-                },
-                mac=mac,
-            )
-
-            trust_result = self._run_cmd(["bluetoothctl", "untrust", mac], capture=True)
-            self._log("INFO", f"Untrust result: {trust_result}")
-            time.sleep(self.DEVICE_OPERATION_DELAY)
-
-            # Update cached UI status after untrust but before clearing flag
-            self._update_cached_ui_status(
-                status={
-                    "paired": True,
-                    "trusted": False,
-                    "connected": False,
-                    "pan_active": False,
-                    "interface": None,
-                    "ip_address": None,
-                },
-                mac=mac,
-            )
-
-            with self.lock:
-                # Keep disconnecting state throughout - don't switch states
-                self._disconnect_start_time = time.time()
-                self.message = f"Finalizing disconnect..."
-                self._screen_needs_refresh = True
+            # Untrust, block (prevents reconnection attempts), disconnect and
+            # remove in a single D-Bus pass
+            if self._dbus_teardown_device(mac) is None:
+                # D-Bus unavailable - fall back to bluetoothctl, step by step
+                self._log("INFO", "Disconnecting Bluetooth...")
+                result = self._send_btctl(f"disconnect {mac}")
+                self._log("INFO", f"Disconnect result: {result}")
+                time.sleep(self.DEVICE_OPERATION_LONGER_DELAY)
+
+                self._log("INFO", "Removing trust to prevent auto-reconnect...")
+                trust_result = self._send_btctl(f"untrust {mac}")
+                self._log("INFO", f"Untrust result: {trust_result}")
+                time.sleep(self.DEVICE_OPERATION_DELAY)
 
-            # Block the device BEFORE removing it to prevent reconnection attempts
-            self._log("INFO", "Blocking device to prevent reconnection...")
-            block_result = self._run_cmd(["bluetoothctl", "block", mac], capture=True)
-            self._log("INFO", f"Block result: {block_result}")
-            time.sleep(self.DEVICE_OPERATION_DELAY)
+                self._log("INFO", "Blocking device to prevent reconnection...")
+                block_result = self._send_btctl(f"block {mac}")
+                self._log("INFO", f"Block result: {block_result}")
+                time.sleep(self.DEVICE_OPERATION_DELAY)
 
-            # Unpair (remove) the device completely
-            self._log("INFO", "Removing device to unpair...")
-            remove_result = self._run_cmd(["bluetoothctl", "remove", mac], capture=True)
-            self._log("INFO", f"Remove result: {remove_result}")
-            time.sleep(
-                self.DEVICE_OPERATION_LONGER_DELAY
-            )  # Wait longer for changes to propagate
+                self._log("INFO", "Removing device to unpair...")
+                remove_result = self._send_btctl(f"remove {mac}")
+                self._log("INFO", f"Remove result: {remove_result}")
+                time.sleep(
+                    self.DEVICE_OPERATION_LONGER_DELAY
+                )  # Wait longer for changes to propagate
 
             self._log(
                 "INFO", f"Device {mac} disconnected, blocked and removed successfully"
@@ -3206,16 +3911,8 @@ default-agent
             self._emit_event("bt_tether_disconnected", event_data)
 
             # Update cached UI status to disconnected state FIRST
-            self._update_cached_ui_status(
-                status={
-                    "paired": False,
-                    "trusted": False,
-                    "connected": False,
-                    "pan_active": False,
-                    "interface": None,
-                    "ip_address": None,
-                }
-            )
+            self._update_cached_ui_status(status=self.DISCONNECTED_STATUS)
+            self._seed_status_cache(mac, self.DISCONNECTED_STATUS)
 
             # Then update internal state
             with self.lock:
@@ -3267,20 +3964,35 @@ default-agent
         """Unpair a Bluetooth device"""
         try:
             self._log("INFO", f"Unpairing device {mac}...")
-            result = self._run_cmd(
-                ["bluetoothctl", "remove", mac],
-                capture=True,
-                timeout=self.SUBPROCESS_TIMEOUT_LONG,
-            )
 
-            if result == "Timeout":
-                self._log("WARNING", "Unpair command timed out")
-                # Still consider it successful - device is likely already gone
-                return {
-                    "success": True,
-                    "message": "Device was already unpaired or removed",
-                }
-            elif result and "Device has been removed" in result:
+            # Fast path: remove straight through BlueZ's Adapter1 D-Bus API
+            removed = self._dbus_remove_device(mac)
+            if removed is None:
+                result = self._send_btctl(
+                    f"remove {mac}", timeout=self.SUBPROCESS_TIMEOUT_LONG
+                )
+
+                if result == "Timeout":
+                    self._log("WARNING", "Unpair command timed out")
+                    # Still consider it successful - device is likely already gone
+                    return {
+                        "success": True,
+                        "message": "Device was already unpaired or removed",
+                    }
+                elif result and "Device has been removed" in result:
+                    removed = True
+                elif result and (
+                    "not available" in result or "not found" in result.lower()
+                ):
+                    removed = False
+                else:
+                    self._log("WARNING", f"Unpair result: {result}")
+                    return {
+                        "success": True,
+                        "message": f"Unpair command sent: {result}",
+                    }
+
+            if removed:
                 self._log("INFO", f"Device {mac} unpaired successfully")
 
                 # Update internal state
@@ -3292,51 +4004,360 @@ default-agent
                     self.current_passkey = None
                     self._screen_needs_refresh = True
 
-                # Update cached UI status
-                self._update_cached_ui_status()
+                # Update cached UI status - a removed device is gone from BlueZ,
+                # so there is nothing to read back
+                self._update_cached_ui_status(status=self.DISCONNECTED_STATUS)
+                self._seed_status_cache(mac, self.DISCONNECTED_STATUS)
 
                 return {
                     "success": True,
                     "message": f"Device {mac} unpaired successfully",
                 }
-            elif result and (
-                "not available" in result or "not found" in result.lower()
-            ):
-                self._log("INFO", f"Device {mac} was already removed")
-                return {
-                    "success": True,
-                    "message": f"Device {mac} was already unpaired",
-                }
-            else:
-                self._log("WARNING", f"Unpair result: {result}")
-                return {"success": True, "message": f"Unpair command sent: {result}"}
+
+            self._log("INFO", f"Device {mac} was already removed")
+            return {
+                "success": True,
+                "message": f"Device {mac} was already unpaired",
+            }
         except Exception as e:
             self._log("ERROR", f"Unpair error: {e}")
             return {"success": False, "message": f"Unpair failed: {str(e)}"}
 
+    def _dbus_remove_device(self, mac):
+        """Remove a device from BlueZ via Adapter1.RemoveDevice.
+
+        Returns True if removed, False if BlueZ doesn't know the device, or None
+        if D-Bus is unavailable or the call failed so callers fall back to
+        bluetoothctl.
+        """
+        if not DBUS_AVAILABLE:
+            return None
+        try:
+            for path, interfaces in self._bluez_managed_objects().items():
+                dev = interfaces.get("org.bluez.Device1")
+                if not dev or str(dev.get("Address", "")).upper() != mac.upper():
+                    continue
+                adapter = dbus.Interface(
+                    dbus.SystemBus().get_object("org.bluez", dev["Adapter"]),
+                    "org.bluez.Adapter1",
+                )
+                adapter.RemoveDevice(path)
+                return True
+            return False
+        except Exception as e:
+            logging.debug(f"[bt-tether] D-Bus remove failed, will fall back: {e}")
+            return None
+
+    def _dbus_device_path(self, mac):
+        """Return the BlueZ object path for a device, or None if BlueZ doesn't know it.
+
+        Served from the signal-watch cache (kept current by InterfacesAdded/
+        Removed) when it is live, so no GetManagedObjects round trip is made.
+        """
+        with self._bluez_devices_lock:
+            if self._bluez_devices is not None:
+                for path, dev in self._bluez_devices.items():
+                    if str(dev.get("Address", "")).upper() == mac.upper():
+                        return path
+                return None
+        for path, interfaces in self._bluez_managed_objects().items():
+            dev = interfaces.get("org.bluez.Device1")
+            if dev and str(dev.get("Address", "")).upper() == mac.upper():
+                return path
+        return None
+
+    def _dbus_set_device_property(self, mac, prop, value):
+        """Set a boolean Device1 property (Trusted, Blocked) via D-Bus.
+
+        Returns True if set, False if BlueZ doesn't know the device, or None if
+        D-Bus is unavailable or the call failed so callers fall back to
+        bluetoothctl. Property writes are synchronous, so no settle delay is
+        needed afterwards.
+        """
+        if not DBUS_AVAILABLE:
+            return None
+        try:
+            path = self._dbus_device_path(mac)
+            if path is None:
+                return False
+            props = dbus.Interface(
+                dbus.SystemBus().get_object("org.bluez", path),
+                "org.freedesktop.DBus.Properties",
+            )
+            props.Set("org.bluez.Device1", prop, dbus.Boolean(value))
+            return True
+        except Exception as e:
+            logging.debug(f"[bt-tether] D-Bus set {prop} failed, will fall back: {e}")
+            return None
+
+    def _dbus_teardown_device(self, mac):
+        """Untrust, block, disconnect and remove a device in one D-Bus pass.
+
+        One device lookup, then back-to-back calls on the same bus connection;
+        BlueZ applies each before replying, so no settle delays are needed.
+        Same return convention as _dbus_set_device_property; a device that is
+        already disconnected or already gone counts as success.
+        """
+        if not DBUS_AVAILABLE:
+            return None
+        try:
+            for path, interfaces in self._bluez_managed_objects().items():
+                dev = interfaces.get("org.bluez.Device1")
+                if dev and str(dev.get("Address", "")).upper() == mac.upper():
+                    break
+            else:
+                return False
+            bus = dbus.SystemBus()
+            obj = bus.get_object("org.bluez", path)
+            device = dbus.Interface(obj, "org.bluez.Device1")
+            props = dbus.Interface(obj, "org.freedesktop.DBus.Properties")
+            try:
+                device.DisconnectProfile(self.NAP_UUID)
+            except dbus.exceptions.DBusException as e:
+                logging.debug(f"[bt-tether] NAP disconnect: {e}")
+            props.Set("org.bluez.Device1", "Trusted", dbus.Boolean(False))
+            props.Set("org.bluez.Device1", "Blocked", dbus.Boolean(True))
+            try:
+                device.Disconnect()
+            except dbus.exceptions.DBusException as e:
+                if e.get_dbus_name() != "org.bluez.Error.NotConnected":
+                    raise
+            adapter = dbus.Interface(
+                bus.get_object("org.bluez", dev["Adapter"]), "org.bluez.Adapter1"
+            )
+            try:
+                adapter.RemoveDevice(path)
+            except dbus.exceptions.DBusException as e:
+                if e.get_dbus_name() != "org.bluez.Error.DoesNotExist":
+                    raise
+            self._log("INFO", "Device untrusted, blocked, disconnected and removed")
+            return True
+        except Exception as e:
+            logging.debug(f"[bt-tether] D-Bus teardown failed, will fall back: {e}")
+            return None
+
+    def _dbus_disconnect_device(self, mac):
+        """Disconnect a device via Device1.Disconnect.
+
+        Same return convention as _dbus_set_device_property; a device that is
+        already disconnected counts as success.
+        """
+        if not DBUS_AVAILABLE:
+            return None
+        try:
+            path = self._dbus_device_path(mac)
+            if path is None:
+                return False
+            device = dbus.Interface(
+                dbus.SystemBus().get_object("org.bluez", path), "org.bluez.Device1"
+            )
+            device.Disconnect()
+            return True
+        except dbus.exceptions.DBusException as e:
+            if e.get_dbus_name() == "org.bluez.Error.NotConnected":
+                return True
+            logging.debug(f"[bt-tether] D-Bus disconnect failed, will fall back: {e}")
+            return None
+        except Exception as e:
+            logging.debug(f"[bt-tether] D-Bus disconnect failed, will fall back: {e}")
+            return None
+
+    def _bluez_managed_objects(self):
+        """GetManagedObjects() through a cached BlueZ ObjectManager proxy.
+
+        Building the proxy costs an extra Introspect round trip, so it is created
+        once and reused. The proxy is bound to bluetoothd's unique bus name, which
+        changes when bluetooth restarts - on failure the proxy is rebuilt and the
+        call retried once before the error propagates.
+        """
+        for attempt in range(2):
+            with self._bluez_manager_lock:
+                if self._bluez_manager is None:
+                    self._bluez_manager = dbus.Interface(
+                        dbus.SystemBus().get_object("org.bluez", "/"),
+                        "org.freedesktop.DBus.ObjectManager",
+                    )
+                manager = self._bluez_manager
+            try:
+                return manager.GetManagedObjects()
+            except dbus.exceptions.DBusException:
+                with self._bluez_manager_lock:
+                    self._bluez_manager = None
+                if attempt:
+                    raise
+
+    def _start_bluez_watch(self):
+        """Keep self._bluez_devices current from BlueZ signals instead of polling.
+
+        A private system bus connection is driven by a GLib main loop on its own
+        thread. InterfacesAdded/Removed and PropertiesChanged update the cached
+        Device1 properties, so status reads become dict lookups rather than a
+        GetManagedObjects round trip each. bluetoothd restarts are followed via
+        its bus name owner, which reloads the whole set.
+        """
+        if not DBUS_SIGNALS_AVAILABLE or self._bluez_watch_loop is not None:
+            return
+        try:
+            bus = dbus.bus.BusConnection(dbus.bus.BUS_SYSTEM, mainloop=DBusGMainLoop())
+            bus.add_signal_receiver(
+                self._on_bluez_interfaces_added,
+                signal_name="InterfacesAdded",
+                dbus_interface="org.freedesktop.DBus.ObjectManager",
+                bus_name="org.bluez",
+            )
+            bus.add_signal_receiver(
+                self._on_bluez_interfaces_removed,
+                signal_name="InterfacesRemoved",
+                dbus_interface="org.freedesktop.DBus.ObjectManager",
+                bus_name="org.bluez",
+            )
+            bus.add_signal_receiver(
+                self._on_bluez_properties_changed,
+                signal_name="PropertiesChanged",
+                dbus_interface="org.freedesktop.DBus.Properties",
+                bus_name="org.bluez",
+                path_keyword="path",
+            )
+            # Called from the loop with the current owner, then on every change
+            bus.watch_name_owner(
+                "org.bluez", lambda owner: self._reload_bluez_devices(bus, owner)
+            )
+            self._bluez_watch_bus = bus
+            self._bluez_watch_loop = GLib.MainLoop()
+            threading.Thread(
+                target=self._bluez_watch_loop.run, name="bt-tether-bluez", daemon=True
+            ).start()
+            logging.debug("[bt-tether] Watching BlueZ device signals")
+        except Exception as e:
+            logging.warning(f"[bt-tether] BlueZ signal watch unavailable: {e}")
+            self._bluez_watch_bus = None
+            self._bluez_watch_loop = None
+
+    def _stop_bluez_watch(self):
+        """Stop the BlueZ signal watch; readers go back to GetManagedObjects"""
+        with self._bluez_devices_lock:
+            self._bluez_devices = None
+        if self._bluez_watch_loop is not None:
+            self._bluez_watch_loop.quit()
+            self._bluez_watch_loop = None
+        if self._bluez_watch_bus is not None:
+            try:
+                self._bluez_watch_bus.close()
+            except Exception as e:
+                logging.debug(f"[bt-tether] Failed to close BlueZ watch bus: {e}")
+            self._bluez_watch_bus = None
+
+    def _reload_bluez_devices(self, bus, owner):
+        """Reload the device cache when bluetoothd (re)appears on the bus"""
+        devices = None
+        if owner:
+            try:
+                manager = dbus.Interface(
+                    bus.get_object("org.bluez", "/", introspect=False),
+                    "org.freedesktop.DBus.ObjectManager",
+                )
+                devices = {
+                    str(path): dict(interfaces["org.bluez.Device1"])
+                    for path, interfaces in manager.GetManagedObjects().items()
+                    if "org.bluez.Device1" in interfaces
+                }
+            except Exception as e:
+                logging.debug(f"[bt-tether] BlueZ device reload failed: {e}")
+        # No owner (bluetoothd restarting) or a failed load: live reads until the
+        # next owner change brings a fresh copy
+        with self._bluez_devices_lock:
+            self._bluez_devices = devices
+            self._bump_bluez_device_seq()
+        self._on_bluez_device_change()
+
+    def _on_bluez_interfaces_added(self, path, interfaces):
+        if "org.bluez.Device1" not in interfaces:
+            return
+        with self._bluez_devices_lock:
+            if self._bluez_devices is None:
+                return
+            props = dict(interfaces["org.bluez.Device1"])
+            self._bluez_devices[str(path)] = props
+            self._bump_bluez_device_seq()
+        scan_queue = self._bluez_scan_queue
+        if scan_queue is not None:
+            scan_queue.put(props)
+        self._on_bluez_device_change()
+
+    def _on_bluez_interfaces_removed(self, path, interfaces):
+        if "org.bluez.Device1" not in interfaces:
+            return
+        with self._bluez_devices_lock:
+            if self._bluez_devices is None:
+                return
+            self._bluez_devices.pop(str(path), None)
+            self._bump_bluez_device_seq()
+        self._on_bluez_device_change()
+
+    def _on_bluez_properties_changed(self, interface, changed, invalidated, path=None):
+        if interface != "org.bluez.Device1":
+            return
+        with self._bluez_devices_lock:
+            if self._bluez_devices is None:
+                return
+            props = self._bluez_devices.get(str(path))
+            if props is None:
+                return
+            # Replace rather than mutate so readers holding the old dict are safe
+            props = dict(props)
+            props.update(changed)
+            for name in invalidated:
+                props.pop(name, None)
+            self._bluez_devices[str(path)] = props
+            # RSSI and friends change constantly while scanning; only state the
+            # status, web UI and connect waits look at is worth a wake-up
+            relevant = bool({"Connected", "Paired", "Trusted", "UUIDs"} & set(changed))
+            if relevant:
+                self._bump_bluez_device_seq()
+        # A known device reporting a fresh RSSI is in range again
+        scan_queue = self._bluez_scan_queue
+        if scan_queue is not None and "RSSI" in changed:
+            scan_queue.put(props)
+        if relevant:
+            self._on_bluez_device_change()
+
+    def _bump_bluez_device_seq(self):
+        """Wake _wait_for_device callers; call with _bluez_devices_lock held"""
+        self._bluez_device_seq += 1
+        self._bluez_device_cond.notify_all()
+
+    def _on_bluez_device_change(self):
+        """Drop the cached status and tell open web UIs to refresh"""
+        self._invalidate_status_cache()
+        self._notify_web_clients()
+
+    def _bluez_device_props(self):
+        """Return a list of Device1 property dicts, from the watch cache if live"""
+        with self._bluez_devices_lock:
+            if self._bluez_devices is not None:
+                return list(self._bluez_devices.values())
+        return [
+            interfaces["org.bluez.Device1"]
+            for interfaces in self._bluez_managed_objects().values()
+            if "org.bluez.Device1" in interfaces
+        ]
+
     def _dbus_all_devices(self):
         """Return {MAC_UPPER: props} for all known BlueZ devices via D-Bus.
 
         One GetManagedObjects call replaces spawning a bluetoothctl process per
         device plus ANSI text parsing - much cheaper (matters on a slow ARMv6
-        Pi Zero) and more robust. Returns None if D-Bus is unavailable so callers
-        fall back to bluetoothctl. props: name, paired, trusted, connected, has_nap.
+        Pi Zero) and more robust. With the signal watch running (see
+        _start_bluez_watch) not even that call is made. Returns None if D-Bus is
+        unavailable so callers fall back to bluetoothctl. props: name, paired,
+        trusted, connected, has_nap.
         """
         if not DBUS_AVAILABLE:
             return None
         try:
-            bus = dbus.SystemBus()
-            mgr = dbus.Interface(
-                bus.get_object("org.bluez", "/"),
-                "org.freedesktop.DBus.ObjectManager",
-            )
-            objects = mgr.GetManagedObjects()
             nap = self.NAP_UUID.lower()
             devices = {}
-            for _path, interfaces in objects.items():
-                dev = interfaces.get("org.bluez.Device1")
-                if not dev:
-                    continue
+            for dev in self._bluez_device_props():
                 addr = str(dev.get("Address", "")).upper()
                 if not addr:
                     continue
@@ -3353,6 +4374,49 @@ default-agent
             logging.debug(f"[bt-tether] D-Bus device read failed, will fall back: {e}")
             return None
 
+    def _wait_for_device(self, mac, check, timeout):
+        """Wait until check(device) holds for mac, up to timeout seconds.
+
+        device is a _dbus_all_devices() entry (paired, trusted, connected,
+        has_nap). With the BlueZ signal watch running the wait wakes on the
+        change itself; otherwise the state is re-read every
+        DEVICE_OPERATION_DELAY, from bluetoothctl if D-Bus is unavailable.
+        Returns True once check passes, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            seq = self._bluez_device_seq
+            devices = self._dbus_all_devices()
+            if devices is not None:
+                device = devices.get(mac.upper())
+            else:
+                info = self._run_cmd(
+                    ["bluetoothctl", "info", mac],
+                    capture=True,
+                    timeout=self.SUBPROCESS_TIMEOUT_NORMAL,
+                )
+                device = None
+                if info and "Device" in info:
+                    device = {
+                        "paired": "Paired: yes" in info,
+                        "trusted": "Trusted: yes" in info,
+                        "connected": "Connected: yes" in info,
+                        "has_nap": self.NAP_UUID in info,
+                    }
+            if device and check(device):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            with self._bluez_device_cond:
+                watched = self._bluez_devices is not None
+                if watched:
+                    self._bluez_device_cond.wait_for(
+                        lambda: self._bluez_device_seq != seq, remaining
+                    )
+            if not watched:
+                time.sleep(min(self.DEVICE_OPERATION_DELAY, remaining))
+
     def _check_pair_status(self, mac):
         """Check if a device is already paired"""
         # Fast path: read device state straight from BlueZ over D-Bus
@@ -3385,69 +4449,27 @@ default-agent
     def _get_current_status(self, mac):
         """Get current connection status - no cache, direct check"""
         try:
-            # Quick check: look for active PAN interface first (fastest indicator)
-            # Check for both bnep and bt-pan interfaces
+            # Quick check: look for active PAN interface first (fastest indicator).
+            # Interface and address lookups read sysfs/procfs and use an ioctl,
+            # so a status check spawns no `ip` processes.
             try:
-                pan_result = subprocess.run(
-                    ["ip", "link", "show"],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.SUBPROCESS_TIMEOUT_MEDIUM,
-                )
-                if pan_result.returncode == 0:
-                    # Find the PAN interface name (bnep0, bnep1, bt-pan, etc.)
-                    pan_iface = None
-                    for link_line in pan_result.stdout.split("\n"):
-                        for prefix in ("bnep", "bt-pan"):
-                            if prefix in link_line:
-                                # Extract interface name from lines like "5: bnep0: <...>"
-                                match = re.search(r"\d+:\s+(\S+?)[@:]", link_line)
-                                if match:
-                                    pan_iface = match.group(1)
-                                    break
-                        if pan_iface:
-                            break
-
-                    if pan_iface:
-                        # Check if PAN interface has an IP address
-                        try:
-                            ip_result = subprocess.run(
-                                ["ip", "addr", "show", pan_iface],
-                                capture_output=True,
-                                text=True,
-                                timeout=self.SUBPROCESS_TIMEOUT_MEDIUM,
-                            )
-                            if ip_result.returncode == 0:
-                                # Extract an IPv4 address if present
-                                ip_address = None
-                                for line in ip_result.stdout.split("\n"):
-                                    if "inet " in line and not "127.0.0.1" in line:
-                                        parts = line.strip().split()
-                                        for part in parts:
-                                            if part.startswith("inet"):
-                                                continue
-                                            if "/" in part and "." in part:
-                                                ip_address = part.split("/")[0]
-                                                break
-                                        if ip_address:
-                                            break
-
-                                # Fall back to a global IPv6 (IPv6-only PAN via SLAAC)
-                                if not ip_address:
-                                    ip_address = self._get_global_ipv6(pan_iface)
-
-                                # PAN interface up with a usable address -> connected
-                                if ip_address:
-                                    return {
-                                        "paired": True,
-                                        "trusted": True,
-                                        "connected": True,
-                                        "pan_active": True,
-                                        "interface": pan_iface,
-                                        "ip_address": ip_address,
-                                    }
-                        except Exception as ip_err:
-                            logging.debug(f"[bt-tether] IP check failed: {ip_err}")
+                pan_iface = self._get_pan_interface()
+                if pan_iface:
+                    # Prefer IPv4, fall back to a global IPv6 (IPv6-only PAN via SLAAC)
+                    ip_address = self._get_interface_ip(
+                        pan_iface
+                    ) or self._get_global_ipv6(pan_iface)
+
+                    # PAN interface up with a usable address -> connected
+                    if ip_address:
+                        return {
+                            "paired": True,
+                            "trusted": True,
+                            "connected": True,
+                            "pan_active": True,
+                            "interface": pan_iface,
+                            "ip_address": ip_address,
+                        }
             except Exception as pan_err:
                 logging.debug(f"[bt-tether] PAN check failed: {pan_err}")
 
@@ -3464,14 +4486,7 @@ default-agent
                         "interface": None,
                         "ip_address": None,
                     }
-                return {
-                    "paired": False,
-                    "trusted": False,
-                    "connected": False,
-                    "pan_active": False,
-                    "interface": None,
-                    "ip_address": None,
-                }
+                return dict(self.DISCONNECTED_STATUS)
 
             # Fallback: quick bluetoothctl check with minimal timeout
             try:
@@ -3500,34 +4515,63 @@ default-agent
                 logging.debug(f"[bt-tether] bluetoothctl check failed: {bt_err}")
 
             # Fallback to disconnected if all checks fail
-            return {
-                "paired": False,
-                "trusted": False,
-                "connected": False,
-                "pan_active": False,
-                "interface": None,
-                "ip_address": None,
-            }
+            return dict(self.DISCONNECTED_STATUS)
 
         except Exception as e:
             logging.debug(f"[bt-tether] Status check error: {e}")
-            return {
-                "paired": False,
-                "trusted": False,
-                "connected": False,
-                "pan_active": False,
-                "interface": None,
-                "ip_address": None,
-            }
+            return dict(self.DISCONNECTED_STATUS)
+
+    def _known_disconnected_status(self, mac):
+        """Disconnected status without probing, or None if a probe is needed.
+
+        When the state machine is idle in DISCONNECTED and the last check saw no
+        link, the PAN/BlueZ probes can only confirm it. Paired/trusted still
+        matter (auto-reconnect and the web UI read them), so this only answers
+        while the BlueZ watch cache is live and reading them is free. A link
+        the phone brought up on its own shows as Connected there and gets a
+        real probe.
+        """
+        if self._bluez_devices is None:
+            return None
+        with self.lock:
+            if (
+                self.status != self.STATE_DISCONNECTED
+                or self._connection_in_progress
+                or self._last_known_connected
+            ):
+                return None
+        status = dict(self.DISCONNECTED_STATUS)
+        d = (self._dbus_all_devices() or {}).get(mac.upper())
+        if d:
+            if d["connected"]:
+                return None
+            status["paired"] = d["paired"]
+            status["trusted"] = d["trusted"]
+            status["connected"] = d["connected"]
+        return status
 
     def _get_full_connection_status(self, mac):
         """Get complete connection status for web UI - includes additional fields"""
-        # Get base status
-        status = self._get_current_status(mac)
+        # The default-route lookup is independent of the link/BlueZ checks, so
+        # run it alongside them instead of after them.
+        try:
+            route_future = self._web_executor.submit(self._get_default_route_interface)
+        except RuntimeError:
+            route_future = None  # Executor shut down (plugin unloading)
+
+        # Get base status, skipping the probes when we know there is no link
+        status = self._known_disconnected_status(mac)
+        if status is None:
+            status = self._get_current_status(mac)
 
         # Add default_route_interface for web UI display
         try:
-            status["default_route_interface"] = self._get_default_route_interface()
+            if route_future is not None:
+                status["default_route_interface"] = route_future.result(
+                    timeout=self.SUBPROCESS_TIMEOUT_STANDARD
+                )
+            else:
+                status["default_route_interface"] = self._get_default_route_interface()
         except Exception as e:
             logging.debug(f"[bt-tether] Failed to get default route interface: {e}")
             status["default_route_interface"] = None
@@ -3565,30 +4609,27 @@ default-agent
                 return trusted_devices
 
             # Check each device for trust status and get detailed info
-            for line in devices_output.split("\n"):
-                if line.strip() and line.startswith("Device"):
-                    parts = line.strip().split(" ", 2)
-                    if len(parts) >= 2:
-                        mac = parts[1]
-                        name = parts[2] if len(parts) > 2 else "Unknown Device"
-
-                        # Get device info to check trust status and capabilities
-                        info = self._run_cmd(
-                            ["bluetoothctl", "info", mac],
-                            capture=True,
-                            timeout=self.SUBPROCESS_TIMEOUT_STANDARD,
-                        )
-                        if info and "Trusted: yes" in info:
-                            # Parse additional device info
-                            device_info = {
-                                "mac": mac,
-                                "name": name,
-                                "trusted": True,
-                                "paired": "Paired: yes" in info,
-                                "connected": "Connected: yes" in info,
-                                "has_nap": self.NAP_UUID in info,  # NAP UUID
-                            }
-                            trusted_devices.append(device_info)
+            for m in self.BTCTL_DEVICE_LINE_PATTERN.finditer(devices_output):
+                mac = m.group(1)
+                name = (m.group(2) or "").strip() or "Unknown Device"
+
+                # Get device info to check trust status and capabilities
+                info = self._run_cmd(
+                    ["bluetoothctl", "info", mac],
+                    capture=True,
+                    timeout=self.SUBPROCESS_TIMEOUT_STANDARD,
+                )
+                if info and "Trusted: yes" in info:
+                    # Parse additional device info
+                    device_info = {
+                        "mac": mac,
+                        "name": name,
+                        "trusted": True,
+                        "paired": "Paired: yes" in info,
+                        "connected": "Connected: yes" in info,
+                        "has_nap": self.NAP_UUID in info,  # NAP UUID
+                    }
+                    trusted_devices.append(device_info)
 
             return trusted_devices
 
@@ -3662,8 +4703,215 @@ default-agent
             self._log("ERROR", f"Failed to find best device: {e}")
             return None
 
+    def _dbus_adapter_path(self):
+        """Return the first BlueZ adapter's object path (cached), or None"""
+        if self._bluez_adapter_path is None:
+            for path, interfaces in self._bluez_managed_objects().items():
+                if "org.bluez.Adapter1" in interfaces:
+                    self._bluez_adapter_path = path
+                    break
+        return self._bluez_adapter_path
+
+    def _dbus_set_adapter_properties(self, **props):
+        """Set boolean Adapter1 properties (Powered, Pairable, Discoverable).
+
+        Property writes return once BlueZ has applied them, so no settle delay
+        is needed afterwards. Returns True, or None if D-Bus is unavailable or a
+        write failed so callers fall back to bluetoothctl.
+        """
+        if not DBUS_AVAILABLE:
+            return None
+        try:
+            path = self._dbus_adapter_path()
+            if path is None:
+                return None
+            adapter_props = dbus.Interface(
+                dbus.SystemBus().get_object("org.bluez", path),
+                "org.freedesktop.DBus.Properties",
+            )
+            for name, value in props.items():
+                adapter_props.Set("org.bluez.Adapter1", name, dbus.Boolean(value))
+            return True
+        except Exception as e:
+            logging.debug(f"[bt-tether] D-Bus adapter write failed, falling back: {e}")
+            return None
+
+    def _dbus_set_discovery(self, on):
+        """Start or stop discovery via Adapter1.StartDiscovery / StopDiscovery.
+
+        Only used while the BlueZ signal watch runs, since that is what reports
+        the devices found. BlueZ ties discovery to the calling connection, so
+        both calls go through the shared system bus connection. Returns True on
+        success, or None if D-Bus discovery isn't usable so callers fall back to
+        an interactive bluetoothctl scan.
+        """
+        if self._bluez_watch_loop is None:
+            return None
+        try:
+            path = self._dbus_adapter_path()
+            if path is None:
+                return None
+            adapter = dbus.Interface(
+                dbus.SystemBus().get_object("org.bluez", path), "org.bluez.Adapter1"
+            )
+            if on:
+                adapter.StartDiscovery()
+            else:
+                adapter.StopDiscovery()
+            return True
+        except Exception as e:
+            logging.debug(f"[bt-tether] D-Bus discovery {'on' if on else 'off'}: {e}")
+            return None
+
+    def _scan_via_dbus(self, discovered_devices, device_types):
+        """Run the device scan on D-Bus discovery and the BlueZ signal watch.
+
+        Devices BlueZ adds during the scan, and known ones reporting a fresh
+        RSSI, are recorded like the bluetoothctl scan's [NEW] lines. Returns
+        False without scanning if D-Bus discovery isn't usable.
+        """
+        found = queue.Queue()
+        self._bluez_scan_queue = found
+        if not self._dbus_set_discovery(True):
+            self._bluez_scan_queue = None
+            return False
+        scan_start = time.time()
+        scan_end_time = scan_start + self.SCAN_DURATION
+        try:
+            while not self._stop_scan:
+                remaining = scan_end_time - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    props = found.get(timeout=min(remaining, 0.5))
+                except queue.Empty:
+                    continue
+                mac = str(props.get("Address", "")).upper()
+                if not mac or mac in discovered_devices:
+                    continue
+                name = str(props.get("Alias") or props.get("Name") or "(unnamed)")
+                discovered_devices[mac] = name
+                device_types[mac] = "NEW"
+                self._log("INFO", f"[NEW] {name} ({mac})")
+                # Update real-time list for /scan-progress
+                with self.lock:
+                    self._discovered_devices[mac] = {
+                        "mac": mac,
+                        "name": name,
+                        "type": "NEW",
+                    }
+                self._notify_web_clients()
+        finally:
+            self._bluez_scan_queue = None
+            self._dbus_set_discovery(False)
+        elapsed = time.time() - scan_start
+        self._log(
+            "INFO",
+            f"Scan completed in {elapsed:.1f}s, found {len(discovered_devices)} device(s)",
+        )
+        return True
+
+    def _scan_via_bluetoothctl(self, discovered_devices, device_types):
+        """Run the device scan through an interactive bluetoothctl session"""
+        lines_read = 0
+        mac_pattern = self.SCAN_MAC_PATTERN
+        ansi_pattern = self.SCAN_ANSI_PATTERN
+        self._log("DEBUG", "Starting bluetoothctl in interactive mode...")
+        scan_start = time.time()
+        scan_process = None
+        try:
+            scan_process = subprocess.Popen(
+                ["bluetoothctl"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,  # Line buffered
+                env=self._btctl_env,
+            )
+            # Send scan on command to start scanning
+            scan_process.stdin.write("scan on\n")
+            scan_process.stdin.flush()
+        except Exception as e:
+            self._log("ERROR", f"Failed to start scan: {e}")
+            scan_process = None
+
+        if scan_process:
+            self._log("DEBUG", f"Scanning for {self.SCAN_DURATION} seconds...")
+            self._log("DEBUG", f"Process started, PID: {scan_process.pid}")
+            scan_end_time = time.time() + self.SCAN_DURATION
+            try:
+                while time.time() < scan_end_time and not self._stop_scan:
+                    try:
+                        ready = select.select([scan_process.stdout], [], [], 0.5)
+                        if ready[0]:
+                            line = scan_process.stdout.readline()
+                            if not line:
+                                break
+                            line = line.strip()
+                            if not line:
+                                continue
+                            lines_read += 1
+                            # Strip ANSI codes for pattern matching
+                            clean_line = ansi_pattern.sub("", line)
+                            # Parse discovery events: "[NEW] Device MAC Name"
+                            if "[NEW]" in clean_line and "Device" in clean_line:
+                                mac_match = mac_pattern.search(clean_line)
+                                if mac_match:
+                                    mac = mac_match.group(1).upper()
+                                    remainder = clean_line[mac_match.end() :].strip()
+                                    name = remainder if remainder else "(unnamed)"
+                                    if mac not in discovered_devices:
+                                        discovered_devices[mac] = name
+                                        device_types[mac] = "NEW"
+                                        self._log(
+                                            "INFO",
+                                            f"[NEW] {name} ({mac})",
+                                        )
+                                        # Update real-time list for /scan-progress
+                                        with self.lock:
+                                            self._discovered_devices[mac] = {
+                                                "mac": mac,
+                                                "name": name,
+                                                "type": device_types[mac],
+                                            }
+                                        self._notify_web_clients()
+                    except select.error:
+                        pass
+            finally:
+                # Stop scan and close bluetoothctl
+                self._log("DEBUG", "Stopping scan...")
+                try:
+                    # Stop discovery in the session that started it
+                    # rather than spawning another bluetoothctl. No need
+                    # to wait for the reply before quitting: BlueZ ends a
+                    # client's discovery when that client goes away.
+                    scan_process.stdin.write("scan off\nquit\n")
+                    scan_process.stdin.flush()
+                    try:
+                        scan_process.wait(timeout=self.SUBPROCESS_TIMEOUT_MEDIUM)
+                        logging.info("[bt-tether] Bluetoothctl process exited cleanly")
+                    except subprocess.TimeoutExpired:
+                        logging.info(
+                            "[bt-tether] Force killing bluetoothctl after timeout"
+                        )
+                        scan_process.kill()
+                        scan_process.wait(timeout=self.SUBPROCESS_TIMEOUT_SHORT)
+                except Exception as e:
+                    logging.debug(f"[bt-tether] Error stopping scan: {e}")
+                    try:
+                        scan_process.kill()
+                    except Exception:
+                        pass
+
+            elapsed = time.time() - scan_start
+            self._log(
+                "INFO",
+                f"Scan completed in {elapsed:.1f}s, found {len(discovered_devices)} device(s)",
+            )
+
     def _scan_devices(self):
-        """Scan for Bluetooth devices using interactive bluetoothctl session"""
+        """Scan for Bluetooth devices (D-Bus discovery, else interactive bluetoothctl)"""
         try:
             logging.info("[bt-tether] Starting device scan...")
             # Reset stop flag at start of new scan
@@ -3682,19 +4930,16 @@ default-agent
                     timeout=self.SUBPROCESS_TIMEOUT_STANDARD,
                 )
                 if paired_output and paired_output != "Timeout":
-                    for line in paired_output.split("\n"):
-                        if line.strip() and line.startswith("Device"):
-                            parts = line.strip().split(" ", 2)
-                            if len(parts) >= 3:
-                                mac = parts[1].upper()
-                                name = parts[2]
-                                if mac not in discovered_devices:
-                                    discovered_devices[mac] = name
-                                    device_types[mac] = "PAIRED"
-                                    self._log(
-                                        "DEBUG",
-                                        f"Pre-loaded cached device: {name} ({mac})",
-                                    )
+                    for m in self.BTCTL_DEVICE_LINE_PATTERN.finditer(paired_output):
+                        mac = m.group(1).upper()
+                        name = (m.group(2) or "").strip()
+                        if name and mac not in discovered_devices:
+                            discovered_devices[mac] = name
+                            device_types[mac] = "PAIRED"
+                            self._log(
+                                "DEBUG",
+                                f"Pre-loaded cached device: {name} ({mac})",
+                            )
             except Exception as e:
                 logging.debug(f"[bt-tether] Error pre-loading paired devices: {e}")
 
@@ -3709,129 +4954,17 @@ default-agent
                     }
                     for mac in discovered_devices
                 }
+            self._notify_web_clients()
 
-            lines_read = 0
             try:
                 # Ensure Bluetooth is powered on
                 self._log("DEBUG", "Ensuring Bluetooth is powered on...")
-                self._run_cmd(
-                    ["bluetoothctl", "power", "on"],
-                    timeout=self.SUBPROCESS_TIMEOUT_STANDARD,
-                )
-                time.sleep(self.OPERATION_SHORT_DELAY)
-
-                mac_pattern = self.SCAN_MAC_PATTERN
-                ansi_pattern = self.SCAN_ANSI_PATTERN
-                self._log("DEBUG", "Starting bluetoothctl in interactive mode...")
-                scan_start = time.time()
-                scan_process = None
-                try:
-                    env = dict(os.environ)
-                    env["TERM"] = "dumb"
-                    scan_process = subprocess.Popen(
-                        ["bluetoothctl"],
-                        stdin=subprocess.PIPE,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        bufsize=1,  # Line buffered
-                        env=env,
-                    )
-                    # Send scan on command to start scanning
-                    scan_process.stdin.write("scan on\n")
-                    scan_process.stdin.flush()
-                except Exception as e:
-                    self._log("ERROR", f"Failed to start scan: {e}")
-                    scan_process = None
-
-                if scan_process:
-                    self._log("DEBUG", f"Scanning for {self.SCAN_DURATION} seconds...")
-                    self._log("DEBUG", f"Process started, PID: {scan_process.pid}")
-                    scan_end_time = time.time() + self.SCAN_DURATION
-                    try:
-                        while time.time() < scan_end_time and not self._stop_scan:
-                            try:
-                                import select
-
-                                ready = select.select(
-                                    [scan_process.stdout], [], [], 0.5
-                                )
-                                if ready[0]:
-                                    line = scan_process.stdout.readline()
-                                    if not line:
-                                        break
-                                    line = line.strip()
-                                    if not line:
-                                        continue
-                                    lines_read += 1
-                                    # Strip ANSI codes for pattern matching
-                                    clean_line = ansi_pattern.sub("", line)
-                                    # Parse discovery events: "[NEW] Device MAC Name"
-                                    if "[NEW]" in clean_line and "Device" in clean_line:
-                                        mac_match = mac_pattern.search(clean_line)
-                                        if mac_match:
-                                            mac = mac_match.group(1).upper()
-                                            remainder = clean_line[
-                                                mac_match.end() :
-                                            ].strip()
-                                            name = (
-                                                remainder if remainder else "(unnamed)"
-                                            )
-                                            if mac not in discovered_devices:
-                                                discovered_devices[mac] = name
-                                                device_types[mac] = "NEW"
-                                                self._log(
-                                                    "INFO",
-                                                    f"[NEW] {name} ({mac})",
-                                                )
-                                                # Update real-time list for /scan-progress
-                                                with self.lock:
-                                                    self._discovered_devices[mac] = {
-                                                        "mac": mac,
-                                                        "name": name,
-                                                        "type": device_types[mac],
-                                                    }
-                            except select.error:
-                                pass
-                    finally:
-                        # Stop scan and close bluetoothctl
-                        self._log("DEBUG", "Stopping scan...")
-                        try:
-                            try:
-                                self._run_cmd(
-                                    ["bluetoothctl", "scan", "off"],
-                                    timeout=self.SUBPROCESS_TIMEOUT_NORMAL,
-                                )
-                            except Exception:
-                                pass
-                            time.sleep(self.SCAN_STOP_DELAY)
-                            scan_process.stdin.write("quit\n")
-                            scan_process.stdin.flush()
-                            try:
-                                scan_process.wait(
-                                    timeout=self.SUBPROCESS_TIMEOUT_MEDIUM
-                                )
-                                logging.info(
-                                    "[bt-tether] Bluetoothctl process exited cleanly"
-                                )
-                            except subprocess.TimeoutExpired:
-                                logging.info(
-                                    "[bt-tether] Force killing bluetoothctl after timeout"
-                                )
-                                scan_process.kill()
-                                scan_process.wait(timeout=self.SUBPROCESS_TIMEOUT_SHORT)
-                        except Exception as e:
-                            logging.debug(f"[bt-tether] Error stopping scan: {e}")
-                            try:
-                                scan_process.kill()
-                            except Exception:
-                                pass
+                if not self._dbus_set_adapter_properties(Powered=True):
+                    self._send_btctl("power on")
 
-                    elapsed = time.time() - scan_start
-                    self._log(
-                        "INFO",
-                        f"Scan completed in {elapsed:.1f}s, found {len(discovered_devices)} device(s)",
-                    )
+                # Prefer D-Bus discovery reported by the BlueZ signal watch
+                if not self._scan_via_dbus(discovered_devices, device_types):
+                    self._scan_via_bluetoothctl(discovered_devices, device_types)
             except Exception as e:
                 self._log("ERROR", f"Error during scan: {e}")
                 logging.exception("[bt-tether] Scan exception:")
@@ -3845,25 +4978,23 @@ default-agent
                     timeout=self.SUBPROCESS_TIMEOUT_STANDARD,
                 )
                 if paired_output and paired_output != "Timeout":
-                    for line in paired_output.split("\n"):
-                        if line.strip() and line.startswith("Device"):
-                            parts = line.strip().split(" ", 2)
-                            if len(parts) >= 3:
-                                mac = parts[1].upper()
-                                name = parts[2]
-                                if mac not in discovered_devices:
-                                    discovered_devices[mac] = name
-                                    device_types[mac] = "PAIRED"
-                                    with self.lock:
-                                        self._discovered_devices[mac] = {
-                                            "mac": mac,
-                                            "name": name,
-                                            "type": "PAIRED",
-                                        }
-                                    self._log(
-                                        "INFO",
-                                        f"Found device paired during scan: {name} ({mac})",
-                                    )
+                    for m in self.BTCTL_DEVICE_LINE_PATTERN.finditer(paired_output):
+                        mac = m.group(1).upper()
+                        name = (m.group(2) or "").strip()
+                        if name and mac not in discovered_devices:
+                            discovered_devices[mac] = name
+                            device_types[mac] = "PAIRED"
+                            with self.lock:
+                                self._discovered_devices[mac] = {
+                                    "mac": mac,
+                                    "name": name,
+                                    "type": "PAIRED",
+                                }
+                            self._notify_web_clients()
+                            self._log(
+                                "INFO",
+                                f"Found device paired during scan: {name} ({mac})",
+                            )
             except Exception as e:
                 logging.debug(
                     f"[bt-tether] Error checking for newly paired devices: {e}"
@@ -3894,6 +5025,11 @@ default-agent
             return []
 
     def start_connection(self):
+        """Queue a connection to the best trusted device.
+
+        Returns False, with self.message explaining why, if no device is
+        available or a connection is already in progress.
+        """
         # The device lookup does D-Bus / bluetoothctl I/O. Keep it OUTSIDE
         # self.lock so it can't stall on_ui_update (the display thread also
         # acquires self.lock) and freeze the e-ink while we enumerate devices.
@@ -3903,7 +5039,7 @@ default-agent
                 self.STATE_ERROR,
                 "No trusted devices found - scan and pair a device first",
             )
-            return
+            return False
 
         with self.lock:
             # Update current target MAC
@@ -3918,7 +5054,7 @@ default-agent
                 )
                 self.message = "Connection already in progress"
                 self._screen_needs_refresh = True
-                return
+                return False
 
             if self.status in [self.STATE_PAIRING, self.STATE_CONNECTING]:
                 self._log(
@@ -3926,7 +5062,7 @@ default-agent
                 )
                 self.message = "Connection already in progress"
                 self._screen_needs_refresh = True
-                return
+                return False
 
             # Set flag INSIDE the lock to prevent race condition
             self._connection_in_progress = True
@@ -3951,9 +5087,24 @@ default-agent
         self._monitor_paused.clear()
 
         # Pass device info to connection thread
-        threading.Thread(
-            target=self._connect_thread, args=(best_device,), daemon=True
-        ).start()
+        self._submit_connect(self._connect_thread, best_device)
+        return True
+
+    def _submit_connect(self, fn, *args):
+        """Queue a connect/reconnect attempt on the single connection worker.
+
+        Returns the Future, or None if the plugin is unloading.
+        """
+        try:
+            return self._connect_executor.submit(fn, *args)
+        except RuntimeError:
+            logging.debug("[bt-tether] Connection worker shut down, not connecting")
+            return None
+
+    def _reconnect_on_worker(self):
+        """Run _reconnect_device on the connection worker and wait for its result"""
+        future = self._submit_connect(self._reconnect_device)
+        return future.result() if future else False
 
     def _connect_thread(self, target_device):
         """Full automatic connection thread with pairing and connection logic"""
@@ -3981,9 +5132,10 @@ default-agent
             with self.lock:
                 self.message = f"Making Pwnagotchi discoverable for {device_name}..."
                 self._screen_needs_refresh = True
-            self._run_cmd(["bluetoothctl", "discoverable", "on"], capture=True)
-            self._run_cmd(["bluetoothctl", "pairable", "on"], capture=True)
-            time.sleep(self.DEVICE_OPERATION_LONGER_DELAY)
+            # Both paths return once the change is acknowledged
+            if not self._dbus_set_adapter_properties(Discoverable=True, Pairable=True):
+                self._send_btctl("discoverable on")
+                self._send_btctl("pairable on")
 
             # First check current pairing status
             with self.lock:
@@ -4004,8 +5156,7 @@ default-agent
                     with self.lock:
                         self.message = f"Clearing stale pairing with {device_name}..."
                         self._screen_needs_refresh = True
-                    self._run_cmd(["bluetoothctl", "remove", mac], capture=True)
-                    time.sleep(self.DEVICE_OPERATION_DELAY)
+                    self._send_btctl(f"remove {mac}")
                     needs_discovery = True  # remove wiped BlueZ cache, must rediscover
                 else:
                     # Truly new device — BlueZ already knows it from the background scan
@@ -4018,8 +5169,7 @@ default-agent
                 with self.lock:
                     self.message = f"Unblocking {device_name}..."
                     self._screen_needs_refresh = True
-                self._run_cmd(["bluetoothctl", "unblock", mac], capture=True)
-                time.sleep(self.DEVICE_OPERATION_DELAY)
+                self._send_btctl(f"unblock {mac}")
 
                 # Start pairing process - set PAIRING state
                 self._log(
@@ -4071,13 +5221,12 @@ default-agent
             # Brief delay to ensure TRUSTING state is displayed
             time.sleep(self.OPERATION_SHORT_DELAY)
 
-            self._run_cmd(["bluetoothctl", "trust", mac])
+            self._send_btctl(f"trust {mac}")
 
-            # Wait until the phone's NAP service UUID appears in bluetoothctl info.
+            # Wait until the phone's NAP service UUID appears on the device.
             # This is more reliable than a fixed sleep: the NAP UUID appearing means
             # the phone's tethering/NAP service is actually ready to accept connections.
             # br-connection-create-socket occurs when we connect before this is ready.
-            NAP_UUID = "00001116"  # NAP profile UUID prefix
             NAP_WAIT_TIMEOUT = 15
             logging.info(
                 f"[bt-tether] Waiting for {device_name} NAP service to be ready..."
@@ -4085,21 +5234,11 @@ default-agent
             with self.lock:
                 self.message = f"Waiting for {device_name} to be ready..."
                 self._screen_needs_refresh = True
-            nap_ready = False
             nap_wait_start = time.time()
-            while time.time() - nap_wait_start < NAP_WAIT_TIMEOUT:
-                info = self._run_cmd(
-                    ["bluetoothctl", "info", mac],
-                    capture=True,
-                    timeout=self.SUBPROCESS_TIMEOUT_NORMAL,
-                )
-                if info and NAP_UUID in info:
-                    elapsed = time.time() - nap_wait_start
-                    logging.info(f"[bt-tether] NAP service ready after {elapsed:.1f}s")
-                    nap_ready = True
-                    break
-                time.sleep(self.DEVICE_OPERATION_DELAY)
-            if not nap_ready:
+            if self._wait_for_device(mac, lambda d: d["has_nap"], NAP_WAIT_TIMEOUT):
+                elapsed = time.time() - nap_wait_start
+                logging.info(f"[bt-tether] NAP service ready after {elapsed:.1f}s")
+            else:
                 logging.warning(
                     f"[bt-tether] NAP UUID not seen after {NAP_WAIT_TIMEOUT}s - proceeding anyway"
                 )
@@ -4165,35 +5304,24 @@ default-agent
                 if iface:
                     self._log("INFO", f"✓ PAN interface active: {iface}")
 
-                    # Brief settle before DHCP (the interface is already active;
-                    # _setup_network_dhcp also brings it up). Polling for the IP
-                    # afterwards is what we actually gate on.
-                    time.sleep(self.OPERATION_SHORT_DELAY)
-
                     # Setup network with DHCP
-                    if self._setup_network_dhcp(iface):
+                    if self._setup_network_dhcp(iface, mac):
                         self._log("INFO", "✓ Network setup successful")
 
                         # Ensure DNS is configured from DHCP
                         self._log("INFO", "Verifying DNS configuration...")
                         try:
-                            with open("/etc/resolv.conf", "r") as f:
-                                resolv_content = f.read()
-                                nameservers = [
-                                    line.strip()
-                                    for line in resolv_content.split("\n")
-                                    if line.strip().startswith("nameserver")
-                                ]
-                                if nameservers:
-                                    self._log(
-                                        "INFO",
-                                        f"✓ DNS configured: {', '.join([ns.split()[1] for ns in nameservers])}",
-                                    )
-                                else:
-                                    self._log(
-                                        "WARNING",
-                                        "No nameservers found in /etc/resolv.conf - DNS may not work",
-                                    )
+                            nameservers = self._get_nameservers()
+                            if nameservers:
+                                self._log(
+                                    "INFO",
+                                    f"✓ DNS configured: {', '.join(nameservers)}",
+                                )
+                            else:
+                                self._log(
+                                    "WARNING",
+                                    "No nameservers found in /etc/resolv.conf - DNS may not work",
+                                )
                         except Exception as e:
                             self._log("WARNING", f"Could not verify DNS config: {e}")
                     else:
@@ -4215,25 +5343,17 @@ default-agent
                         self._log("INFO", "✓ Internet connectivity verified!")
 
                         # Get current IP address for event data
+                        current_ip = None
                         try:
                             current_ip = self._get_current_ip()
                             if current_ip:
                                 self._log("INFO", f"Current IP address: {current_ip}")
 
-                                # Now test DNS resolution after we have confirmed IP
-                                self._log("INFO", "Testing DNS resolution...")
-                                try:
-                                    import socket
-
-                                    socket.gethostbyname("google.com")
-                                    self._log("INFO", "✓ DNS resolution working")
-                                except socket.gaierror:
-                                    self._log(
-                                        "WARNING",
-                                        "DNS resolution failed - check /etc/resolv.conf",
-                                    )
-                                except Exception as dns_e:
-                                    self._log("WARNING", f"DNS test error: {dns_e}")
+                                # Now test DNS resolution after we have confirmed IP.
+                                # It only logs, so don't hold CONNECTED for it.
+                                self._web_executor.submit(self._log_dns_resolution)
+                        except RuntimeError:
+                            pass  # Executor shut down (plugin unloading)
                         except Exception as e:
                             self._log("ERROR", f"Failed to get IP or test DNS: {e}")
 
@@ -4246,7 +5366,7 @@ default-agent
                             {
                                 "mac": mac,
                                 "device": device_name,
-                                "ip": self._get_current_ip() or "unknown",
+                                "ip": current_ip or "unknown",
                                 "ipv6": self._get_global_ipv6(iface),
                                 "interface": iface,
                             },
@@ -4349,6 +5469,7 @@ default-agent
                 if self._connection_in_progress:
                     self._connection_in_progress = False
                     self._connection_start_time = None
+            self._wake_monitor()
 
             # Force immediate screen update to show final state (connected or error)
             if self._ui_reference:
@@ -4364,25 +5485,16 @@ default-agent
         if not text:
             return text
 
-        # Remove ANSI escape sequences
-        ansi_escape = re.compile(r"\x1b\[[0-9;]*[mGKHF]|\x01|\x02")
-        text = ansi_escape.sub("", text)
+        # Remove ANSI escape sequences. Our bluetoothctl runs with NO_COLOR and
+        # TERM=dumb, so most output has none - skip the regex in that case.
+        if "\x1b" in text or "\x01" in text or "\x02" in text:
+            text = self.STRIP_ANSI_PATTERN.sub("", text)
 
         # Filter out bluetoothctl status lines ([CHG], [DEL], [NEW]) to prevent log parser errors
         # These cause pwnagotchi's log parser to throw errors like "time data 'CHG' does not match format"
-        lines = text.split("\n")
-        filtered_lines = []
-        for line in lines:
-            # Skip lines that start with bluetoothctl status markers
-            stripped = line.strip()
-            if not (
-                stripped.startswith("[CHG]")
-                or stripped.startswith("[DEL]")
-                or stripped.startswith("[NEW]")
-            ):
-                filtered_lines.append(line)
-
-        return "\n".join(filtered_lines)
+        if "[CHG]" not in text and "[DEL]" not in text and "[NEW]" not in text:
+            return text
+        return self.BTCTL_STATUS_LINE_PATTERN.sub("", text)
 
     def _check_bluetooth_responsive(self):
         """Quick check if bluetoothctl is responsive"""
@@ -4403,12 +5515,7 @@ default-agent
         if not self._check_bluetooth_responsive():
             logging.warning("[bt-tether] Bluetooth appears hung, restarting service...")
             try:
-                subprocess.run(
-                    ["pkill", "-9", "bluetoothctl"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=self.SUBPROCESS_TIMEOUT_MEDIUM,
-                )
+                self._kill_bluetoothctl()
                 try:
                     subprocess.run(
                         ["systemctl", "restart", "bluetooth"],
@@ -4431,59 +5538,183 @@ default-agent
                 return False
         return True
 
+    def _run_ip(self, *args, sudo=False, capture=False, input=None, timeout=5):
+        """Run `ip args...`, the one place the plugin still shells out to iproute2.
+
+        Used for writes and for reads with no sysfs/procfs/ioctl equivalent.
+        Returns the stripped stdout when capturing ("" otherwise), or None if ip
+        failed. sudo=True adds the privilege prefix; TimeoutExpired propagates.
+        """
+        result = subprocess.run(
+            [*self._sudo, "ip", *args] if sudo else ["ip", *args],
+            input=input,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE if capture else subprocess.DEVNULL,
+            text=True,
+            timeout=timeout,
+        )
+        if result.returncode != 0:
+            if capture:
+                logging.debug("[bt-tether] ip %s failed: %s", args, result.stderr)
+            return None
+        return result.stdout.strip() if capture else ""
+
     def _run_cmd(self, cmd, capture=False, timeout=None):
         """Run shell command with error handling and deadlock prevention"""
         if timeout is None:
             timeout = self.SUBPROCESS_TIMEOUT_LONG
-        # Use lock to prevent multiple bluetoothctl commands from running simultaneously
-        with self._bluetoothctl_lock:
+        # Keep conflicting bluetoothctl commands from running simultaneously
+        with self._cmd_lock(cmd):
             try:
-                # Disable bluetoothctl color output to prevent ANSI codes in logs
-                env = dict(os.environ)
-                env["NO_COLOR"] = "1"  # Standard env var to disable colors
-                env["TERM"] = "dumb"  # Make terminal report as non-color capable
-
+                output = subprocess.PIPE if capture else subprocess.DEVNULL
+                process = subprocess.Popen(
+                    cmd, stdout=output, stderr=output, text=True, env=self._btctl_env
+                )
+                try:
+                    if capture:
+                        stdout, stderr = process.communicate(timeout=timeout)
+                    else:
+                        self._wait_process(process, timeout)
+                except subprocess.TimeoutExpired:
+                    # Kill only the hung command itself: the pairing agent and
+                    # queries running alongside it are other bluetoothctl
+                    # processes that are still healthy
+                    process.kill()
+                    process.communicate()
+                    raise
                 if capture:
-                    result = subprocess.run(
-                        cmd, capture_output=True, text=True, timeout=timeout, env=env
-                    )
                     # Return combined output with ANSI codes stripped to prevent log parser errors
-                    output = result.stdout + result.stderr
-                    return self._strip_ansi_codes(output)
-                else:
-                    subprocess.run(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        timeout=timeout,
-                        env=env,
-                    )
-                    return None
+                    return self._strip_ansi_codes(stdout + stderr)
+                return None
             except subprocess.TimeoutExpired:
                 logging.error(
                     f"[bt-tether] Command timeout ({timeout}s): {' '.join(cmd)}"
                 )
-                # Kill hung bluetoothctl after timeout (only if it's a bluetoothctl command)
-                if cmd and cmd[0] == "bluetoothctl":
-                    try:
-                        subprocess.run(
-                            ["pkill", "-9", "bluetoothctl"],
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                            timeout=2,
-                        )
-                        time.sleep(
-                            self.PROCESS_CLEANUP_DELAY
-                        )  # Brief pause to let process die
-                    except Exception as e:
-                        self._log("DEBUG", f"Process kill failed: {e}")
                 return "Timeout"
             except Exception as e:
                 logging.error(f"[bt-tether] Command failed: {' '.join(cmd)}")
                 logging.error(f"[bt-tether] Exception: {e}")
                 return None
 
-    def _setup_network_dhcp(self, iface):
+    def _cmd_lock(self, cmd):
+        """Return the lock that serializes cmd with commands it could conflict with.
+
+        Mutating bluetoothctl commands share _bluetoothctl_lock (also held by
+        _send_btctl until the agent replies), read-only queries share
+        _bluetoothctl_query_lock, and other commands run unserialized.
+        """
+        if not cmd or cmd[0] != "bluetoothctl":
+            return contextlib.nullcontext()
+        if len(cmd) > 1 and cmd[1] in self.BTCTL_QUERY_COMMANDS:
+            return self._bluetoothctl_query_lock
+        return self._bluetoothctl_lock
+
+    def _wait_process(self, process, timeout):
+        """process.wait(timeout) without subprocess's sleep-and-poll loop.
+
+        Popen.wait with a timeout re-checks the child every few milliseconds
+        (backing off to 50ms) until it exits. A pidfd becomes readable when the
+        child exits, so a single poll() sleeps until then or the timeout.
+        Falls back to Popen.wait where pidfd_open isn't available (Python < 3.9
+        or kernel < 5.3). Raises subprocess.TimeoutExpired like Popen.wait.
+        """
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is None:
+            return process.wait(timeout)
+        try:
+            pidfd = pidfd_open(process.pid)
+        except OSError:
+            return process.wait(timeout)
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            if not poller.poll(timeout * 1000):
+                raise subprocess.TimeoutExpired(process.args, timeout)
+        finally:
+            os.close(pidfd)
+        return process.wait()
+
+    def _kill_bluetoothctl(self):
+        """SIGKILL every bluetoothctl process, like `pkill -9 bluetoothctl`.
+
+        Walks /proc directly rather than spawning pkill.
+        """
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/comm") as f:
+                    if f.read().strip() != "bluetoothctl":
+                        continue
+                os.kill(int(pid), signal.SIGKILL)
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
+                pass  # Exited meanwhile, or not ours to kill
+
+    def _send_btctl(self, command, timeout=None):
+        """Run a one-shot bluetoothctl command through the persistent pairing agent.
+
+        The agent's session is already attached to BlueZ, so this skips the
+        process spawn and D-Bus handshake a fresh bluetoothctl costs. Returns the
+        reply line, or "Timeout" (like _run_cmd) if the agent took the command
+        but didn't answer within timeout - the command is never run twice. A
+        fresh bluetoothctl (via _run_cmd) runs it instead if the agent isn't
+        running, has a question outstanding or can't be written to. Commands
+        without known replies (BTCTL_REPLIES) always spawn.
+        """
+        if timeout is None:
+            timeout = self.SUBPROCESS_TIMEOUT_STANDARD
+        verb, _, arg = command.partition(" ")
+        replies = self.BTCTL_REPLIES.get(verb)
+        agent = self.agent_process
+        if replies and agent and agent.poll() is None and agent.stdin:
+            templates = replies[0] + replies[1] + self.BTCTL_COMMON_FAILURES
+            markers = [m.format(arg=arg.lower()) for m in templates]
+            # Held until the reply arrives, so no other command can be written
+            # in between and have its reply mistaken for ours
+            with self._bluetoothctl_lock:
+                if not self._agent_prompt_pending:
+                    lines = queue.Queue()
+                    with self._agent_line_lock:
+                        self._agent_line_queues.add(lines)
+                    written = False
+                    try:
+                        agent.stdin.write(f"{command}\n".encode())
+                        agent.stdin.flush()
+                        written = True
+                        deadline = time.monotonic() + timeout
+                        while True:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            line = self._strip_ansi_codes(
+                                lines.get(timeout=remaining)
+                                .decode(errors="replace")
+                                .strip()
+                            )
+                            if any(m in line.lower() for m in markers):
+                                return line
+                    except queue.Empty:
+                        pass
+                    except Exception as e:
+                        logging.debug(
+                            f"[bt-tether] Agent command '{command}' failed: {e}"
+                        )
+                    finally:
+                        with self._agent_line_lock:
+                            self._agent_line_queues.discard(lines)
+                    if written:
+                        # The agent has it - running it again in a fresh
+                        # process would repeat the remove/disconnect/...
+                        logging.debug(
+                            f"[bt-tether] No agent reply to '{command}' in {timeout}s"
+                        )
+                        return "Timeout"
+            logging.debug(f"[bt-tether] Agent can't take '{command}', spawning")
+        return self._run_cmd(
+            ["bluetoothctl"] + command.split(), capture=True, timeout=timeout
+        )
+
+    def _setup_network_dhcp(self, iface, mac):
         """Setup network for the PAN interface using dhclient"""
         try:
             # If a disconnect/shutdown arrived (e.g. during the NAP step), don't
@@ -4495,15 +5726,10 @@ default-agent
 
             # Ensure interface is up
             self._log("INFO", f"Ensuring {iface} is up...")
-            subprocess.run(
-                ["sudo", "ip", "link", "set", iface, "up"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5,
-            )
+            self._run_ip("link", "set", iface, "up", sudo=True)
 
             # Use dhclient directly (more reliable for Bluetooth PAN)
-            return self._setup_dhclient(iface)
+            return self._setup_dhclient(iface, mac)
 
         except subprocess.TimeoutExpired:
             self._log("ERROR", "Network setup timed out")
@@ -4517,6 +5743,7 @@ default-agent
 
         Uses PID-based targeting to avoid killing dhclient processes for other interfaces.
         Only kills processes where the interface appears as a separate argument.
+        Returns True if any process was killed.
         """
         try:
             # Get all dhclient PIDs
@@ -4530,7 +5757,7 @@ default-agent
 
             if result.returncode != 0 or not result.stdout.strip():
                 # No dhclient processes running
-                return
+                return False
 
             pids = result.stdout.strip().split()
             killed_any = False
@@ -4565,7 +5792,7 @@ default-agent
                             f"Killing dhclient PID {pid} for {iface} (cmdline: {cmdline})",
                         )
                         subprocess.run(
-                            ["sudo", "kill", pid],
+                            [*self._sudo, "kill", pid],
                             stdout=subprocess.DEVNULL,
                             stderr=subprocess.DEVNULL,
                             timeout=3,
@@ -4584,45 +5811,53 @@ default-agent
                 time.sleep(
                     self.OPERATION_SHORT_DELAY
                 )  # Brief wait for processes to exit
+            return killed_any
 
         except Exception as e:
             self._log("DEBUG", f"Error in _kill_dhclient_for_interface: {e}")
+            return False
 
-    def _setup_dhclient(self, iface):
-        """Request DHCP on interface"""
+    def _setup_dhclient(self, iface, mac):
+        """Request DHCP on iface (brought up by _setup_network_dhcp) for mac"""
         try:
             self._log("INFO", f"Setting up {iface} for DHCP...")
 
-            # Bring interface up
-            subprocess.run(
-                ["sudo", "ip", "link", "set", iface, "up"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5,
-            )
+            # Reconnect to the same phone within the lease lifetime with the
+            # address still on the interface: nothing to renew, skip the
+            # release/request round trip. A link-local (169.254.x) address is
+            # no lease, however recent the last one was.
+            lease_key = (mac.upper(), iface)
+            addr = self._get_interface_ip(iface)
+            if addr and addr.startswith("169.254."):
+                addr = None
+            if addr and time.time() < self._lease_expiry.get(lease_key, 0):
+                self._log("INFO", f"✓ {iface} still has leased IPv4 {addr}")
+                return True
 
-            # Check which DHCP client is available
-            has_dhcpcd = (
-                subprocess.run(["which", "dhcpcd"], capture_output=True).returncode == 0
-            )
-            has_dhclient = (
-                subprocess.run(["which", "dhclient"], capture_output=True).returncode
-                == 0
-            )
+            # Check which DHCP client is available (searched once per load -
+            # installed binaries don't come and go between reconnects)
+            if self._dhcp_clients is None:
+                self._dhcp_clients = (
+                    shutil.which("dhcpcd") is not None,
+                    shutil.which("dhclient") is not None,
+                )
+            has_dhcpcd, has_dhclient = self._dhcp_clients
 
             self._log("INFO", f"Requesting DHCP on {iface}...")
             dhcp_success = False
 
             if has_dhcpcd:
                 self._log("INFO", "Using dhcpcd...")
-                # Release any existing lease first
-                subprocess.run(
-                    ["sudo", "dhcpcd", "-k", iface],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=5,
-                )
-                time.sleep(self.DHCP_RELEASE_WAIT)
+                # Release any existing lease first. A freshly created bnep
+                # interface has no address, so there is nothing to release.
+                if addr:
+                    subprocess.run(
+                        [*self._sudo, "dhcpcd", "-k", iface],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=5,
+                    )
+                    time.sleep(self.DHCP_RELEASE_WAIT)
                 # dhcpcd ARP-probes the address for ~5-6s (duplicate-address
                 # detection). That's pointless on a point-to-point Bluetooth PAN
                 # link, so disable it via a minimal config - it's the single
@@ -4638,7 +5873,7 @@ default-agent
                         logging.debug(f"[bt-tether] dhcpcd cf write failed: {e}")
                 # Request new lease
                 result = subprocess.run(
-                    ["sudo", "dhcpcd", "-4"] + cf_args + ["-n", iface],
+                    [*self._sudo, "dhcpcd", "-4"] + cf_args + ["-n", iface],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
@@ -4652,7 +5887,7 @@ default-agent
                         "dhcpcd config rejected - retrying without noarp tuning",
                     )
                     result = subprocess.run(
-                        ["sudo", "dhcpcd", "-4", "-n", iface],
+                        [*self._sudo, "dhcpcd", "-4", "-n", iface],
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
                         text=True,
@@ -4667,9 +5902,10 @@ default-agent
 
             elif has_dhclient:
                 self._log("INFO", "Using dhclient...")
-                # Kill any existing dhclient for this interface (PID-based targeting)
-                self._kill_dhclient_for_interface(iface)
-                time.sleep(self.DHCP_KILL_WAIT)
+                # Kill any existing dhclient for this interface (PID-based
+                # targeting); only settle if one was actually running
+                if self._kill_dhclient_for_interface(iface):
+                    time.sleep(self.DHCP_KILL_WAIT)
 
                 # dhclient's default initial DISCOVER backoff is a random delay of
                 # up to ~10s, which dominates lease time on a fast PAN link. A tiny
@@ -4692,7 +5928,7 @@ default-agent
                 # abort promptly instead of blocking for the full 30s.
                 try:
                     proc = subprocess.Popen(
-                        ["sudo", "dhclient", "-4", "-v"] + cf_args + [iface],
+                        [*self._sudo, "dhclient", "-4", "-v"] + cf_args + [iface],
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
                         text=True,
@@ -4798,7 +6034,7 @@ default-agent
                                             f"Force killing dhclient PID {pid} for {iface} (cmdline: {cmdline})",
                                         )
                                         subprocess.run(
-                                            ["sudo", "kill", "-9", pid],
+                                            [*self._sudo, "kill", "-9", pid],
                                             stdout=subprocess.DEVNULL,
                                             stderr=subprocess.DEVNULL,
                                             timeout=3,
@@ -4823,51 +6059,48 @@ default-agent
                 )
                 return False
 
-            # Check for IP with extended wait time (tethering may take time to fully start)
+            # Check for IP with extended wait time (tethering may take time to
+            # fully start). The wait wakes on rtnetlink address events, so it
+            # returns as soon as the kernel commits the address.
             ip_addr = None
-            max_checks = 8  # Increased from 5 to give more time
-
-            for attempt in range(max_checks):
-                ip_result = subprocess.run(
-                    ["ip", "addr", "show", iface],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=5,
-                )
-
-                if ip_result.returncode == 0:
-                    ip_match = re.search(
-                        r"inet\s+(\d+\.\d+\.\d+\.\d+)", ip_result.stdout
-                    )
-                    if ip_match:
-                        ip_addr = ip_match.group(1)
+            ip_wait = 14
+            nl = self._open_rtnl_watch(self.RTNL_IFADDR_GROUPS)
+            try:
+                deadline = time.monotonic() + ip_wait
+                while True:
+                    # Read the address from the kernel (SIOCGIFADDR) rather than
+                    # spawning and parsing `ip addr show` on every check
+                    ip_addr = self._get_interface_ip(iface)
+                    if ip_addr:
                         if not ip_addr.startswith("169.254."):
                             self._log("INFO", f"✓ {iface} got IPv4: {ip_addr}")
                             break
-                        else:
-                            self._log(
-                                "DEBUG", f"Link-local IP {ip_addr}, waiting for DHCP..."
-                            )
-                            ip_addr = None
+                        self._log(
+                            "DEBUG", f"Link-local IP {ip_addr}, waiting for DHCP..."
+                        )
+                        ip_addr = None
                     # No usable IPv4 yet - accept a global IPv6 (IPv6-only PAN via
                     # SLAAC needs no DHCP lease) so we don't dead-wait for IPv4.
-                    if not ip_addr:
-                        v6 = self._get_global_ipv6(iface)
-                        if v6:
-                            ip_addr = v6
-                            self._log("INFO", f"✓ {iface} got IPv6: {v6}")
-                            break
-
-                if attempt < max_checks - 1:
-                    self._log("DEBUG", f"Waiting for IP... ({(attempt+1)*2}s)")
-                    time.sleep(2)
+                    v6 = self._get_global_ipv6(iface)
+                    if v6:
+                        ip_addr = v6
+                        self._log("INFO", f"✓ {iface} got IPv6: {v6}")
+                        break
+                    if time.monotonic() >= deadline:
+                        break
+                    self._wait_rtnl_event(nl, deadline, 2)
+            finally:
+                if nl is not None:
+                    nl.close()
 
             if ip_addr:
+                self._lease_expiry[lease_key] = self._read_lease_expiry(
+                    iface, has_dhcpcd
+                )
                 self._verify_localhost_route()
                 return True
             else:
-                self._log("ERROR", f"❌ No IP on {iface} after {max_checks * 2}s")
+                self._log("ERROR", f"❌ No IP on {iface} after {ip_wait}s")
                 self._log("ERROR", "📱 Enable Bluetooth tethering on your phone!")
                 self._log(
                     "ERROR",
@@ -4879,19 +6112,63 @@ default-agent
             logging.error(f"[bt-tether] Network setup error: {e}")
             return False
 
+    def _read_lease_expiry(self, iface, has_dhcpcd):
+        """Wall-clock expiry of the current DHCP lease on iface, 0 if unknown"""
+        try:
+            if has_dhcpcd:
+                # dhcpcd's lease file is binary; ask it for the lease variables
+                result = subprocess.run(
+                    [*self._sudo, "dhcpcd", "-4", "-U", iface],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                )
+                m = self.DHCPCD_LEASE_TIME_PATTERN.search(result.stdout)
+                return time.time() + int(m.group(1)) if m else 0
+            for path in self.DHCLIENT_LEASE_FILES:
+                try:
+                    with open(path.format(iface=iface)) as f:
+                        leases = f.read()
+                except OSError:
+                    continue
+                expiry = 0
+                # Later blocks are newer; keep the last one for this interface
+                for block in self.DHCLIENT_LEASE_PATTERN.finditer(leases):
+                    if f'interface "{iface}";' not in block.group(1):
+                        continue
+                    m = self.DHCLIENT_EXPIRE_PATTERN.search(block.group(1))
+                    if m and m.group(1):
+                        expiry = int(m.group(1))
+                    elif m:
+                        expiry = calendar.timegm(
+                            time.strptime(m.group(2), "%Y/%m/%d %H:%M:%S")
+                        )
+                if expiry:
+                    return expiry
+        except Exception as e:
+            logging.debug(f"[bt-tether] Lease expiry lookup failed for {iface}: {e}")
+        return 0
+
+    def _localhost_check_due(self):
+        """Return True if the startup localhost check has not passed within the TTL"""
+        try:
+            age = time.time() - os.path.getmtime(self.LOCALHOST_CHECK_STAMP)
+        except OSError:
+            return True  # No stamp yet (first load this boot)
+        return age > self.LOCALHOST_CHECK_TTL
+
     def _verify_localhost_route(self):
-        """Verify localhost routes correctly through loopback interface (critical for bettercap API)"""
+        """Verify localhost routes correctly through loopback interface (critical for bettercap API)
+
+        Returns True if the route was fine or a fix was applied, False otherwise.
+        """
         try:
             # Check localhost routing
-            result = subprocess.run(
-                ["ip", "route", "get", "127.0.0.1"],
-                capture_output=True,
-                text=True,
-                timeout=3,
+            route_output = self._run_ip(
+                "route", "get", "127.0.0.1", capture=True, timeout=3
             )
 
-            if result.returncode == 0:
-                route_output = result.stdout.strip()
+            if route_output is not None:
                 # Localhost should use 'lo' interface or 'local' keyword
                 if "lo" not in route_output and "local" not in route_output:
                     logging.warning(
@@ -4902,30 +6179,27 @@ default-agent
                     )
                     logging.info("[bt-tether] Attempting to fix localhost route...")
 
-                    # Ensure loopback interface is up
-                    subprocess.run(
-                        ["sudo", "ip", "link", "set", "lo", "up"],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        timeout=3,
-                    )
-
-                    # Add explicit localhost route if missing
-                    subprocess.run(
-                        ["sudo", "ip", "route", "add", "127.0.0.0/8", "dev", "lo"],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
+                    # Ensure loopback is up and add an explicit localhost route,
+                    # in one sudo+ip run (-force: keep going if the route exists)
+                    self._run_ip(
+                        "-force",
+                        "-batch",
+                        "-",
+                        sudo=True,
+                        input="link set lo up\nroute add 127.0.0.0/8 dev lo\n",
                         timeout=3,
                     )
 
                     logging.info("[bt-tether] ✓ Localhost route protection applied")
                 else:
-                    logging.debug(f"[bt-tether] Localhost route OK: {route_output}")
+                    logging.debug("[bt-tether] Localhost route OK: %s", route_output)
+                return True
             else:
                 logging.warning("[bt-tether] Could not verify localhost routing")
 
         except Exception as e:
             logging.error(f"[bt-tether] Localhost route verification failed: {e}")
+        return False
 
     def _check_internet_connectivity(self):
         """Check internet via the Bluetooth interface (IPv4 or IPv6).
@@ -4939,23 +6213,14 @@ default-agent
             # Get the BT interface
             bt_iface = self._get_pan_interface() or "bnep0"
 
-            # Verify the interface has any usable address (IPv4 or global IPv6)
-            ip_result = subprocess.run(
-                ["ip", "addr", "show", bt_iface],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5,
-            )
-
-            if ip_result.returncode != 0:
+            # Verify the interface has any usable address (IPv4 or global IPv6).
+            # Existence is a sysfs stat and the address an ioctl - no `ip` spawn.
+            if not os.path.isdir(f"/sys/class/net/{bt_iface}"):
                 logging.warning(f"[bt-tether] {bt_iface} interface not found")
                 return False
 
-            ipv4_match = re.search(r"inet\s+(\d+\.\d+\.\d+\.\d+)", ip_result.stdout)
-            has_ipv4 = bool(ipv4_match) and not ipv4_match.group(1).startswith(
-                "169.254."
-            )
+            ipv4 = self._get_interface_ip(bt_iface)
+            has_ipv4 = bool(ipv4) and not ipv4.startswith("169.254.")
             ipv6 = self._get_global_ipv6(bt_iface)
 
             if not has_ipv4 and not ipv6:
@@ -4964,28 +6229,17 @@ default-agent
                 )
                 return False
             if has_ipv4:
-                logging.info(f"[bt-tether] {bt_iface} has IPv4: {ipv4_match.group(1)}")
+                logging.info(f"[bt-tether] {bt_iface} has IPv4: {ipv4}")
             if ipv6:
                 logging.info(f"[bt-tether] {bt_iface} has IPv6: {ipv6}")
 
-            # Log current routing table for diagnostics
-            route_check = subprocess.run(
-                ["ip", "route", "show"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5,
-            )
-            if route_check.returncode == 0:
-                logging.info(f"[bt-tether] Current routes:\n{route_check.stdout}")
-
             # Try IPv4 connectivity first (when an IPv4 address is present)
             if has_ipv4:
                 logging.info(
                     f"[bt-tether] Testing IPv4 connectivity to 8.8.8.8 via {bt_iface}..."
                 )
                 result = subprocess.run(
-                    ["ping", "-c", "2", "-W", "3", "-I", bt_iface, "8.8.8.8"],
+                    ["ping", *self.PING_PROBE_ARGS, "-I", bt_iface, "8.8.8.8"],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
@@ -4996,34 +6250,24 @@ default-agent
                     return True
 
                 logging.warning(f"[bt-tether] IPv4 ping to 8.8.8.8 failed")
-                logging.debug(f"[bt-tether] Ping stderr: {result.stderr}")
+                logging.debug("[bt-tether] Ping stderr: %s", result.stderr)
                 # Gateway diagnostic to distinguish link vs internet issues
-                gateway_check = subprocess.run(
-                    ["ip", "route", "show", "default"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=5,
-                )
-                if gateway_check.returncode == 0 and gateway_check.stdout:
-                    match = re.search(r"default via ([\d.]+)", gateway_check.stdout)
-                    if match:
-                        gateway = match.group(1)
-                        gw_result = subprocess.run(
-                            ["ping", "-c", "2", "-W", "3", gateway],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                            timeout=10,
+                gateway = next((gw for _, gw, _ in self._default_routes() if gw), None)
+                if gateway:
+                    gw_result = subprocess.run(
+                        ["ping", *self.PING_PROBE_ARGS, gateway],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=10,
+                    )
+                    if gw_result.returncode == 0:
+                        logging.warning(
+                            f"[bt-tether] Gateway ping works, but internet ping failed - possible NAT/firewall issue"
+                        )
+                    else:
+                        logging.warning(
+                            f"[bt-tether] Gateway ping also failed - phone may not be providing internet"
                         )
-                        if gw_result.returncode == 0:
-                            logging.warning(
-                                f"[bt-tether] Gateway ping works, but internet ping failed - possible NAT/firewall issue"
-                            )
-                        else:
-                            logging.warning(
-                                f"[bt-tether] Gateway ping also failed - phone may not be providing internet"
-                            )
 
             # Fall back to IPv6 if IPv4 was absent or its ping failed
             if ipv6:
@@ -5034,7 +6278,7 @@ default-agent
                 # working IPv6 DNS, mirroring the IPv4 use of a literal.
                 v6_result = subprocess.run(
                     [
-                        "ping", "-6", "-c", "2", "-W", "3",
+                        "ping", "-6", *self.PING_PROBE_ARGS,
                         "-I", bt_iface, "2001:4860:4860::8888",
                     ],
                     stdout=subprocess.PIPE,
@@ -5046,8 +6290,13 @@ default-agent
                     logging.info(f"[bt-tether] ✓ IPv6 connectivity verified")
                     return True
                 logging.warning(f"[bt-tether] IPv6 ping failed")
-                logging.debug(f"[bt-tether] IPv6 ping stderr: {v6_result.stderr}")
+                logging.debug("[bt-tether] IPv6 ping stderr: %s", v6_result.stderr)
 
+            # Nothing got through - log the routing table for diagnostics (on
+            # success it would just be noise and an extra `ip` spawn)
+            routes = self._run_ip("route", "show", capture=True)
+            if routes is not None:
+                logging.info(f"[bt-tether] Current routes:\n{routes}")
             return False
         except subprocess.TimeoutExpired:
             logging.warning(f"[bt-tether] Ping timeout - no internet connectivity")
@@ -5056,73 +6305,89 @@ default-agent
             logging.error(f"[bt-tether] Internet check error: {e}")
             return False
 
-    def _pan_active(self):
-        """Check if any PAN interface (bnep/bt-pan) is active - optimized for RPi Zero W2"""
-        try:
-            # More efficient: use ip link show instead of full ip a output
-            result = subprocess.run(
-                ["ip", "link", "show"],
-                capture_output=True,
-                text=True,
-                timeout=3,  # Reduced timeout for efficiency
-            )
-
-            # Check for both bnep and bt-pan interfaces
-            has_bnep = "bnep" in result.stdout
-            has_bt_pan = "bt-pan" in result.stdout
-
-            if has_bnep or has_bt_pan:
-                logging.debug(
-                    f"[bt-tether] Found PAN interface (bnep={has_bnep}, bt-pan={has_bt_pan})"
-                )
-                return True
+    def _default_routes(self):
+        """IPv4 default routes as [(iface, gateway, metric)], lowest metric first.
 
-            logging.debug("[bt-tether] No PAN interface found (bnep/bt-pan)")
-            return False
-        except Exception as e:
-            logging.error(f"[bt-tether] Failed to check PAN: {e}")
-            return False
+        Read from /proc/net/route - the table `ip route show default` prints -
+        so no `ip` process is spawned. gateway is None for on-link routes.
+        """
+        routes = []
+        with open("/proc/net/route") as f:
+            next(f, None)  # Header
+            for line in f:
+                # Iface Destination Gateway Flags RefCnt Use Metric Mask ...
+                fields = line.split()
+                if len(fields) < 8 or int(fields[1], 16) or int(fields[7], 16):
+                    continue  # Not 0.0.0.0/0
+                if not int(fields[3], 16) & 0x1:  # RTF_UP
+                    continue
+                # Host byte order, as the kernel prints it
+                gateway = socket.inet_ntoa(struct.pack("=I", int(fields[2], 16)))
+                if gateway == "0.0.0.0":
+                    gateway = None
+                routes.append((fields[0], gateway, int(fields[6])))
+        routes.sort(key=lambda r: r[2])
+        return routes
 
     def _get_default_route_interface(self):
         """Get the network interface that has the default route (lowest metric)"""
         try:
-            result = subprocess.check_output(
-                ["ip", "route", "show", "default"], text=True, timeout=5
-            )
-
-            if not result:
-                return None
-
-            # Parse default route lines to find the one with lowest metric
-            # Format: "default via 192.168.1.1 dev eth0 metric 100"
-
-            routes = []
-            for line in result.strip().split("\n"):
-                if "default" in line:
-                    # Extract interface name
-                    dev_match = re.search(r"dev\s+(\S+)", line)
-                    if dev_match:
-                        iface = dev_match.group(1)
-
-                        # Extract metric (default to 0 if not specified)
-                        metric_match = re.search(r"metric\s+(\d+)", line)
-                        metric = int(metric_match.group(1)) if metric_match else 0
+            routes = self._default_routes()
+            return routes[0][0] if routes else None
+        except Exception as e:
+            logging.debug(f"[bt-tether] Failed to get default route: {e}")
+            return None
 
-                        routes.append((iface, metric))
+    def _internet_test_loop(self):
+        """Keep the /test-internet result fresh while a PAN interface is up.
 
-            if not routes:
-                return None
+        Only while the result is being looked at - see INTERNET_TEST_IDLE.
+        """
+        while not self._internet_test_stop.wait(self.INTERNET_TEST_INTERVAL):
+            idle = time.time() - self._internet_test_requested_at
+            if idle > self.INTERNET_TEST_IDLE or not self._get_pan_interface():
+                continue
+            try:
+                self._refresh_internet_test()
+            except Exception as e:
+                logging.debug(f"[bt-tether] Background internet test error: {e}")
 
-            # Sort by metric (lowest first) and return the interface
-            routes.sort(key=lambda x: x[1])
-            return routes[0][0]
+    def _refresh_internet_test(self, requested_at=None):
+        """Run the connectivity test and cache the result.
 
-        except Exception as e:
-            logging.debug(f"[bt-tether] Failed to get default route: {e}")
-            return None
+        Runs are serialized; a caller that waited on a run that started after its
+        own request (requested_at) gets that result instead of a second run.
+        """
+        with self._internet_test_lock:
+            if requested_at and self._internet_test_cache[1] >= requested_at:
+                return self._internet_test_cache
+            started = time.time()
+            self._internet_test_cache = (self._test_internet_connectivity(), started)
+            return self._internet_test_cache
+
+    def _get_internet_test(self, force=False):
+        """Return (result, checked_at), running the test only if the cache is stale.
+
+        A cached result is only served while a PAN interface is up - after the
+        link drops it would still claim the old connectivity.
+        """
+        self._internet_test_requested_at = time.time()
+        cached, checked_at = self._internet_test_cache
+        if (
+            not force
+            and cached is not None
+            and time.time() - checked_at < self.INTERNET_TEST_INTERVAL * 2
+            and self._get_pan_interface()
+        ):
+            return cached, checked_at
+        return self._refresh_internet_test(requested_at=time.time())
 
     def _test_internet_connectivity(self):
-        """Test internet connectivity and return detailed results"""
+        """Test internet connectivity and return detailed results.
+
+        The probes are independent and mostly wait on the network, so they run
+        concurrently - the test takes as long as the slowest probe, not the sum.
+        """
         try:
             result = {
                 "ping_success": False,
@@ -5136,122 +6401,132 @@ default-agent
                 "localhost_routes": None,
             }
 
-            # Test ping to 8.8.8.8 (IPv4), then fall back to IPv6 if that fails
-            try:
-                ping_result = subprocess.run(
-                    ["ping", "-c", "2", "-W", "3", "8.8.8.8"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=5,
-                )
-                result["ping_success"] = ping_result.returncode == 0
-                if not result["ping_success"]:
-                    v6_ping = subprocess.run(
-                        ["ping", "-6", "-c", "2", "-W", "3", "2001:4860:4860::8888"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
+            def probe_ping():
+                # Test ping to 8.8.8.8 (IPv4), then fall back to IPv6 if that fails
+                try:
+                    ping_result = subprocess.run(
+                        ["ping", *self.PING_PROBE_ARGS, "8.8.8.8"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                         timeout=5,
                     )
-                    if v6_ping.returncode == 0:
-                        result["ping_success"] = True
-                logging.info(
-                    f"[bt-tether] Ping test: {'Success' if result['ping_success'] else 'Failed'}"
-                )
-            except Exception as e:
-                logging.warning(f"[bt-tether] Ping test error: {e}")
+                    success = ping_result.returncode == 0
+                    if not success:
+                        v6_ping = subprocess.run(
+                            [
+                                "ping",
+                                "-6",
+                                *self.PING_PROBE_ARGS,
+                                "2001:4860:4860::8888",
+                            ],
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            timeout=5,
+                        )
+                        success = v6_ping.returncode == 0
+                    logging.info(
+                        f"[bt-tether] Ping test: {'Success' if success else 'Failed'}"
+                    )
+                    return {"ping_success": success}
+                except Exception as e:
+                    logging.warning(f"[bt-tether] Ping test error: {e}")
+                    return {}
 
-            # Test DNS resolution
-            try:
-                import socket
-
-                # Try to resolve google.com using Python's socket library
-                socket.gethostbyname("google.com")
-                result["dns_success"] = True
-                logging.info("[bt-tether] DNS test: Success")
-            except socket.gaierror as e:
-                result["dns_success"] = False
-                result["dns_error"] = f"DNS resolution failed: {str(e)}"
-                logging.warning(f"[bt-tether] DNS test failed: {e}")
-            except Exception as e:
-                result["dns_success"] = False
-                result["dns_error"] = str(e)
-                logging.warning(f"[bt-tether] DNS test error: {e}")
+            def probe_dns():
+                # Test DNS resolution using Python's socket library
+                try:
+                    socket.gethostbyname("google.com")
+                    logging.info("[bt-tether] DNS test: Success")
+                    return {"dns_success": True}
+                except socket.gaierror as e:
+                    logging.warning(f"[bt-tether] DNS test failed: {e}")
+                    return {
+                        "dns_success": False,
+                        "dns_error": f"DNS resolution failed: {str(e)}",
+                    }
+                except Exception as e:
+                    logging.warning(f"[bt-tether] DNS test error: {e}")
+                    return {"dns_success": False, "dns_error": str(e)}
 
-            # Get DNS servers from resolv.conf
-            try:
-                with open("/etc/resolv.conf", "r") as f:
-                    resolv_content = f.read()
-                    dns_servers = []
-                    for line in resolv_content.split("\n"):
-                        if line.strip().startswith("nameserver"):
-                            dns_servers.append(line.strip().split()[1])
-                    result["dns_servers"] = (
-                        ", ".join(dns_servers) if dns_servers else "None"
-                    )
-                logging.info(f"[bt-tether] DNS servers: {result['dns_servers']}")
-            except Exception as e:
-                result["dns_servers"] = f"Error: {str(e)[:50]}"
-                logging.warning(f"[bt-tether] Get DNS servers error: {e}")
+            def probe_dns_servers():
+                # Get DNS servers from resolv.conf
+                try:
+                    dns_servers = self._get_nameservers()
+                    servers = ", ".join(dns_servers) if dns_servers else "None"
+                    logging.info(f"[bt-tether] DNS servers: {servers}")
+                    return {"dns_servers": servers}
+                except Exception as e:
+                    logging.warning(f"[bt-tether] Get DNS servers error: {e}")
+                    return {"dns_servers": f"Error: {str(e)[:50]}"}
 
-            # Get the active PAN interface IP (bnep0 / bnep1 / bt-pan / ...)
-            try:
-                pan_iface = self._get_pan_interface() or "bnep0"
-                result["pan_interface"] = pan_iface
-                pan_ip = self._get_interface_ip(pan_iface)
-                result["bnep0_ip"] = pan_ip  # key kept for backward compat
-                result["ipv6"] = self._get_global_ipv6(pan_iface)
-                logging.info(
-                    f"[bt-tether] PAN IP ({pan_iface}): v4={pan_ip} v6={result['ipv6']}"
-                )
-            except Exception as e:
-                logging.warning(f"[bt-tether] Get PAN IP error: {e}")
+            def probe_pan_address():
+                # Get the active PAN interface IP (bnep0 / bnep1 / bt-pan / ...)
+                try:
+                    pan_iface = self._get_pan_interface() or "bnep0"
+                    pan_ip = self._get_interface_ip(pan_iface)
+                    ipv6 = self._get_global_ipv6(pan_iface)
+                    logging.info(
+                        f"[bt-tether] PAN IP ({pan_iface}): v4={pan_ip} v6={ipv6}"
+                    )
+                    return {
+                        "pan_interface": pan_iface,
+                        "bnep0_ip": pan_ip,  # key kept for backward compat
+                        "ipv6": ipv6,
+                    }
+                except Exception as e:
+                    logging.warning(f"[bt-tether] Get PAN IP error: {e}")
+                    return {}
 
-            # Get default route
-            try:
-                route_result = subprocess.run(
-                    ["ip", "route", "show", "default"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=5,
-                )
-                if route_result.returncode == 0 and route_result.stdout:
-                    result["default_route"] = route_result.stdout.strip()
-                logging.info(f"[bt-tether] Default route: {result['default_route']}")
-            except Exception as e:
-                logging.warning(f"[bt-tether] Get default route error: {e}")
+            def probe_default_route():
+                try:
+                    # Same table `ip route show default` prints, from procfs
+                    lines = []
+                    for iface, gw, metric in self._default_routes():
+                        via = f" via {gw}" if gw else ""
+                        lines.append(f"default{via} dev {iface} metric {metric}")
+                    route = "\n".join(lines) or None
+                    logging.info(f"[bt-tether] Default route: {route}")
+                    return {"default_route": route}
+                except Exception as e:
+                    logging.warning(f"[bt-tether] Get default route error: {e}")
+                    return {}
 
-            # Get localhost route - CRITICAL for bettercap API access
-            try:
-                localhost_result = subprocess.run(
-                    ["ip", "route", "get", "127.0.0.1"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=5,
-                )
-                if localhost_result.returncode == 0 and localhost_result.stdout:
-                    result["localhost_routes"] = localhost_result.stdout.strip()
+            def probe_localhost_route():
+                # Get localhost route - CRITICAL for bettercap API access
+                try:
+                    routes = self._run_ip("route", "get", "127.0.0.1", capture=True)
+                    if not routes:
+                        return {"localhost_routes": "Error getting localhost route"}
                     # Localhost should use 'lo' interface
-                    if (
-                        "lo" not in result["localhost_routes"]
-                        and "local" not in result["localhost_routes"]
-                    ):
+                    if "lo" not in routes and "local" not in routes:
                         logging.warning(
                             f"[bt-tether] ⚠️  WARNING: Localhost not routing through 'lo' interface!"
                         )
                         logging.warning(
-                            f"[bt-tether] ⚠️  This may prevent bettercap API from working: {result['localhost_routes']}"
+                            f"[bt-tether] ⚠️  This may prevent bettercap API from working: {routes}"
                         )
                     else:
-                        logging.info(
-                            f"[bt-tether] Localhost route: {result['localhost_routes']}"
-                        )
-                else:
-                    result["localhost_routes"] = "Error getting localhost route"
-            except Exception as e:
-                result["localhost_routes"] = f"Error: {str(e)}"
-                logging.warning(f"[bt-tether] Get localhost route error: {e}")
+                        logging.info(f"[bt-tether] Localhost route: {routes}")
+                    return {"localhost_routes": routes}
+                except Exception as e:
+                    logging.warning(f"[bt-tether] Get localhost route error: {e}")
+                    return {"localhost_routes": f"Error: {str(e)}"}
+
+            probes = (
+                probe_ping,
+                probe_dns,
+                probe_dns_servers,
+                probe_pan_address,
+                probe_default_route,
+                probe_localhost_route,
+            )
+            # Own short-lived pool: the shared web pool must stay free for status
+            # polls while a multi-second ping is running.
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(probes), thread_name_prefix="bt-tether-nettest"
+            ) as pool:
+                for partial in pool.map(lambda probe: probe(), probes):
+                    result.update(partial)
 
             return result
 
@@ -5269,32 +6544,45 @@ default-agent
     def _get_pan_interface(self):
         """Get the name of the Bluetooth PAN interface if it exists"""
         try:
-            out = subprocess.check_output(["ip", "link"], text=True, timeout=5)
-            # Look for bnep or bt-pan interface names
-            for line in out.split("\n"):
-                if "bnep" in line or "bt-pan" in line:
-                    # Extract interface name (e.g., "2: bnep0:" -> "bnep0")
-                    parts = line.split(":")
-                    if len(parts) >= 2:
-                        iface = parts[1].strip()
-                        return iface
+            # sysfs lists every interface - no need to spawn `ip link`
+            for iface in sorted(os.listdir("/sys/class/net")):
+                if iface.startswith(("bnep", "bt-pan")):
+                    return iface
             return None
         except Exception as e:
             logging.error(f"[bt-tether] Failed to get PAN interface: {e}")
             return None
 
+    def _get_nameservers(self):
+        """Nameserver addresses from /etc/resolv.conf, re-read only when it changes.
+
+        The background internet test asks every INTERNET_TEST_INTERVAL while the
+        file rarely changes, so usually a stat replaces the read. Raises OSError
+        if the file is missing or unreadable.
+        """
+        st = os.stat("/etc/resolv.conf")
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._resolv_cache
+        if cached and cached[0] == key:
+            return cached[1]
+        with open("/etc/resolv.conf") as f:
+            nameservers = self.NAMESERVER_PATTERN.findall(f.read())
+        self._resolv_cache = (key, nameservers)
+        return nameservers
+
     def _get_interface_ip(self, iface):
         """Get the IPv4 address of a network interface (None if none)."""
         try:
-
-            result = subprocess.check_output(
-                ["ip", "-4", "addr", "show", iface], text=True, timeout=5
-            )
-            # Look for inet address (e.g., "inet 192.168.44.123/24")
-            match = re.search(r"inet\s+(\d+\.\d+\.\d+\.\d+)", result)
-            if match:
-                return match.group(1)
-            return None
+            # SIOCGIFADDR reads the address straight from the kernel
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                ifreq = fcntl.ioctl(
+                    sock.fileno(),
+                    self.SIOCGIFADDR,
+                    struct.pack("256s", iface[:15].encode()),
+                )
+            return socket.inet_ntoa(ifreq[20:24])
+        except OSError:
+            return None  # No IPv4 address (or no such interface)
         except Exception as e:
             logging.debug(f"[bt-tether] Failed to get IP for {iface}: {e}")
             return None
@@ -5310,21 +6598,77 @@ default-agent
         try:
             if iface is None:
                 iface = self._get_pan_interface() or "bnep0"
-            result = subprocess.check_output(
-                ["ip", "-6", "addr", "show", iface, "scope", "global"],
-                text=True,
-                timeout=5,
-            )
-            for line in result.splitlines():
-                line = line.strip()
-                if line.startswith("inet6"):
-                    # "inet6 2a00:20:b2d5:bdeb::1/64" -> "2a00:20:b2d5:bdeb::1"
-                    return line.split()[1].split("/")[0]
+            # /proc/net/if_inet6: "<addr hex> <ifindex> <prefix> <scope> <flags> <name>"
+            with open("/proc/net/if_inet6") as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) >= 6 and fields[5] == iface and fields[3] == "00":
+                        return socket.inet_ntop(
+                            socket.AF_INET6, bytes.fromhex(fields[0])
+                        )
             return None
         except Exception as e:
             logging.debug(f"[bt-tether] Failed to get IPv6 for {iface}: {e}")
             return None
 
+    def _watch_for_device_btctl(self, mac, timeout):
+        """Scan in an interactive bluetoothctl until mac shows up as [NEW].
+
+        Returns True as soon as the device is seen, False after timeout.
+        """
+        device_visible = False
+        scan_start = time.time()
+        scan_process = None
+        try:
+            scan_process = subprocess.Popen(
+                ["bluetoothctl"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                env=self._btctl_env,
+            )
+            scan_process.stdin.write("scan on\n")
+            scan_process.stdin.flush()
+
+            target_mac = mac.upper()
+            while time.time() - scan_start < timeout:
+                try:
+                    ready = select.select([scan_process.stdout], [], [], 0.5)
+                    if ready[0]:
+                        line = scan_process.stdout.readline()
+                        if not line:
+                            break
+                        clean_line = self.SCAN_ANSI_PATTERN.sub("", line.strip())
+                        if "[NEW]" in clean_line and "Device" in clean_line:
+                            m = self.SCAN_MAC_PATTERN.search(clean_line)
+                            if m and m.group(1).upper() == target_mac:
+                                device_visible = True
+                                elapsed = time.time() - scan_start
+                                logging.info(
+                                    f"[bt-tether] Device {mac} reappeared after {elapsed:.1f}s"
+                                )
+                                break
+                except Exception:
+                    pass
+        finally:
+            # Stop scan and close bluetoothctl
+            if scan_process:
+                try:
+                    # Same session that started discovery - no extra spawn,
+                    # and no settle delay (see _scan_via_bluetoothctl)
+                    scan_process.stdin.write("scan off\nquit\n")
+                    scan_process.stdin.flush()
+                    scan_process.wait(timeout=self.SUBPROCESS_TIMEOUT_MEDIUM)
+                except Exception:
+                    try:
+                        scan_process.kill()
+                        scan_process.wait(timeout=self.SUBPROCESS_TIMEOUT_SHORT)
+                    except Exception:
+                        pass
+        return device_visible
+
     def _pair_device_interactive(self, mac, needs_discovery=True):
         """Pair device - persistent agent will handle the dialog.
 
@@ -5340,12 +6684,16 @@ default-agent
             with self.lock:
                 self.message = "Scanning for phone..."
 
-            # First ensure Bluetooth is powered on and in pairable mode
-            self._run_cmd(["bluetoothctl", "power", "on"], capture=True)
-            time.sleep(self.DEVICE_OPERATION_DELAY)
-            self._run_cmd(["bluetoothctl", "pairable", "on"], capture=True)
-            self._run_cmd(["bluetoothctl", "discoverable", "on"], capture=True)
-            time.sleep(self.DEVICE_OPERATION_DELAY)
+            # First ensure Bluetooth is powered on and in pairable mode: three
+            # D-Bus property writes, or bluetoothctl plus settle delays without it
+            if not self._dbus_set_adapter_properties(
+                Powered=True, Pairable=True, Discoverable=True
+            ):
+                self._send_btctl("power on")
+                time.sleep(self.DEVICE_OPERATION_DELAY)
+                self._send_btctl("pairable on")
+                self._send_btctl("discoverable on")
+                time.sleep(self.DEVICE_OPERATION_DELAY)
 
             # Quick health check - ensure bluetoothctl is responsive before pairing
             if not self._check_bluetooth_responsive():
@@ -5362,10 +6710,10 @@ default-agent
                 )
                 device_visible = True
             else:
-                # BlueZ cache was wiped (after 'remove') — open an interactive bluetoothctl
-                # session and watch for the "[NEW] Device <mac>" event in real time.
-                # This reacts within milliseconds of the device reappearing instead of
-                # polling every second.
+                # BlueZ cache was wiped (after 'remove') — start discovery and react
+                # the moment the device reappears: through the BlueZ signal watch
+                # when it runs, else by watching an interactive bluetoothctl session
+                # for the "[NEW] Device <mac>" event, instead of polling every second.
                 discovery_timeout = self.PAIRING_SCAN_WAIT_TIMEOUT
                 logging.info(
                     f"[bt-tether] Waiting for {mac} to reappear after remove (up to {discovery_timeout}s)..."
@@ -5373,65 +6721,23 @@ default-agent
 
                 device_visible = False
                 scan_start = time.time()
-                scan_process = None
-                try:
-                    env = dict(os.environ, TERM="dumb", NO_COLOR="1")
-                    scan_process = subprocess.Popen(
-                        ["bluetoothctl"],
-                        stdin=subprocess.PIPE,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        bufsize=1,
-                        env=env,
-                    )
-                    scan_process.stdin.write("scan on\n")
-                    scan_process.stdin.flush()
-
-                    target_mac = mac.upper()
-                    while time.time() - scan_start < discovery_timeout:
-                        try:
-                            import select
-
-                            ready = select.select([scan_process.stdout], [], [], 0.5)
-                            if ready[0]:
-                                line = scan_process.stdout.readline()
-                                if not line:
-                                    break
-                                clean_line = self.SCAN_ANSI_PATTERN.sub(
-                                    "", line.strip()
-                                )
-                                if "[NEW]" in clean_line and "Device" in clean_line:
-                                    m = self.SCAN_MAC_PATTERN.search(clean_line)
-                                    if m and m.group(1).upper() == target_mac:
-                                        device_visible = True
-                                        elapsed = time.time() - scan_start
-                                        logging.info(
-                                            f"[bt-tether] Device {mac} reappeared after {elapsed:.1f}s"
-                                        )
-                                        break
-                        except Exception:
-                            pass
-                finally:
-                    # Stop scan and close bluetoothctl
+                if self._dbus_set_discovery(True):
+                    # Signal watch running: BlueZ reports the device itself
                     try:
-                        self._run_cmd(
-                            ["bluetoothctl", "scan", "off"], capture=True, timeout=3
+                        device_visible = self._wait_for_device(
+                            mac, lambda d: True, discovery_timeout
                         )
-                        time.sleep(self.SCAN_STOP_DELAY)
-                    except Exception:
-                        pass
-                    if scan_process:
-                        try:
-                            scan_process.stdin.write("quit\n")
-                            scan_process.stdin.flush()
-                            scan_process.wait(timeout=self.SUBPROCESS_TIMEOUT_MEDIUM)
-                        except Exception:
-                            try:
-                                scan_process.kill()
-                                scan_process.wait(timeout=self.SUBPROCESS_TIMEOUT_SHORT)
-                            except Exception:
-                                pass
+                    finally:
+                        self._dbus_set_discovery(False)
+                    if device_visible:
+                        elapsed = time.time() - scan_start
+                        logging.info(
+                            f"[bt-tether] Device {mac} reappeared after {elapsed:.1f}s"
+                        )
+                else:
+                    device_visible = self._watch_for_device_btctl(
+                        mac, discovery_timeout
+                    )
 
                 if not device_visible:
                     elapsed = time.time() - scan_start
@@ -5459,17 +6765,13 @@ default-agent
 
             try:
                 # Use subprocess.Popen to capture output in real-time
-                env = dict(os.environ)
-                env["NO_COLOR"] = "1"
-                env["TERM"] = "dumb"
-
                 # Start pairing process
                 process = subprocess.Popen(
                     ["bluetoothctl", "pair", mac],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     text=True,
-                    env=env,
+                    env=self._btctl_env,
                     bufsize=1,  # Line buffered
                 )
 
@@ -5485,13 +6787,12 @@ default-agent
                             break
 
                         output_lines.append(line)
-                        clean_line = self._strip_ansi_codes(line.strip())
 
-                        # Look for passkey in real-time
-                        if not passkey_found_in_output:
-                            passkey_match = re.search(
-                                r"passkey\s+(\d{6})", clean_line, re.IGNORECASE
-                            )
+                        # Look for passkey in real-time. Every pattern below needs
+                        # "passkey" in the line, so other lines skip the clean-up.
+                        if not passkey_found_in_output and "passkey" in line.lower():
+                            clean_line = self._strip_ansi_codes(line.strip())
+                            passkey_match = self.PASSKEY_PATTERN.search(clean_line)
                             if passkey_match:
                                 self.current_passkey = passkey_match.group(1)
                                 passkey_found_in_output = True
@@ -5513,7 +6814,9 @@ default-agent
                                 or "DisplayPasskey" in clean_line
                             ):
                                 # Try alternative patterns
-                                display_match = re.search(r"(\d{6})", clean_line)
+                                display_match = self.PASSKEY_DIGITS_PATTERN.search(
+                                    clean_line
+                                )
                                 if display_match:
                                     self.current_passkey = display_match.group(1)
                                     passkey_found_in_output = True
@@ -5546,10 +6849,13 @@ default-agent
                         self.current_passkey = None
                         return True
                     elif returncode == 0:
-                        # Command succeeded but output unclear - check status
-                        time.sleep(self.DEVICE_OPERATION_LONGER_DELAY)
-                        pair_status = self._check_pair_status(mac)
-                        if pair_status["paired"]:
+                        # Command succeeded but output unclear - give BlueZ a
+                        # moment to report the bond
+                        if self._wait_for_device(
+                            mac,
+                            lambda d: d["paired"],
+                            self.DEVICE_OPERATION_LONGER_DELAY,
+                        ):
                             logging.info(f"[bt-tether] ✓ Pairing successful!")
                             # Clear passkey after successful pairing
                             self.current_passkey = None
@@ -5581,6 +6887,8 @@ default-agent
                     return False
 
                 finally:
+                    # Pairing is over either way - stop the agent log monitor
+                    passkey_found.set()
                     # Ensure process stdout is closed to prevent resource leak
                     try:
                         if process.stdout:
@@ -5609,6 +6917,17 @@ default-agent
             logging.error(f"[bt-tether] Pairing error: {e}")
             return False
 
+    def _log_dns_resolution(self):
+        """Log whether DNS resolves over the new link (informational only)"""
+        self._log("INFO", "Testing DNS resolution...")
+        try:
+            socket.gethostbyname("google.com")
+            self._log("INFO", "✓ DNS resolution working")
+        except socket.gaierror:
+            self._log("WARNING", "DNS resolution failed - check /etc/resolv.conf")
+        except Exception as e:
+            self._log("WARNING", f"DNS test error: {e}")
+
     def _get_current_ip(self):
         """Get the current IP address from the Bluetooth PAN interface only"""
         try:
@@ -5662,17 +6981,14 @@ default-agent
         """
         try:
             con = self._run_cmd(
-                ["sudo", "hcitool", "con"],
+                [*self._sudo, "hcitool", "con"],
                 capture=True,
                 timeout=self.SUBPROCESS_TIMEOUT_NORMAL,
             )
             if con and con != "Timeout" and mac.upper() in con.upper():
                 self._log("INFO", f"Clearing stale link to {mac} before connecting")
-                self._run_cmd(
-                    ["bluetoothctl", "disconnect", mac],
-                    capture=True,
-                    timeout=self.SUBPROCESS_TIMEOUT_STANDARD,
-                )
+                if self._dbus_disconnect_device(mac) is None:
+                    self._send_btctl(f"disconnect {mac}")
                 time.sleep(self.DEVICE_OPERATION_DELAY)
         except Exception as e:
             logging.debug(f"[bt-tether] Stale ACL check failed: {e}")
@@ -5745,7 +7061,7 @@ default-agent
         except Exception as e:
             logging.debug(f"[bt-tether] reboot stamp write failed: {e}")
         try:
-            subprocess.run(["sudo", "reboot"], timeout=10)
+            subprocess.run([*self._sudo, "reboot"], timeout=10)
         except Exception as e:
             self._log("ERROR", f"Auto-reboot failed: {e}")
 
@@ -5767,28 +7083,17 @@ default-agent
 
             logging.info("[bt-tether] Connecting to system bus...")
             bus = dbus.SystemBus()
-            manager = dbus.Interface(
-                bus.get_object("org.bluez", "/"), "org.freedesktop.DBus.ObjectManager"
-            )
             logging.info("[bt-tether] System bus connected")
 
             # Find the device object path
             logging.info("[bt-tether] Searching for device in BlueZ...")
-            objects = manager.GetManagedObjects()
-            device_path = None
-            for path, interfaces in objects.items():
-                if "org.bluez.Device1" in interfaces:
-                    props = interfaces["org.bluez.Device1"]
-                    if props.get("Address") == mac:
-                        device_path = path
-                        logging.info(f"[bt-tether] Found device at path: {device_path}")
-                        break
-
+            device_path = self._dbus_device_path(mac)
             if not device_path:
                 logging.error(
                     f"[bt-tether] Device {mac} not found in BlueZ managed objects"
                 )
                 return False
+            logging.info(f"[bt-tether] Found device at path: {device_path}")
 
             # Connect to NAP service UUID
             logging.info(
@@ -5901,7 +7206,7 @@ default-agent
                     )
                     # Remove the pairing to prevent repeated failed connection attempts
                     try:
-                        self._run_cmd(["bluetoothctl", "remove", mac], timeout=5)
+                        self._send_btctl(f"remove {mac}", timeout=5)
                         self._log(
                             "INFO",
                             "Removed stale pairing - use web UI to re-pair if needed",